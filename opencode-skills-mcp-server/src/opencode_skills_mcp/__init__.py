@@ -4,20 +4,30 @@ from .models import (
     ListSkillsInput,
     GetSkillInfoInput,
     InstallSkillInput,
+    UpgradeSkillsInput,
     UninstallSkillInput,
     SearchSkillsInput,
     ValidateSkillInput,
+    ValidateAllInput,
     GetCombinationsInput,
+    RecommendWorkflowsInput,
     InstallWorkflowInput,
+    RefreshCatalogInput,
+    GetServerStatsInput,
 )
 
 __all__ = [
     "ListSkillsInput",
     "GetSkillInfoInput",
     "InstallSkillInput",
+    "UpgradeSkillsInput",
     "UninstallSkillInput",
     "SearchSkillsInput",
     "ValidateSkillInput",
+    "ValidateAllInput",
     "GetCombinationsInput",
+    "RecommendWorkflowsInput",
     "InstallWorkflowInput",
+    "RefreshCatalogInput",
+    "GetServerStatsInput",
 ]
@@ -0,0 +1,239 @@
+"""Skills catalog builder for OpenCode Skills MCP Server.
+
+Scans every ``*/SKILL.md`` under a skills directory, parses the YAML
+frontmatter and keeps a compact on-disk index so later runs only reparse
+skills whose SKILL.md changed.
+
+Usage:
+    python -m opencode_skills_mcp.catalog [skills_dir]
+"""
+
+import argparse
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+CATALOG_INDEX_VERSION = 2
+
+# Frontmatter fields copied into the catalog; anything else is ignored
+CATALOG_FIELDS = ("name", "description", "category", "depth", "keywords", "prerequisites")
+
+
+def _parse_scalar(value: str) -> Any:
+    """Parse a YAML scalar or inline list as used in SKILL.md frontmatter."""
+    value = value.strip()
+    if value.startswith('[') and value.endswith(']'):
+        return [_parse_scalar(item) for item in value[1:-1].split(',') if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
+
+def parse_frontmatter(content: str) -> Optional[dict[str, Any]]:
+    """
+    Parse the YAML frontmatter at the top of a SKILL.md file.
+
+    Supports the subset used by skills: 'key: value' pairs, quoted
+    strings, inline '[a, b]' lists and '- item' block lists.
+
+    Args:
+        content: Full SKILL.md text
+
+    Returns:
+        Dictionary of frontmatter fields, or None if there is no frontmatter
+    """
+    lines = content.splitlines()
+    if not lines or lines[0].strip() != '---':
+        return None
+
+    fields: dict[str, Any] = {}
+    current_key: Optional[str] = None
+
+    for line in lines[1:]:
+        if line.strip() == '---':
+            return {key: "" if value is None else value for key, value in fields.items()}
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith('- ') and current_key is not None:
+            if not isinstance(fields[current_key], list):
+                fields[current_key] = []
+            fields[current_key].append(_parse_scalar(stripped[2:]))
+        elif ':' in line and not line[0].isspace():
+            key, _, value = line.partition(':')
+            current_key = key.strip()
+            # Empty values and block scalar markers take their value from the following lines
+            fields[current_key] = None if value.strip() in ('', '>', '|', '>-', '|-') else _parse_scalar(value)
+        elif current_key is not None and not isinstance(fields[current_key], list):
+            # Continuation of a multi-line value
+            fields[current_key] = f"{fields[current_key] or ''} {stripped}".strip()
+
+    return None
+
+
+def _load_index(index_file: Path) -> dict[str, Any]:
+    """Load the catalog index, returning an empty one if missing or outdated."""
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable catalog index {index_file}: {e}")
+        return {}
+
+    if index.get("version") != CATALOG_INDEX_VERSION:
+        return {}
+    return index.get("skills", {})
+
+
+def _write_json(path: Path, data: Any, **dump_kwargs: Any) -> None:
+    """Atomically write JSON to a file through a temporary file private to this thread."""
+    tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def build_catalog(
+    skills_dir: Path,
+    index_file: Path,
+    curated: Optional[dict[str, Any]] = None
+) -> tuple[dict[str, Any], dict[str, int]]:
+    """
+    Build the skills catalog from SKILL.md frontmatter.
+
+    Each skill is re-read only when its SKILL.md mtime or size differs
+    from the index. Fields present in the frontmatter win; fields only
+    present in the curated metadata (e.g. category, depth) are kept.
+    Curated skills that never had a SKILL.md under skills_dir (no index
+    entry) are kept unchanged; skills whose SKILL.md has been removed since
+    the last build are dropped.
+
+    Args:
+        skills_dir: Directory containing one subdirectory per skill
+        index_file: Path of the persisted catalog index
+        curated: Existing skills metadata to merge with
+
+    Returns:
+        Tuple of (catalog, stats) where stats counts 'skills', 'reparsed'
+        and 'removed' index entries
+    """
+    curated = curated or {}
+    previous = _load_index(index_file)
+    index: dict[str, Any] = {}
+    reparsed = 0
+
+    with os.scandir(skills_dir) as entries:
+        skill_dirs = sorted(entry.name for entry in entries if entry.is_dir() and not entry.name.startswith('.'))
+
+    for dir_name in skill_dirs:
+        skill_md = skills_dir / dir_name / "SKILL.md"
+        try:
+            stat = skill_md.stat()
+        except FileNotFoundError:
+            continue
+
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = previous.get(dir_name)
+        if cached is not None and cached["signature"] == signature:
+            index[dir_name] = cached
+            continue
+
+        try:
+            with open(skill_md, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping unreadable {skill_md}: {e}")
+            continue
+
+        frontmatter = parse_frontmatter(content)
+        if frontmatter is None:
+            logger.warning(f"Skipping {skill_md}: missing YAML frontmatter")
+            continue
+
+        index[dir_name] = {
+            "signature": signature,
+            "fields": {k: v for k, v in frontmatter.items() if k in CATALOG_FIELDS},
+            # Same count as `wc -l`
+            "lines": content.count('\n'),
+        }
+        reparsed += 1
+
+    removed_names = set(previous) - set(index)
+    catalog = {
+        name: data for name, data in curated.items()
+        if name not in index and name not in removed_names
+    }
+    for dir_name, entry in index.items():
+        catalog[dir_name] = {
+            **curated.get(dir_name, {}),
+            **entry["fields"],
+            "name": dir_name,
+            "lines": entry["lines"],
+        }
+
+    removed = len(removed_names)
+    if reparsed or removed or not index_file.exists():
+        _write_json(index_file, {"version": CATALOG_INDEX_VERSION, "skills": index}, separators=(',', ':'))
+
+    stats = {"skills": len(index), "reparsed": reparsed, "removed": removed}
+    logger.info(f"Built catalog: {stats['skills']} skills, {reparsed} reparsed, {removed} removed")
+    return catalog, stats
+
+
+def write_catalog(path: Path, catalog: dict[str, Any]) -> bool:
+    """
+    Write the catalog as skills metadata JSON if it changed.
+
+    Leaving an unchanged file alone keeps its mtime, so the metadata
+    cache in Config is not invalidated needlessly.
+
+    Args:
+        path: Skills metadata file
+        catalog: Catalog to write
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if json.load(f) == catalog:
+                return False
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    _write_json(path, catalog, indent=2)
+    return True
+
+
+def main() -> None:
+    """Command-line entry point: rebuild skills_metadata.json from SKILL.md files."""
+    from .config import Config
+
+    parser = argparse.ArgumentParser(description="Build the skills catalog from SKILL.md frontmatter")
+    parser.add_argument("skills_dir", nargs="?", type=Path, help="Skills directory (default: configured)")
+    args = parser.parse_args()
+
+    config = Config(args.skills_dir)
+    stats = config.refresh_catalog()
+    print(
+        f"{stats['skills']} skills, {stats['reparsed']} reparsed, {stats['removed']} removed; "
+        f"{config.skills_metadata_file} {'updated' if stats['written'] else 'unchanged'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
 """Configuration management for OpenCode Skills MCP Server."""
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Optional
+from .catalog import build_catalog, write_catalog
 from .logging_config import get_logger
+from .metrics import count_event
 
 
 logger = get_logger(__name__)
@@ -28,37 +32,135 @@ class Config:
         # Skills metadata file
         self.skills_metadata_file = self.skills_dir / "skills_metadata.json"
 
+        # Index of parsed SKILL.md frontmatter used to rebuild the metadata incrementally
+        self.catalog_index_file = self.skills_dir / ".skills_catalog_index.json"
+
         # Character limit for responses
         self.character_limit = 25000
 
+        # Maximum number of skills copied concurrently by install_workflow
+        self.install_workers = min(8, os.cpu_count() or 1)
+
+        # Threads running blocking tool work off the event loop; read-only
+        # tools get their own pool so long installs cannot starve them
+        self.read_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.write_workers = 4
+
+        # Maximum number of skills checked concurrently by validate_all
+        self.validate_workers = min(16, (os.cpu_count() or 1) * 2)
+
+        # Optional Prometheus text dump of server metrics
+        metrics_file = os.environ.get("OPENCODE_SKILLS_METRICS_FILE")
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+
         # OpenCode installation directories
         self.opencode_global = Path.home() / ".config" / "opencode" / "skill"
         self.opencode_project = Path(".opencode") / "skill"
 
+        # Parsed metadata, reused until the file's (mtime, size) changes
+        self._metadata_cache: Optional[dict[str, Any]] = None
+        self._metadata_signature: Optional[tuple[int, int]] = None
+        self._metadata_lock = threading.Lock()
+        self.metadata_cache_stats = {"hits": 0, "misses": 0, "reloads": 0}
+
+        # Serializes refresh_catalog so the index and metadata files are updated together
+        self._refresh_lock = threading.Lock()
+
         logger.debug(f"Initialized with skills_dir: {self.skills_dir}")
 
+    def _metadata_file_signature(self) -> Optional[tuple[int, int]]:
+        """
+        Get the (mtime_ns, size) signature of the skills metadata file.
+
+        Returns:
+            Signature tuple, or None if the file does not exist
+        """
+        count_event("stat_calls")
+        try:
+            stat = self.skills_metadata_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load_skills_metadata(self) -> dict[str, Any]:
         """
         Load skills metadata from JSON file.
 
+        The parsed metadata is cached in-process and only re-read when the
+        file's mtime or size changes. Callers must treat the returned
+        dictionary as read-only.
+
         Returns:
             Dictionary of skill metadata
         """
-        try:
-            if self.skills_metadata_file.exists():
+        with self._metadata_lock:
+            try:
+                signature = self._metadata_file_signature()
+                if signature is None:
+                    logger.warning(f"Skills metadata file not found: {self.skills_metadata_file}")
+                    self._metadata_cache = None
+                    self._metadata_signature = None
+                    return {}
+
+                if self._metadata_cache is not None and signature == self._metadata_signature:
+                    self.metadata_cache_stats["hits"] += 1
+                    return self._metadata_cache
+
+                self.metadata_cache_stats["misses"] += 1
+                count_event("metadata_loads")
+                if self._metadata_cache is not None:
+                    self.metadata_cache_stats["reloads"] += 1
+                    logger.info("Skills metadata file changed, reloading")
+
                 with open(self.skills_metadata_file, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
                     logger.debug(f"Loaded metadata for {len(metadata)} skills")
-                    return metadata
-            else:
-                logger.warning(f"Skills metadata file not found: {self.skills_metadata_file}")
+
+                self._metadata_cache = metadata
+                self._metadata_signature = signature
+                return metadata
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse skills metadata JSON: {e}")
+                return {}
+            except Exception as e:
+                logger.error(f"Error loading skills metadata: {e}")
                 return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse skills metadata JSON: {e}")
-            return {}
-        except Exception as e:
-            logger.error(f"Error loading skills metadata: {e}")
-            return {}
+
+    def invalidate_metadata_cache(self) -> None:
+        """Drop the cached skills metadata so the next load re-reads the file."""
+        with self._metadata_lock:
+            self._metadata_cache = None
+            self._metadata_signature = None
+
+    def get_metadata_cache_stats(self) -> dict[str, int]:
+        """
+        Get skills metadata cache counters.
+
+        Returns:
+            Dictionary with 'hits', 'misses' and 'reloads' counts
+        """
+        with self._metadata_lock:
+            return dict(self.metadata_cache_stats)
+
+    def refresh_catalog(self) -> dict[str, int]:
+        """
+        Rebuild skills metadata from the SKILL.md files under skills_dir.
+
+        Only skills whose SKILL.md changed since the last refresh are
+        reparsed. The metadata file is rewritten only if its content
+        changes. Concurrent refreshes run one at a time so the catalog index
+        and metadata file always come from the same scan.
+
+        Returns:
+            Dictionary with 'skills', 'reparsed' and 'removed' counts and
+            'written' (1 if the metadata file was updated, else 0)
+        """
+        with self._refresh_lock:
+            catalog, stats = build_catalog(self.skills_dir, self.catalog_index_file, self.load_skills_metadata())
+            stats["written"] = int(write_catalog(self.skills_metadata_file, catalog))
+        if stats["written"]:
+            logger.info(f"Updated {self.skills_metadata_file} with {len(catalog)} skills")
+        return stats
 
     def get_install_dir(self, scope: str = "global") -> Path:
         """
@@ -78,6 +180,39 @@ class Config:
             logger.warning(f"Invalid scope '{scope}', using 'global'")
             return self.opencode_global
 
+    def get_installed_skills(self, scope: str = "global") -> set[str]:
+        """
+        Get the names of all skills installed in a scope with a single directory scan.
+
+        Hidden entries, such as the .staging directory used while installing,
+        are never reported as skills.
+
+        Args:
+            scope: 'global' or 'project'
+
+        Returns:
+            Set of installed skill names
+        """
+        install_dir = self.get_install_dir(scope)
+        installed = set()
+
+        count_event("stat_calls")
+        try:
+            with os.scandir(install_dir) as entries:
+                for entry in entries:
+                    count_event("stat_calls")
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                        installed.add(entry.name)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to scan install directory {install_dir}: {e}")
+
+        logger.debug(f"Found {len(installed)} installed skills (scope: {scope})")
+        return installed
+
     def is_skill_installed(self, skill_name: str, scope: str = "global") -> bool:
         """
         Check if a skill is installed.
@@ -92,9 +227,11 @@ class Config:
         install_dir = self.get_install_dir(scope)
         skill_path = install_dir / skill_name
 
+        count_event("stat_calls")
         if not skill_path.exists():
             return False
 
+        count_event("stat_calls")
         skill_md = skill_path / "SKILL.md"
         is_installed = skill_md.exists()
 
@@ -0,0 +1,81 @@
+"""Reflink and hardlink helpers for installing skills without duplicating file contents."""
+
+import os
+import shutil
+import sys
+
+from .logging_config import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+logger = get_logger(__name__)
+
+# Linux FICLONE ioctl request number (exposed as fcntl.FICLONE from Python 3.12)
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None else None
+
+
+def reflink_file(src: str, dst: str) -> bool:
+    """
+    Clone a file with a copy-on-write reflink.
+
+    Only supported on Linux filesystems that implement FICLONE
+    (e.g. Btrfs, XFS, bcachefs).
+
+    Args:
+        src: Source file path
+        dst: Destination file path (must not exist)
+
+    Returns:
+        True if the file was reflinked, False if reflinks are unavailable
+    """
+    if _FICLONE is None or not sys.platform.startswith("linux"):
+        return False
+
+    created = False
+    try:
+        with open(src, "rb") as src_file, open(dst, "xb") as dst_file:
+            created = True
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    except OSError:
+        # Only remove dst if we created it; an existing file is not ours
+        if created:
+            try:
+                os.unlink(dst)
+            except FileNotFoundError:
+                pass
+        return False
+
+    shutil.copystat(src, dst)
+    return True
+
+
+def link_or_copy_file(src: str, dst: str) -> str:
+    """
+    Place a file at dst using the cheapest available method.
+
+    Tries a reflink first, then a hardlink, and copies only as a last
+    resort. Hardlinked files share their inode with the source, so they
+    must be treated as read-only. Suitable as the copy_function of
+    shutil.copytree.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path
+    """
+    if reflink_file(src, dst):
+        return dst
+
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError as e:
+        logger.debug(f"Hardlink failed for {src}, copying instead: {e}")
+
+    return shutil.copy2(src, dst)
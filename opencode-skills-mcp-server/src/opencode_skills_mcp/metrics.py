@@ -0,0 +1,214 @@
+"""Request tracing and latency metrics for OpenCode Skills MCP Server."""
+
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Upper bounds (seconds) of the tool latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Per-request event counters tracked for every tool call
+REQUEST_EVENTS = ("metadata_loads", "stat_calls")
+
+# Counters of the tool call currently being handled, if any
+_request_counters: ContextVar[Optional[dict[str, int]]] = ContextVar("request_counters", default=None)
+
+
+def count_event(event: str, amount: int = 1) -> None:
+    """
+    Count an event against the tool call currently being handled.
+
+    Does nothing outside of a tracked tool call.
+
+    Args:
+        event: One of REQUEST_EVENTS
+        amount: Number of events to add
+    """
+    counters = _request_counters.get()
+    if counters is not None:
+        counters[event] += amount
+
+
+class ServerMetrics:
+    """Collects per-tool call counts, latency histograms and request event totals."""
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._tools: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+
+    @contextmanager
+    def track(self, tool_name: str) -> Iterator[None]:
+        """
+        Trace one tool call, recording its latency and request events.
+
+        Args:
+            tool_name: Name of the MCP tool being called
+        """
+        request_id = next(self._request_ids)
+        counters = {event: 0 for event in REQUEST_EVENTS}
+        token = _request_counters.set(counters)
+        start = time.perf_counter()
+        failed = False
+
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_counters.reset(token)
+            self._record(tool_name, elapsed, counters, failed)
+            logger.info(
+                f"request={request_id} tool={tool_name} duration_ms={elapsed * 1000:.2f} "
+                + " ".join(f"{event}={count}" for event, count in counters.items())
+                + (" status=error" if failed else "")
+            )
+
+    def _record(self, tool_name: str, elapsed: float, counters: dict[str, int], failed: bool) -> None:
+        """Add one finished tool call to the totals."""
+        with self._lock:
+            stats = self._tools.get(tool_name)
+            if stats is None:
+                stats = {
+                    "calls": 0,
+                    "errors": 0,
+                    "latency_sum": 0.0,
+                    "latency_max": 0.0,
+                    "buckets": [0] * len(LATENCY_BUCKETS),
+                    **{event: 0 for event in REQUEST_EVENTS},
+                }
+                self._tools[tool_name] = stats
+
+            stats["calls"] += 1
+            stats["errors"] += int(failed)
+            stats["latency_sum"] += elapsed
+            stats["latency_max"] = max(stats["latency_max"], elapsed)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if elapsed <= bound:
+                    stats["buckets"][i] += 1
+            for event, count in counters.items():
+                stats[event] += count
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a copy of the collected metrics.
+
+        Returns:
+            Dictionary mapping tool names to their counters; histogram
+            buckets are cumulative, keyed by upper bound
+        """
+        with self._lock:
+            return {
+                tool_name: {
+                    **{k: v for k, v in stats.items() if k != "buckets"},
+                    "buckets": dict(zip((str(bound) for bound in LATENCY_BUCKETS), stats["buckets"])),
+                }
+                for tool_name, stats in sorted(self._tools.items())
+            }
+
+    def to_markdown(self) -> str:
+        """
+        Render the collected metrics as a markdown table.
+
+        Returns:
+            Formatted markdown string
+        """
+        snapshot = self.snapshot()
+        if not snapshot:
+            return "# Server Stats\n\nNo tool calls recorded yet."
+
+        parts = [
+            "# Server Stats\n\n",
+            "| Tool | Calls | Errors | Avg ms | Max ms | Metadata loads/call | Stat calls/call |\n",
+            "|------|-------|--------|--------|--------|---------------------|-----------------|\n",
+        ]
+        for tool_name, stats in snapshot.items():
+            calls = stats["calls"]
+            parts.append(
+                f"| {tool_name} | {calls} | {stats['errors']} "
+                f"| {stats['latency_sum'] / calls * 1000:.2f} | {stats['latency_max'] * 1000:.2f} "
+                f"| {stats['metadata_loads'] / calls:.2f} | {stats['stat_calls'] / calls:.2f} |\n"
+            )
+        return "".join(parts)
+
+    def to_prometheus(self) -> str:
+        """
+        Render the collected metrics in the Prometheus text exposition format.
+
+        Returns:
+            Prometheus metrics text
+        """
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP opencode_skills_tool_latency_seconds Tool call latency.",
+            "# TYPE opencode_skills_tool_latency_seconds histogram",
+        ]
+        for tool_name, stats in snapshot.items():
+            for bound, count in stats["buckets"].items():
+                lines.append(f'opencode_skills_tool_latency_seconds_bucket{{tool="{tool_name}",le="{bound}"}} {count}')
+            lines.append(f'opencode_skills_tool_latency_seconds_bucket{{tool="{tool_name}",le="+Inf"}} {stats["calls"]}')
+            lines.append(f'opencode_skills_tool_latency_seconds_sum{{tool="{tool_name}"}} {stats["latency_sum"]}')
+            lines.append(f'opencode_skills_tool_latency_seconds_count{{tool="{tool_name}"}} {stats["calls"]}')
+
+        lines.append("# HELP opencode_skills_tool_errors_total Tool calls that raised an exception.")
+        lines.append("# TYPE opencode_skills_tool_errors_total counter")
+        for tool_name, stats in snapshot.items():
+            lines.append(f'opencode_skills_tool_errors_total{{tool="{tool_name}"}} {stats["errors"]}')
+
+        for event in REQUEST_EVENTS:
+            lines.append(f"# HELP opencode_skills_{event}_total {event.replace('_', ' ').capitalize()} made by tool calls.")
+            lines.append(f"# TYPE opencode_skills_{event}_total counter")
+            for tool_name, stats in snapshot.items():
+                lines.append(f'opencode_skills_{event}_total{{tool="{tool_name}"}} {stats[event]}')
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        """
+        Atomically write the Prometheus text dump to a file.
+
+        The dump goes through a temporary file private to the calling thread,
+        so concurrent writers never interleave.
+
+        Args:
+            path: Output file path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+        try:
+            tmp_path.write_text(self.to_prometheus(), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Wrote metrics to {path}")
+
+
+# Global metrics instance
+_metrics: Optional[ServerMetrics] = None
+
+
+def get_metrics() -> ServerMetrics:
+    """
+    Get global metrics instance.
+
+    Returns:
+        ServerMetrics instance
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = ServerMetrics()
+    return _metrics
@@ -17,6 +17,20 @@ class ListSkillsInput(BaseModel):
         default=False,
         description="Only show installed skills"
     )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="Index of the first result to return (use the offset given at the end of the previous page)"
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of results to return (default: as many as fit in one response)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class GetSkillInfoInput(BaseModel):
@@ -25,6 +39,10 @@ class GetSkillInfoInput(BaseModel):
         ...,
         description="Name of the skill to get information about"
     )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class InstallSkillInput(BaseModel):
@@ -37,6 +55,34 @@ class InstallSkillInput(BaseModel):
         default="global",
         description="Installation scope: 'global' or 'project'"
     )
+    mode: str = Field(
+        default="copy",
+        description="Installation mode: 'copy' (full copy), 'link' (reflink or hardlink files where supported, copy otherwise) or 'symlink' (link to the read-only skills directory)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
+
+
+class UpgradeSkillsInput(BaseModel):
+    """Input for upgrading installed skills."""
+    skill_names: list[str] | None = Field(
+        default=None,
+        description="Names of the skills to upgrade (default: all installed skills)"
+    )
+    scope: str = Field(
+        default="global",
+        description="Upgrade scope: 'global' or 'project'"
+    )
+    mode: str = Field(
+        default="copy",
+        description="How changed files are written: 'copy' or 'link' (reflink or hardlink where supported)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class UninstallSkillInput(BaseModel):
@@ -49,6 +95,10 @@ class UninstallSkillInput(BaseModel):
         default="global",
         description="Uninstallation scope: 'global' or 'project'"
     )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class SearchSkillsInput(BaseModel):
@@ -57,6 +107,20 @@ class SearchSkillsInput(BaseModel):
         ...,
         description="Search query (keywords or description)"
     )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="Index of the first result to return (use the offset given at the end of the previous page)"
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of results to return (default: as many as fit in one response)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class ValidateSkillInput(BaseModel):
@@ -65,6 +129,22 @@ class ValidateSkillInput(BaseModel):
         ...,
         description="Path to the skill directory to validate"
     )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
+
+
+class ValidateAllInput(BaseModel):
+    """Input for validating every skill under a directory."""
+    root: str = Field(
+        ...,
+        description="Directory to search for skills (every folder containing a SKILL.md is validated)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class GetCombinationsInput(BaseModel):
@@ -73,6 +153,41 @@ class GetCombinationsInput(BaseModel):
         default=None,
         description="Filter by workflow category (e.g., 'Writing', 'Development', 'Business')"
     )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="Index of the first result to return (use the offset given at the end of the previous page)"
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of results to return (default: as many as fit in one response)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
+
+
+class RecommendWorkflowsInput(BaseModel):
+    """Input for recommending workflows and skills."""
+    goal: str | None = Field(
+        default=None,
+        description="What you want to accomplish, in free text (e.g., 'launch a product with a landing page')"
+    )
+    installed_skills: list[str] | None = Field(
+        default=None,
+        description="Skills to base recommendations on (default: skills currently installed)"
+    )
+    limit: int = Field(
+        default=5,
+        ge=1,
+        description="Maximum number of workflows and of skills to return"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
 
 
 class InstallWorkflowInput(BaseModel):
@@ -85,3 +200,27 @@ class InstallWorkflowInput(BaseModel):
         default="global",
         description="Installation scope: 'global' or 'project'"
     )
+    mode: str = Field(
+        default="copy",
+        description="Installation mode: 'copy' (full copy), 'link' (reflink or hardlink files where supported, copy otherwise) or 'symlink' (link to the read-only skills directory)"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
+
+
+class RefreshCatalogInput(BaseModel):
+    """Input for rebuilding the skills catalog."""
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
+
+
+class GetServerStatsInput(BaseModel):
+    """Input for getting server metrics."""
+    format: str = Field(
+        default="markdown",
+        description="Response format: 'markdown' for readable text or 'json' for compact structured data"
+    )
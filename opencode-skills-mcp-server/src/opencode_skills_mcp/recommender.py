@@ -0,0 +1,188 @@
+"""Workflow and skill recommendations for OpenCode Skills MCP Server."""
+
+import heapq
+import math
+from collections import Counter, defaultdict
+from itertools import combinations as pairs
+from typing import Any
+
+from .logging_config import get_logger
+from .search_index import tokenize
+
+
+logger = get_logger(__name__)
+
+# Token weights per metadata field when building skill vectors
+FIELD_WEIGHTS = {
+    "keywords": 3.0,
+    "category": 2.0,
+    "name": 2.0,
+    "description": 1.0,
+}
+
+# Weight of sharing a workflow relative to content similarity
+CO_OCCURRENCE_WEIGHT = 0.5
+
+# Tokens in more than this share of skills (e.g. 'and', 'the') don't link skills;
+# every token in at most SIMILARITY_MIN_DF_CUTOFF skills still does
+SIMILARITY_MAX_DF_FRACTION = 0.1
+SIMILARITY_MIN_DF_CUTOFF = 20
+
+# Most similar skills kept per skill in the similarity matrix
+SIMILARITY_TOP_K = 50
+
+# Weight of the installed share of a partly installed workflow when ranking workflows
+COVERAGE_WEIGHT = 0.3
+
+
+def _normalize(vector: dict[str, float]) -> dict[str, float]:
+    """Scale a sparse vector to unit length."""
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return {}
+    return {token: weight / norm for token, weight in vector.items()}
+
+
+def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    """Cosine similarity of two unit-length sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(token, 0.0) for token, weight in a.items())
+
+
+class SkillRecommender:
+    """Scores skills and workflows against installed skills or a free-text goal."""
+
+    def __init__(self, metadata: dict[str, Any], combinations: dict[str, Any]):
+        """
+        Precompute skill vectors and the skill similarity matrix.
+
+        Args:
+            metadata: Skills metadata as returned by Config.load_skills_metadata
+            combinations: Workflow definitions keyed by workflow name
+        """
+        self.source = metadata
+        self.combinations = combinations
+
+        term_counts: dict[str, Counter[str]] = {}
+        for skill_name, skill_data in metadata.items():
+            counts: Counter[str] = Counter()
+            fields = {
+                "keywords": " ".join(skill_data.get("keywords", [])),
+                "category": skill_data.get("category", ""),
+                "name": skill_name,
+                "description": skill_data.get("description", ""),
+            }
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    counts[token] += FIELD_WEIGHTS[field]
+            term_counts[skill_name] = counts
+
+        num_skills = len(term_counts)
+        doc_freq: Counter[str] = Counter(token for counts in term_counts.values() for token in counts)
+        self.idf = {token: math.log(1 + num_skills / freq) for token, freq in doc_freq.items()}
+
+        self.vectors = {
+            skill_name: _normalize({token: count * self.idf[token] for token, count in counts.items()})
+            for skill_name, counts in term_counts.items()
+        }
+
+        # Sparse similarity matrix, accumulated through shared tokens only
+        postings: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        for skill_name, vector in self.vectors.items():
+            for token, weight in vector.items():
+                postings[token].append((skill_name, weight))
+
+        # Common tokens would pair up nearly every skill and make the matrix dense
+        max_df = max(SIMILARITY_MIN_DF_CUTOFF, SIMILARITY_MAX_DF_FRACTION * num_skills)
+        content: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for entries in postings.values():
+            if len(entries) > max_df:
+                continue
+            for (skill_a, weight_a), (skill_b, weight_b) in pairs(entries, 2):
+                content[skill_a][skill_b] += weight_a * weight_b
+                content[skill_b][skill_a] += weight_a * weight_b
+
+        self.similarity: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for skill_name, related in content.items():
+            self.similarity[skill_name].update(
+                heapq.nlargest(SIMILARITY_TOP_K, related.items(), key=lambda item: item[1])
+            )
+
+        num_workflows = len(combinations) or 1
+        for combo_data in combinations.values():
+            for skill_a, skill_b in pairs(combo_data["skills"], 2):
+                self.similarity[skill_a][skill_b] += CO_OCCURRENCE_WEIGHT / num_workflows
+                self.similarity[skill_b][skill_a] += CO_OCCURRENCE_WEIGHT / num_workflows
+
+        self.workflow_vectors = {
+            combo_key: self._text_vector(
+                f"{combo_data['name']} {combo_data['description']} {combo_data.get('category', '')}"
+            )
+            for combo_key, combo_data in combinations.items()
+        }
+
+        logger.debug(f"Built recommender for {num_skills} skills and {len(combinations)} workflows")
+
+    def _text_vector(self, text: str) -> dict[str, float]:
+        """Build a unit-length TF-IDF vector for free text."""
+        counts = Counter(tokenize(text))
+        return _normalize({token: count * self.idf[token] for token, count in counts.items() if token in self.idf})
+
+    def recommend(self, installed: set[str], goal: str | None = None, limit: int = 5) -> dict[str, list[dict[str, Any]]]:
+        """
+        Rank workflows and not-yet-installed skills.
+
+        Skills score by similarity to the goal and to installed skills
+        (content overlap plus shared workflows). Workflows score by the
+        goal's similarity to their description, the mean score of the
+        skills they would add and, if partly installed, the share of their
+        skills already installed. Fully installed workflows have nothing
+        to add and are ranked last.
+
+        Args:
+            installed: Names of installed skills
+            goal: Optional free-text description of what the user wants to do
+            limit: Maximum number of workflows and of skills to return
+
+        Returns:
+            Dictionary with ranked 'workflows' and 'skills' lists
+        """
+        goal_vector = self._text_vector(goal) if goal else {}
+        installed_known = [s for s in installed if s in self.vectors]
+
+        skill_scores: dict[str, float] = {}
+        for skill_name, vector in self.vectors.items():
+            score = _cosine(goal_vector, vector) if goal_vector else 0.0
+            if installed_known:
+                related = self.similarity.get(skill_name, {})
+                score += sum(related.get(other, 0.0) for other in installed_known) / len(installed_known)
+            skill_scores[skill_name] = score
+
+        workflows = []
+        for combo_key, combo_data in self.combinations.items():
+            skills = combo_data["skills"]
+            missing = [s for s in skills if s not in installed]
+            score = 0.0
+            if missing:
+                # Installed skills add nothing, so only the skills still to install count
+                score = sum(skill_scores.get(s, 0.0) for s in missing) / len(missing)
+                score += COVERAGE_WEIGHT * (len(skills) - len(missing)) / len(skills)
+                if goal_vector:
+                    score += _cosine(goal_vector, self.workflow_vectors[combo_key])
+            workflows.append({
+                "workflow": combo_key,
+                "name": combo_data["name"],
+                "score": round(score, 4),
+                "missing": missing,
+            })
+
+        skills = [
+            {"name": skill_name, "score": round(score, 4)}
+            for skill_name, score in skill_scores.items()
+            if skill_name not in installed and score > 0
+        ]
+
+        workflows.sort(key=lambda item: (not item["missing"], -item["score"], item["workflow"]))
+        skills.sort(key=lambda item: (-item["score"], item["name"]))
+        return {"workflows": workflows[:limit], "skills": skills[:limit]}
@@ -0,0 +1,126 @@
+"""Inverted-index search over skills metadata for OpenCode Skills MCP Server."""
+
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Any
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Each field's tokens count this many times towards a skill's term frequency
+FIELD_WEIGHTS = {
+    "name": 3,
+    "keywords": 2,
+    "category": 1,
+    "description": 1,
+}
+
+# Score multiplier for terms matched by prefix rather than exactly
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class SkillSearchIndex:
+    """Inverted index with prefix matching and BM25 ranking over skills metadata."""
+
+    def __init__(self, metadata: dict[str, Any], k1: float = 1.2, b: float = 0.75):
+        """
+        Build the index from skills metadata.
+
+        Args:
+            metadata: Skills metadata as returned by Config.load_skills_metadata
+            k1: BM25 term frequency saturation parameter
+            b: BM25 length normalization parameter
+        """
+        self.source = metadata
+        self.k1 = k1
+        self.b = b
+
+        self.postings: dict[str, dict[str, int]] = defaultdict(dict)
+        self.doc_lengths: dict[str, int] = {}
+
+        for skill_name, skill_data in metadata.items():
+            term_counts: Counter[str] = Counter()
+            fields = {
+                "name": skill_name,
+                "keywords": " ".join(skill_data.get("keywords", [])),
+                "category": skill_data.get("category", ""),
+                "description": skill_data.get("description", ""),
+            }
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    term_counts[token] += FIELD_WEIGHTS[field]
+
+            self.doc_lengths[skill_name] = sum(term_counts.values())
+            for token, count in term_counts.items():
+                self.postings[token][skill_name] = count
+
+        self.vocabulary = sorted(self.postings)
+        self.avg_doc_length = (
+            sum(self.doc_lengths.values()) / len(self.doc_lengths) if self.doc_lengths else 0.0
+        )
+
+        logger.debug(f"Built search index: {len(self.doc_lengths)} skills, {len(self.vocabulary)} terms")
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """
+        Find indexed tokens matching a query term exactly or by prefix.
+
+        Args:
+            term: Query token
+
+        Returns:
+            List of (token, weight) pairs
+        """
+        matches = []
+        start = bisect_left(self.vocabulary, term)
+        for token in self.vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches.append((token, 1.0 if token == term else PREFIX_MATCH_WEIGHT))
+        return matches
+
+    def _idf(self, token: str) -> float:
+        """Compute the BM25 inverse document frequency of a token."""
+        num_docs = len(self.doc_lengths)
+        doc_freq = len(self.postings[token])
+        return math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """
+        Search the index.
+
+        Args:
+            query: Free-text search query
+
+        Returns:
+            List of (skill_name, score) pairs, best match first
+        """
+        scores: dict[str, float] = defaultdict(float)
+
+        for term in set(tokenize(query)):
+            for token, weight in self._expand(term):
+                idf = self._idf(token)
+                for skill_name, tf in self.postings[token].items():
+                    length_norm = 1 - self.b + self.b * self.doc_lengths[skill_name] / self.avg_doc_length
+                    scores[skill_name] += weight * idf * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
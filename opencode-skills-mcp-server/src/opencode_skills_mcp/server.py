@@ -1,92 +1,215 @@
 """MCP Server entry point for OpenCode Skills management."""
 
+import asyncio
+import contextvars
+import functools
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable
+
 from mcp.types import TextContent
 from mcp.server.fastmcp import FastMCP
 
+from .config import get_config
 from .logging_config import setup_logging
+from .metrics import get_metrics
 from .models import (
     ListSkillsInput,
     GetSkillInfoInput,
     InstallSkillInput,
+    UpgradeSkillsInput,
     UninstallSkillInput,
     SearchSkillsInput,
     ValidateSkillInput,
+    ValidateAllInput,
     GetCombinationsInput,
+    RecommendWorkflowsInput,
     InstallWorkflowInput,
+    RefreshCatalogInput,
+    GetServerStatsInput,
 )
-from .skill_manager import SkillManager
+from .skill_manager import SkillManager, get_skill_manager, to_json
 
 # Setup logging
 logger = setup_logging(level="INFO", log_file="logs/opencode_skills_mcp.log")
 logger.info("OpenCode Skills MCP Server starting up...")
 
+metrics = get_metrics()
+
+# Blocking SkillManager work runs on these pools so the event loop stays free
+config = get_config()
+read_executor = ThreadPoolExecutor(max_workers=config.read_workers, thread_name_prefix="skills-read")
+write_executor = ThreadPoolExecutor(max_workers=config.write_workers, thread_name_prefix="skills-write")
+
+
+async def run_blocking(executor: ThreadPoolExecutor, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function on an executor without blocking the event loop.
+
+    The current context is copied so request metrics are still counted.
+
+    Args:
+        executor: Executor to run on
+        func: Blocking function
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args, **kwargs))
+
+
+@asynccontextmanager
+async def lifespan(_server: FastMCP) -> AsyncIterator[SkillManager]:
+    """Warm up the shared SkillManager on startup and release it on shutdown."""
+    manager = get_skill_manager()
+    await run_blocking(read_executor, manager.warmup)
+    try:
+        yield manager
+    finally:
+        if manager.config.metrics_file is not None:
+            metrics.write_prometheus(manager.config.metrics_file)
+        manager.close()
+
 # Create server instance
-server = FastMCP("opencode-skills-mcp")
+server = FastMCP("opencode-skills-mcp", lifespan=lifespan)
 
 @server.tool()
 async def list_skills(arguments: ListSkillsInput) -> list[TextContent]:
     """List all available OpenCode skills with optional filtering by category or depth. Shows installation status."""
-    manager = SkillManager()
-    result = manager.list_skills(
-        category=arguments.category,
-        depth=arguments.depth,
-        installed_only=arguments.installed_only
-    )
+    with metrics.track("list_skills"):
+        manager = get_skill_manager()
+        result = await run_blocking(
+            read_executor,
+            manager.list_skills,
+            category=arguments.category,
+            depth=arguments.depth,
+            installed_only=arguments.installed_only,
+            offset=arguments.offset,
+            limit=arguments.limit,
+            output_format=arguments.format
+        )
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def get_skill_info(arguments: GetSkillInfoInput) -> list[TextContent]:
     """Get detailed information about a specific OpenCode skill including description, prerequisites, and installation status."""
-    manager = SkillManager()
-    result = manager.get_skill_info(arguments.skill_name)
+    with metrics.track("get_skill_info"):
+        manager = get_skill_manager()
+        result = await run_blocking(read_executor, manager.get_skill_info, arguments.skill_name, output_format=arguments.format)
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def install_skill(arguments: InstallSkillInput) -> list[TextContent]:
     """Install an OpenCode skill globally or locally to your project. Automatically handles file copying."""
-    manager = SkillManager()
-    result = manager.install_skill(arguments.skill_name, arguments.scope)
+    with metrics.track("install_skill"):
+        manager = get_skill_manager()
+        result = await run_blocking(write_executor, manager.install_skill, arguments.skill_name, arguments.scope, arguments.mode, output_format=arguments.format)
+    return [TextContent(type="text", text=result)]
+
+@server.tool()
+async def upgrade_skills(arguments: UpgradeSkillsInput) -> list[TextContent]:
+    """Upgrade installed OpenCode skills in place, copying only files that changed since they were installed."""
+    with metrics.track("upgrade_skills"):
+        manager = get_skill_manager()
+        result = await run_blocking(write_executor, manager.upgrade_skills, arguments.skill_names, arguments.scope, arguments.mode, output_format=arguments.format)
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def uninstall_skill(arguments: UninstallSkillInput) -> list[TextContent]:
     """Uninstall an OpenCode skill from global or local installation directory."""
-    manager = SkillManager()
-    result = manager.uninstall_skill(arguments.skill_name, arguments.scope)
+    with metrics.track("uninstall_skill"):
+        manager = get_skill_manager()
+        result = await run_blocking(write_executor, manager.uninstall_skill, arguments.skill_name, arguments.scope, output_format=arguments.format)
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def search_skills(arguments: SearchSkillsInput) -> list[TextContent]:
     """Search for OpenCode skills by keywords, description, or category name."""
-    manager = SkillManager()
-    result = manager.search_skills(arguments.query)
+    with metrics.track("search_skills"):
+        manager = get_skill_manager()
+        result = await run_blocking(read_executor, manager.search_skills, arguments.query, arguments.offset, arguments.limit, output_format=arguments.format)
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def validate_skill(arguments: ValidateSkillInput) -> list[TextContent]:
     """Validate a skill's SKILL.md file structure for proper YAML frontmatter and required fields."""
-    manager = SkillManager()
-    result = manager.validate_skill(arguments.skill_path)
+    with metrics.track("validate_skill"):
+        manager = get_skill_manager()
+        result = await run_blocking(read_executor, manager.validate_skill, arguments.skill_path, output_format=arguments.format)
+    return [TextContent(type="text", text=result)]
+
+@server.tool()
+async def validate_all(arguments: ValidateAllInput) -> list[TextContent]:
+    """Validate every skill under a directory in parallel and return one aggregated report."""
+    with metrics.track("validate_all"):
+        manager = get_skill_manager()
+        result, _all_valid = await run_blocking(read_executor, manager.validate_all, arguments.root, output_format=arguments.format)
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def get_combinations(arguments: GetCombinationsInput) -> list[TextContent]:
     """Get recommended skill combinations and workflows with installation status for each skill."""
-    manager = SkillManager()
-    result = manager.get_combinations(arguments.category)
+    with metrics.track("get_combinations"):
+        manager = get_skill_manager()
+        result = await run_blocking(read_executor, manager.get_combinations, arguments.category, arguments.offset, arguments.limit, output_format=arguments.format)
+    return [TextContent(type="text", text=result)]
+
+@server.tool()
+async def recommend_workflows(arguments: RecommendWorkflowsInput) -> list[TextContent]:
+    """Get a ranked shortlist of workflows and skills for a goal or for the skills already installed."""
+    with metrics.track("recommend_workflows"):
+        manager = get_skill_manager()
+        result = await run_blocking(read_executor, manager.recommend_workflows, arguments.goal, arguments.installed_skills, arguments.limit, output_format=arguments.format)
     return [TextContent(type="text", text=result)]
 
 @server.tool()
 async def install_workflow(arguments: InstallWorkflowInput) -> list[TextContent]:
     """Install all skills for a recommended workflow combination (e.g., content-pipeline, product-launch)."""
-    manager = SkillManager()
-    result = manager.install_workflow(arguments.workflow_name, arguments.scope)
+    with metrics.track("install_workflow"):
+        manager = get_skill_manager()
+        result = await run_blocking(write_executor, manager.install_workflow, arguments.workflow_name, arguments.scope, arguments.mode, output_format=arguments.format)
+    return [TextContent(type="text", text=result)]
+
+@server.tool()
+async def refresh_catalog(arguments: RefreshCatalogInput) -> list[TextContent]:
+    """Rebuild the skills catalog from SKILL.md frontmatter, reparsing only skills that changed."""
+    with metrics.track("refresh_catalog"):
+        manager = get_skill_manager()
+        result = await run_blocking(write_executor, manager.refresh_catalog, output_format=arguments.format)
+    return [TextContent(type="text", text=result)]
+
+@server.tool()
+async def get_server_stats(arguments: GetServerStatsInput) -> list[TextContent]:
+    """Get per-tool call counts, latency and filesystem activity recorded by this server."""
+    manager = get_skill_manager()
+    if manager.config.metrics_file is not None:
+        metrics.write_prometheus(manager.config.metrics_file)
+    if arguments.format == "json":
+        result = to_json({
+            "tools": metrics.snapshot(),
+            "metadata_cache": manager.config.get_metadata_cache_stats(),
+        })
+    else:
+        cache_stats = manager.config.get_metadata_cache_stats()
+        result = metrics.to_markdown() + (
+            f"\n**Metadata cache**: {cache_stats['hits']} hits, "
+            f"{cache_stats['misses']} misses, {cache_stats['reloads']} reloads\n"
+        )
     return [TextContent(type="text", text=result)]
 
 def main():
     """Main entry point for the MCP server."""
     logger.info("Starting OpenCode Skills MCP Server...")
-    server.run()
+    try:
+        server.run()
+    finally:
+        read_executor.shutdown(wait=False)
+        write_executor.shutdown(wait=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
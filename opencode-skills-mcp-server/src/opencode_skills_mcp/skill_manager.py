@@ -1,16 +1,77 @@
 """Skill management logic for OpenCode Skills MCP Server."""
 
+import hashlib
+import json
+import os
 import re
 import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, Optional
 
 from .config import Config, get_config
+from .file_linking import link_or_copy_file
 from .logging_config import get_logger
+from .recommender import SkillRecommender
+from .search_index import SkillSearchIndex
+from .skill_store import SkillStore
 
 
 logger = get_logger(__name__)
 
+# Supported ways of placing a skill tree into an install directory
+INSTALL_MODES = ("copy", "link", "symlink")
+
+# Ways upgrade_skills can write changed files; symlinked installs never need upgrading
+UPGRADE_MODES = ("copy", "link")
+
+# Markdown rendering of per-skill install and upgrade outcomes
+STATUS_TEXT = {
+    "installed": "✅ Installed",
+    "already_installed": "⚠️ Already installed",
+    "upgraded": "✅ Upgraded",
+    "up_to_date": "✔️ Already up to date",
+    "symlinked": "🔗 Symlinked, always current",
+    "not_found": "❌ Not found in skills directory",
+    "invalid": "❌ Invalid skill name",
+    "failed": "❌ Failed",
+}
+
+
+# Patterns used when validating SKILL.md frontmatter
+_NAME_FIELD_PATTERN = re.compile(r'name:\s*(.+)')
+_HYPHEN_CASE_PATTERN = re.compile(r'^[a-z0-9-]+$')
+
+# Directories never searched for skills by validate_all
+_VALIDATE_SKIP_DIRS = {"node_modules", "__pycache__"}
+
+# Maximum number of SKILL.md paths and content hashes remembered by _check_skill
+_VALIDATION_CACHE_SIZE = 4096
+
+# Number of locks install paths are hashed onto by _install_lock
+_INSTALL_LOCK_STRIPES = 64
+
+# Hidden directory inside each install directory where skill trees are staged
+STAGING_DIR_NAME = ".staging"
+
+
+def to_json(payload: Any) -> str:
+    """
+    Serialize a response payload as compact JSON.
+
+    Args:
+        payload: JSON-serializable response data
+
+    Returns:
+        JSON string without insignificant whitespace
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
 
 class SkillManager:
     """Manages OpenCode skills operations."""
@@ -18,6 +79,18 @@ class SkillManager:
     def __init__(self):
         """Initialize skill manager with configuration."""
         self.config = get_config()
+        self._search_index: Optional[SkillSearchIndex] = None
+        self._search_index_lock = threading.Lock()
+        self._recommender: Optional[SkillRecommender] = None
+        self._recommender_lock = threading.Lock()
+        self.store = SkillStore()
+        self._install_locks = tuple(threading.Lock() for _ in range(_INSTALL_LOCK_STRIPES))
+        # SKILL.md path -> (mtime_ns, size, content digest), least recently used first
+        self._validation_digests: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        # SKILL.md content digest -> validation result, least recently used first
+        self._validation_cache: OrderedDict[str, tuple[str, str] | None] = OrderedDict()
+        self._validation_cache_lock = threading.Lock()
+        self._clean_staging()
         self.combinations = {
             "content-pipeline": {
                 "name": "Content Creation Pipeline",
@@ -58,11 +131,141 @@ class SkillManager:
             }
         }
 
+    def warmup(self) -> None:
+        """Preload skills metadata so the first tool call does not pay for parsing."""
+        metadata = self.config.load_skills_metadata()
+        self._get_search_index(metadata)
+        self._get_recommender(metadata)
+        logger.info(f"SkillManager warmed up with {len(metadata)} skills")
+
+    def close(self) -> None:
+        """Release cached state held by the manager."""
+        self.config.invalidate_metadata_cache()
+        self._search_index = None
+        self._recommender = None
+        logger.info("SkillManager shut down")
+
+    def _get_search_index(self, metadata: dict[str, Any]) -> SkillSearchIndex:
+        """
+        Get the search index for the given metadata, rebuilding it if the metadata was reloaded.
+
+        Args:
+            metadata: Skills metadata as returned by Config.load_skills_metadata
+
+        Returns:
+            SkillSearchIndex built from metadata
+        """
+        with self._search_index_lock:
+            if self._search_index is None or self._search_index.source is not metadata:
+                self._search_index = SkillSearchIndex(metadata)
+            return self._search_index
+
+    def _get_recommender(self, metadata: dict[str, Any]) -> SkillRecommender:
+        """
+        Get the recommender for the given metadata, rebuilding it if the metadata was reloaded.
+
+        Args:
+            metadata: Skills metadata as returned by Config.load_skills_metadata
+
+        Returns:
+            SkillRecommender built from metadata and the workflow combinations
+        """
+        with self._recommender_lock:
+            if self._recommender is None or self._recommender.source is not metadata:
+                self._recommender = SkillRecommender(metadata, self.combinations)
+            return self._recommender
+
+    @staticmethod
+    def _respond(output_format: str, markdown: str, payload: dict[str, Any]) -> str:
+        """
+        Pick the response matching the requested output format.
+
+        Args:
+            output_format: 'markdown' or 'json'
+            markdown: Human-readable response
+            payload: Structured response data
+
+        Returns:
+            Markdown string, or compact JSON if output_format is 'json'
+        """
+        if output_format == "json":
+            return to_json(payload)
+        return markdown
+
+    def _render_page(
+        self,
+        header: str,
+        items: list[Any],
+        to_record: Callable[[Any], dict[str, Any]],
+        render_record: Callable[[dict[str, Any]], str],
+        offset: int = 0,
+        limit: int | None = None,
+        output_format: str = "markdown",
+        key: str = "results"
+    ) -> str:
+        """
+        Render one page of a list response.
+
+        Items from offset onwards are rendered until limit items have been
+        shown or the next one would exceed the character limit. When items
+        remain, a markdown footer (or 'next_offset' in JSON) gives the offset
+        of the next page.
+
+        Args:
+            header: Markdown heading placed above the items
+            items: Full list of items to page through
+            to_record: Function turning one item into its structured record
+            render_record: Function rendering one record as markdown
+            offset: Index of the first item to show
+            limit: Maximum number of items to show (default: as many as fit)
+            output_format: 'markdown' or 'json'
+            key: Name of the results list in JSON output
+
+        Returns:
+            Formatted markdown page, or compact JSON page
+        """
+        json_output = output_format == "json"
+        total = len(items)
+        if offset >= total and not json_output:
+            return f"{header}No more results (offset {offset}, {total} total)."
+
+        stop = total if limit is None else min(total, offset + limit)
+        sections = []
+        size = len(header)
+        end = offset
+
+        while end < stop:
+            record = to_record(items[end])
+            section = to_json(record) if json_output else render_record(record)
+            if end > offset and size + len(section) > self.config.character_limit:
+                break
+            sections.append(section)
+            size += len(section)
+            end += 1
+
+        if end < total:
+            logger.debug(f"Returning items {offset}-{end} of {total}")
+
+        if json_output:
+            next_offset = end if end < total else None
+            return (
+                f'{{"{key}":[{",".join(sections)}],"offset":{offset},'
+                f'"total":{total},"next_offset":{to_json(next_offset)}}}'
+            )
+
+        if end < total:
+            sections.append(f"*Showing {offset + 1}-{end} of {total}. Use offset={end} for the next page.*\n")
+
+        return header + "".join(sections)
+
     def list_skills(
         self,
         category: str | None = None,
         depth: str | None = None,
-        installed_only: bool = False
+        installed_only: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+        output_format: str = "markdown"
     ) -> str:
         """
         List available skills with optional filtering.
@@ -71,9 +274,12 @@ class SkillManager:
             category: Filter by category
             depth: Filter by depth
             installed_only: Only show installed skills
+            offset: Index of the first skill to show
+            limit: Maximum number of skills to show
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted markdown string of skills
+            Formatted markdown string of skills, or JSON with a 'skills' list
         """
         metadata = self.config.load_skills_metadata()
 
@@ -88,85 +294,200 @@ class SkillManager:
             metadata = {k: v for k, v in metadata.items() if v.get("depth") == depth}
             logger.debug(f"Filtered to {len(metadata)} skills by depth '{depth}'")
 
+        installed_skills = self.config.get_installed_skills()
+
         if installed_only:
-            metadata = {k: v for k, v in metadata.items() if self.config.is_skill_installed(k)}
+            metadata = {k: v for k, v in metadata.items() if k in installed_skills}
             logger.debug(f"Filtered to {len(metadata)} installed skills")
 
         if not metadata:
             logger.warning("No skills found matching criteria")
-            return "# Skills\n\nNo skills found matching your criteria."
-
-        result = "# Available OpenCode Skills\n\n"
-
-        for skill_name, skill_data in metadata.items():
-            installed_mark = " ✅" if self.config.is_skill_installed(skill_name) else ""
-            depth_icon = "📖" if skill_data.get("depth") == "Comprehensive" else "📄"
-
-            result += f"## {depth_icon} {skill_name}{installed_mark}\n\n"
-            result += f"**Description**: {skill_data.get('description', 'N/A')}\n\n"
-            result += f"**Category**: {skill_data.get('category', 'N/A')}\n\n"
-            result += f"**Depth**: {skill_data.get('depth', 'N/A')}\n\n"
-            result += f"**Lines**: {skill_data.get('lines', 'N/A')}\n\n"
-            result += f"**Prerequisites**: {skill_data.get('prerequisites', 'None')}\n\n"
-            result += "---\n\n"
-
-        # Truncate if too long
-        if len(result) > self.config.character_limit:
-            logger.warning(f"Output truncated from {len(result)} to {self.config.character_limit}")
-            result = result[:self.config.character_limit] + "\n\n[Output truncated due to length limit]"
-
-        return result
+            if output_format != "json":
+                return "# Skills\n\nNo skills found matching your criteria."
+
+        def to_record(item: tuple[str, dict[str, Any]]) -> dict[str, Any]:
+            skill_name, skill_data = item
+            return {
+                "name": skill_name,
+                "description": skill_data.get('description'),
+                "category": skill_data.get('category'),
+                "depth": skill_data.get('depth'),
+                "lines": skill_data.get('lines'),
+                "prerequisites": skill_data.get('prerequisites'),
+                "installed": skill_name in installed_skills,
+            }
 
-    def get_skill_info(self, skill_name: str) -> str:
+        def render_record(record: dict[str, Any]) -> str:
+            installed_mark = " ✅" if record["installed"] else ""
+            depth_icon = "📖" if record["depth"] == "Comprehensive" else "📄"
+            return "".join([
+                f"## {depth_icon} {record['name']}{installed_mark}\n\n",
+                f"**Description**: {record['description'] or 'N/A'}\n\n",
+                f"**Category**: {record['category'] or 'N/A'}\n\n",
+                f"**Depth**: {record['depth'] or 'N/A'}\n\n",
+                f"**Lines**: {record['lines'] or 'N/A'}\n\n",
+                f"**Prerequisites**: {record['prerequisites'] or 'None'}\n\n",
+                "---\n\n",
+            ])
+
+        return self._render_page(
+            "# Available OpenCode Skills\n\n", list(metadata.items()), to_record, render_record,
+            offset, limit, output_format, key="skills"
+        )
+
+    def get_skill_info(self, skill_name: str, output_format: str = "markdown") -> str:
         """
         Get detailed information about a specific skill.
 
         Args:
             skill_name: Name of the skill
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted markdown string with skill details
+            Formatted markdown string with skill details, or JSON record
         """
         metadata = self.config.load_skills_metadata()
 
         if skill_name not in metadata:
             logger.warning(f"Skill '{skill_name}' not found")
-            return f"# Error\n\nSkill '{skill_name}' not found. Use list_skills to see available skills."
+            message = f"Skill '{skill_name}' not found. Use list_skills to see available skills."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
 
         skill_data = metadata[skill_name]
-        installed_status = "✅ Installed" if self.config.is_skill_installed(skill_name) else "⬜ Not installed"
+        is_installed = self.config.is_skill_installed(skill_name)
+        record = {
+            "name": skill_name,
+            "installed": is_installed,
+            "description": skill_data.get('description'),
+            "category": skill_data.get('category'),
+            "depth": skill_data.get('depth'),
+            "lines": skill_data.get('lines'),
+            "prerequisites": skill_data.get('prerequisites'),
+            "keywords": skill_data.get('keywords', []),
+            "location": str(self.config.opencode_global / skill_name) if is_installed else None,
+        }
 
-        result = f"# {skill_name}\n\n"
-        result += f"**Status**: {installed_status}\n\n"
-        result += f"**Description**: {skill_data.get('description', 'N/A')}\n\n"
-        result += f"**Category**: {skill_data.get('category', 'N/A')}\n\n"
-        result += f"**Depth**: {skill_data.get('depth', 'N/A')}\n\n"
-        result += f"**Documentation Lines**: {skill_data.get('lines', 'N/A')}\n\n"
-        result += f"**Prerequisites**:\n```\n{skill_data.get('prerequisites', 'None')}\n```\n\n"
-        result += f"**Keywords**: {', '.join(skill_data.get('keywords', []))}\n\n"
+        logger.debug(f"Returning info for skill '{skill_name}'")
+        if output_format == "json":
+            return to_json(record)
+
+        installed_status = "✅ Installed" if is_installed else "⬜ Not installed"
+        parts = [
+            f"# {skill_name}\n\n",
+            f"**Status**: {installed_status}\n\n",
+            f"**Description**: {record['description'] or 'N/A'}\n\n",
+            f"**Category**: {record['category'] or 'N/A'}\n\n",
+            f"**Depth**: {record['depth'] or 'N/A'}\n\n",
+            f"**Documentation Lines**: {record['lines'] or 'N/A'}\n\n",
+            f"**Prerequisites**:\n```\n{record['prerequisites'] or 'None'}\n```\n\n",
+            f"**Keywords**: {', '.join(record['keywords'])}\n\n",
+        ]
+        if is_installed:
+            parts.append(f"**Location**: {record['location']}\n\n")
+
+        return "".join(parts)
+
+    @contextmanager
+    def _install_lock(self, dest_path: Path) -> Iterator[None]:
+        """
+        Serialize installs, upgrades and uninstalls of the same install path.
 
-        if self.config.is_skill_installed(skill_name):
-            result += f"**Location**: {self.config.opencode_global / skill_name}\n\n"
+        Paths are hashed onto a fixed set of locks, so memory use does not
+        grow with the number of paths; two paths sharing a lock merely take
+        turns. Callers must not hold one install lock while taking another.
 
-        logger.debug(f"Returning info for skill '{skill_name}'")
-        return result
+        Args:
+            dest_path: Installation path of the skill
+        """
+        lock = self._install_locks[hash(dest_path.absolute()) % _INSTALL_LOCK_STRIPES]
+        with lock:
+            yield
+
+    def _clean_staging(self) -> None:
+        """Remove staging directories left behind by installs that were interrupted."""
+        for scope in ("global", "project"):
+            staging_dir = self.config.get_install_dir(scope) / STAGING_DIR_NAME
+            if staging_dir.is_dir():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                logger.debug(f"Removed stale staging directory {staging_dir}")
+
+    def _install_tree(self, skill_path: Path, dest_path: Path, mode: str = "copy") -> None:
+        """
+        Place a skill tree at its install path atomically.
 
-    def install_skill(self, skill_name: str, scope: str = "global") -> str:
+        The tree is staged in the install directory's hidden .staging
+        directory, on the same filesystem as the destination, and renamed into
+        place, so a failed install never leaves a partially populated skill
+        directory behind.
+
+        Args:
+            skill_path: Source skill directory
+            dest_path: Final installation path
+            mode: 'copy' duplicates every file; 'link' reflinks or hardlinks
+                files where the filesystem allows and copies the rest;
+                'symlink' points dest_path at the source tree
+
+        Raises:
+            FileExistsError: If dest_path appeared while staging
+            OSError: If copying, linking or renaming fails
+        """
+        staging_dir = dest_path.parent / STAGING_DIR_NAME
+        staging_dir.mkdir(exist_ok=True)
+
+        if mode == "symlink":
+            staging_path = staging_dir / f"{dest_path.name}-{os.getpid()}-{threading.get_ident()}"
+            os.symlink(skill_path.resolve(), staging_path, target_is_directory=True)
+            try:
+                if dest_path.exists():
+                    raise FileExistsError(f"'{dest_path}' already exists")
+                os.rename(staging_path, dest_path)
+            except BaseException:
+                staging_path.unlink(missing_ok=True)
+                raise
+            return
+
+        copy_function = link_or_copy_file if mode == "link" else shutil.copy2
+        staging_path = Path(tempfile.mkdtemp(prefix=f"{dest_path.name}-", dir=staging_dir))
+        try:
+            shutil.copytree(skill_path, staging_path, copy_function=copy_function, dirs_exist_ok=True)
+            self.store.write_manifest(staging_path, self.store.build_manifest(skill_path))
+            if dest_path.exists():
+                raise FileExistsError(f"'{dest_path}' already exists")
+            os.rename(staging_path, dest_path)
+        except BaseException:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise
+
+    def install_skill(
+        self,
+        skill_name: str,
+        scope: str = "global",
+        mode: str = "copy",
+        output_format: str = "markdown"
+    ) -> str:
         """
         Install an OpenCode skill.
 
         Args:
             skill_name: Name of the skill to install
             scope: 'global' or 'project'
+            mode: 'copy', 'link' or 'symlink'
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted result string
+            Formatted result string, or JSON result
         """
+        if mode not in INSTALL_MODES:
+            logger.error(f"Invalid install mode '{mode}'")
+            message = f"Invalid install mode '{mode}'. Use one of: {', '.join(INSTALL_MODES)}."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
+
         metadata = self.config.load_skills_metadata()
 
         if skill_name not in metadata:
             logger.error(f"Skill '{skill_name}' not found in metadata")
-            return f"# Error\n\nSkill '{skill_name}' not found. Use list_skills to see available skills."
+            message = f"Skill '{skill_name}' not found. Use list_skills to see available skills."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
 
         install_dir = self.config.get_install_dir(scope)
         install_dir.mkdir(parents=True, exist_ok=True)
@@ -175,166 +496,389 @@ class SkillManager:
 
         if not skill_path.exists():
             logger.error(f"Skill directory not found: {skill_path}")
-            return f"# Error\n\nSkill directory '{skill_name}' not found in skills directory."
+            message = f"Skill directory '{skill_name}' not found in skills directory."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
 
         dest_path = install_dir / skill_name
 
-        if dest_path.exists():
-            logger.warning(f"Skill '{skill_name}' already installed at {dest_path}")
-            return f"# Installation Skipped\n\nSkill '{skill_name}' is already installed at {dest_path}"
-
-        try:
-            shutil.copytree(skill_path, dest_path)
-            logger.info(f"Successfully installed '{skill_name}' to {dest_path}")
-
-            result = f"✅ Successfully installed '{skill_name}'\n\n"
-            result += f"**Location**: {dest_path}\n"
-            result += f"**Scope**: {scope}\n\n"
-            result += f"**Prerequisites**: {metadata[skill_name].get('prerequisites', 'None')}\n\n"
-            result += "Note: Restart OpenCode to load the new skill."
-            return result
-        except Exception as e:
-            logger.error(f"Failed to install '{skill_name}': {e}")
-            return f"# Error\n\n❌ Failed to install '{skill_name}': {str(e)}"
+        with self._install_lock(dest_path):
+            if dest_path.exists():
+                logger.warning(f"Skill '{skill_name}' already installed at {dest_path}")
+                return self._respond(
+                    output_format,
+                    f"# Installation Skipped\n\nSkill '{skill_name}' is already installed at {dest_path}\n\n"
+                    "Use upgrade_skills to update it in place.",
+                    {"skill": skill_name, "status": "already_installed", "location": str(dest_path)}
+                )
+
+            try:
+                self._install_tree(skill_path, dest_path, mode)
+            except Exception as e:
+                logger.error(f"Failed to install '{skill_name}': {e}")
+                return self._respond(
+                    output_format,
+                    f"# Error\n\n❌ Failed to install '{skill_name}': {str(e)}",
+                    {"skill": skill_name, "status": "failed", "error": str(e)}
+                )
+
+        logger.info(f"Successfully installed '{skill_name}' to {dest_path} (mode: {mode})")
+        prerequisites = metadata[skill_name].get('prerequisites', 'None')
+
+        return self._respond(
+            output_format,
+            "".join([
+                f"✅ Successfully installed '{skill_name}'\n\n",
+                f"**Location**: {dest_path}\n",
+                f"**Scope**: {scope}\n",
+                f"**Mode**: {mode}\n\n",
+                f"**Prerequisites**: {prerequisites}\n\n",
+                "Note: Restart OpenCode to load the new skill.",
+            ]),
+            {
+                "skill": skill_name,
+                "status": "installed",
+                "location": str(dest_path),
+                "scope": scope,
+                "mode": mode,
+                "prerequisites": prerequisites,
+            }
+        )
 
-    def uninstall_skill(self, skill_name: str, scope: str = "global") -> str:
+    def uninstall_skill(self, skill_name: str, scope: str = "global", output_format: str = "markdown") -> str:
         """
         Uninstall an OpenCode skill.
 
         Args:
             skill_name: Name of the skill to uninstall
             scope: 'global' or 'project'
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted result string
+            Formatted result string, or JSON result
         """
         install_dir = self.config.get_install_dir(scope)
         skill_path = install_dir / skill_name
 
-        if not skill_path.exists():
-            logger.warning(f"Skill '{skill_name}' not installed")
-            return f"# Error\n\nSkill '{skill_name}' is not installed."
-
-        try:
-            shutil.rmtree(skill_path)
-            logger.info(f"Successfully uninstalled '{skill_name}' from {skill_path}")
-
-            result = f"✅ Successfully uninstalled '{skill_name}'\n\n"
-            result += f"**Location removed**: {skill_path}\n"
-            result += "Note: Restart OpenCode to update the skill list."
-            return result
-        except Exception as e:
-            logger.error(f"Failed to uninstall '{skill_name}': {e}")
-            return f"# Error\n\n❌ Failed to uninstall '{skill_name}': {str(e)}"
-
-    def search_skills(self, query: str) -> str:
+        with self._install_lock(skill_path):
+            if not skill_path.exists() and not skill_path.is_symlink():
+                logger.warning(f"Skill '{skill_name}' not installed")
+                message = f"Skill '{skill_name}' is not installed."
+                return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
+
+            try:
+                if skill_path.is_symlink():
+                    skill_path.unlink()
+                else:
+                    shutil.rmtree(skill_path)
+            except Exception as e:
+                logger.error(f"Failed to uninstall '{skill_name}': {e}")
+                return self._respond(
+                    output_format,
+                    f"# Error\n\n❌ Failed to uninstall '{skill_name}': {str(e)}",
+                    {"skill": skill_name, "status": "failed", "error": str(e)}
+                )
+
+        logger.info(f"Successfully uninstalled '{skill_name}' from {skill_path}")
+        return self._respond(
+            output_format,
+            "".join([
+                f"✅ Successfully uninstalled '{skill_name}'\n\n",
+                f"**Location removed**: {skill_path}\n",
+                "Note: Restart OpenCode to update the skill list.",
+            ]),
+            {"skill": skill_name, "status": "uninstalled", "location": str(skill_path)}
+        )
+
+    def search_skills(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int | None = None,
+        output_format: str = "markdown"
+    ) -> str:
         """
         Search for skills by keywords or description.
 
+        Matches whole words or word prefixes in the skill name, keywords,
+        category and description, ranked by relevance.
+
         Args:
             query: Search query string
+            offset: Index of the first match to show
+            limit: Maximum number of matches to show
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted markdown string of matches
+            Formatted markdown string of matches, or JSON with a 'skills' list, best match first
         """
         metadata = self.config.load_skills_metadata()
-        query_lower = query.lower()
 
         logger.debug(f"Searching for skills with query: {query}")
 
-        matches = []
-        for skill_name, skill_data in metadata.items():
-            description = skill_data.get('description', '').lower()
-            keywords = [k.lower() for k in skill_data.get('keywords', [])]
-            category = skill_data.get('category', '').lower()
-
-            if (query_lower in description or
-                any(query_lower in k for k in keywords) or
-                query_lower in category or
-                query_lower in skill_name.lower()):
-                matches.append((skill_name, skill_data))
+        ranked = self._get_search_index(metadata).search(query)
 
-        logger.debug(f"Found {len(matches)} matching skills")
+        logger.debug(f"Found {len(ranked)} matching skills")
 
-        if not matches:
+        if not ranked and output_format != "json":
             return f"# Search Results\n\nNo skills found matching '{query}'. Try different keywords."
 
-        result = f"# Search Results for '{query}'\n\n"
-
-        for skill_name, skill_data in matches:
-            installed_mark = " ✅" if self.config.is_skill_installed(skill_name) else ""
-            result += f"## {skill_name}{installed_mark}\n\n"
-            result += f"**Category**: {skill_data.get('category', 'N/A')}\n\n"
-            result += f"**Description**: {skill_data.get('description', 'N/A')}\n\n"
-            result += "---\n\n"
-
-        if len(result) > self.config.character_limit:
-            logger.warning(f"Search output truncated from {len(result)} to {self.config.character_limit}")
-            result = result[:self.config.character_limit] + "\n\n[Output truncated due to length limit]"
-
-        return result
+        installed_skills = self.config.get_installed_skills()
+
+        def to_record(item: tuple[str, float]) -> dict[str, Any]:
+            skill_name, score = item
+            skill_data = metadata[skill_name]
+            return {
+                "name": skill_name,
+                "category": skill_data.get('category'),
+                "description": skill_data.get('description'),
+                "installed": skill_name in installed_skills,
+                "score": round(score, 4),
+            }
 
-    def validate_skill(self, skill_path_str: str) -> str:
+        def render_record(record: dict[str, Any]) -> str:
+            installed_mark = " ✅" if record["installed"] else ""
+            return "".join([
+                f"## {record['name']}{installed_mark}\n\n",
+                f"**Category**: {record['category'] or 'N/A'}\n\n",
+                f"**Description**: {record['description'] or 'N/A'}\n\n",
+                "---\n\n",
+            ])
+
+        return self._render_page(
+            f"# Search Results for '{query}'\n\n", ranked, to_record, render_record,
+            offset, limit, output_format, key="skills"
+        )
+
+    def _check_skill(self, skill_path: Path) -> tuple[str, str] | None:
         """
-        Validate a skill's SKILL.md file structure.
+        Check a skill's SKILL.md file structure.
+
+        Results are cached by SKILL.md content hash. The hash of each path
+        is remembered with the file's mtime and size, so unchanged files are
+        not re-read; a file whose mtime or size changed is read and hashed
+        once, and only parsed if that content has not been checked before.
+        The caches keep the most recently used _VALIDATION_CACHE_SIZE entries.
 
         Args:
-            skill_path_str: Path string to skill directory
+            skill_path: Path to skill directory
 
         Returns:
-            Formatted validation result string
+            None if valid, otherwise a (kind, message) tuple where kind is
+            'error' if SKILL.md could not be read and 'invalid' if its
+            structure is wrong
         """
-        skill_path = Path(skill_path_str)
         skill_md = skill_path / "SKILL.md"
+        key = str(skill_md)
 
-        if not skill_md.exists():
+        try:
+            stat = skill_md.stat()
+        except FileNotFoundError:
             logger.error(f"SKILL.md not found at {skill_md}")
-            return f"# Validation Error\n\nSKILL.md not found at {skill_md}"
+            return "error", f"SKILL.md not found at {skill_md}"
+        except OSError as e:
+            logger.error(f"Failed to read SKILL.md: {e}")
+            return "error", f"Failed to read SKILL.md: {str(e)}"
+
+        with self._validation_cache_lock:
+            known = self._validation_digests.get(key)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size) and known[2] in self._validation_cache:
+                self._validation_digests.move_to_end(key)
+                self._validation_cache.move_to_end(known[2])
+                return self._validation_cache[known[2]]
 
         try:
-            with open(skill_md, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(skill_md, 'rb') as f:
+                data = f.read()
+            content = data.decode('utf-8')
         except Exception as e:
             logger.error(f"Failed to read SKILL.md: {e}")
-            return f"# Validation Error\n\nFailed to read SKILL.md: {str(e)}"
+            return "error", f"Failed to read SKILL.md: {str(e)}"
+
+        digest = hashlib.sha256(data).hexdigest()
+        with self._validation_cache_lock:
+            self._validation_digests[key] = (stat.st_mtime_ns, stat.st_size, digest)
+            self._validation_digests.move_to_end(key)
+            while len(self._validation_digests) > _VALIDATION_CACHE_SIZE:
+                self._validation_digests.popitem(last=False)
+            if digest in self._validation_cache:
+                self._validation_cache.move_to_end(digest)
+                return self._validation_cache[digest]
+
+        problem = self._check_skill_content(content)
+        with self._validation_cache_lock:
+            self._validation_cache[digest] = problem
+            self._validation_cache.move_to_end(digest)
+            while len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+
+        if problem is None:
+            logger.debug(f"Skill at {skill_path} is valid")
+        return problem
+
+    @staticmethod
+    def _check_skill_content(content: str) -> tuple[str, str] | None:
+        """
+        Check the frontmatter of SKILL.md content.
 
+        Args:
+            content: SKILL.md text
+
+        Returns:
+            None if valid, otherwise an ('invalid', message) tuple
+        """
         # Check for YAML frontmatter
         if not content.startswith('---'):
-            return "# Validation Error\n\n❌ Invalid: Missing YAML frontmatter (must start with '---')"
+            return "invalid", "Missing YAML frontmatter (must start with '---')"
 
         # Check for required fields
         frontmatter_end = content.find('---', 3)
         if frontmatter_end == -1:
-            return "# Validation Error\n\n❌ Invalid: Missing closing '---' in YAML frontmatter"
+            return "invalid", "Missing closing '---' in YAML frontmatter"
 
         frontmatter = content[:frontmatter_end]
         required_fields = ['name', 'description']
         missing_fields = [field for field in required_fields if field not in frontmatter]
 
         if missing_fields:
-            return f"# Validation Error\n\n❌ Invalid: Missing required YAML fields: {', '.join(missing_fields)}"
+            return "invalid", f"Missing required YAML fields: {', '.join(missing_fields)}"
 
         # Check skill name format
-        name_match = re.search(r'name:\s*(.+)', frontmatter)
+        name_match = _NAME_FIELD_PATTERN.search(frontmatter)
         if name_match:
             skill_name = name_match.group(1).strip()
-            if ' ' in skill_name or not re.match(r'^[a-z0-9-]+$', skill_name):
-                error_msg = f"❌ Invalid: Skill name '{skill_name}' should be hyphen-case (no spaces, lowercase letters, numbers, hyphens)"
+            if ' ' in skill_name or not _HYPHEN_CASE_PATTERN.match(skill_name):
                 logger.error(f"Invalid skill name format: {skill_name}")
-                return f"# Validation Error\n\n{error_msg}"
+                return "invalid", (
+                    f"Skill name '{skill_name}' should be hyphen-case "
+                    "(no spaces, lowercase letters, numbers, hyphens)"
+                )
 
-        logger.info(f"Skill at {skill_path} is valid")
-        return "# Validation Result\n\n✅ Valid: Skill SKILL.md structure is correct"
+        return None
 
-    def get_combinations(self, category: str | None = None) -> str:
+    def validate_skill(self, skill_path_str: str, output_format: str = "markdown") -> str:
+        """
+        Validate a skill's SKILL.md file structure.
+
+        Args:
+            skill_path_str: Path string to skill directory
+            output_format: 'markdown' or 'json'
+
+        Returns:
+            Formatted validation result string, or JSON result
+        """
+        skill_path = Path(skill_path_str)
+        problem = self._check_skill(skill_path)
+
+        if problem is None:
+            return self._respond(
+                output_format,
+                "# Validation Result\n\n✅ Valid: Skill SKILL.md structure is correct",
+                {"path": str(skill_path), "valid": True}
+            )
+
+        kind, message = problem
+        markdown_message = f"❌ Invalid: {message}" if kind == "invalid" else message
+        return self._respond(
+            output_format,
+            f"# Validation Error\n\n{markdown_message}",
+            {"path": str(skill_path), "valid": False, "error": message}
+        )
+
+    def find_skills(self, root: Path) -> list[Path]:
+        """
+        Find every skill directory (one containing SKILL.md) under a root.
+
+        Hidden directories, node_modules and __pycache__ are skipped.
+
+        Args:
+            root: Directory to search
+
+        Returns:
+            Sorted list of skill directories
+        """
+        skill_paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in _VALIDATE_SKIP_DIRS]
+            if "SKILL.md" in filenames:
+                skill_paths.append(Path(dirpath))
+        return sorted(skill_paths)
+
+    def validate_all(self, root_str: str, output_format: str = "markdown") -> tuple[str, bool]:
+        """
+        Validate every skill under a directory tree in parallel.
+
+        Args:
+            root_str: Path string to the directory to search
+            output_format: 'markdown' or 'json'
+
+        Returns:
+            Tuple of (aggregated report, True if every skill is valid)
+        """
+        root = Path(root_str)
+        if not root.is_dir():
+            logger.error(f"Validation root not found: {root}")
+            message = f"Directory not found: {root}"
+            return self._respond(output_format, f"# Validation Error\n\n{message}", {"error": message}), False
+
+        skill_paths = self.find_skills(root)
+        with ThreadPoolExecutor(max_workers=self.config.validate_workers) as executor:
+            problems = list(executor.map(self._check_skill, skill_paths))
+
+        results = []
+        for skill_path, problem in zip(skill_paths, problems):
+            result: dict[str, Any] = {"path": str(skill_path), "valid": problem is None}
+            if problem is not None:
+                result["error"] = problem[1]
+            results.append(result)
+
+        invalid = [result for result in results if not result["valid"]]
+        all_valid = not invalid
+        logger.info(f"Validated {len(results)} skills under {root}: {len(invalid)} invalid")
+
+        if output_format == "json":
+            return to_json({
+                "root": str(root),
+                "total": len(results),
+                "valid": len(results) - len(invalid),
+                "invalid": len(invalid),
+                "results": results,
+            }), all_valid
+
+        if not results:
+            return f"# Validation Report\n\nNo skills (SKILL.md files) found under {root}.", True
+
+        parts = [
+            "# Validation Report\n\n",
+            f"**Root**: {root}\n\n",
+            f"**Summary**: {len(results)} skills checked, {len(results) - len(invalid)} valid, {len(invalid)} invalid\n\n",
+        ]
+        if invalid:
+            parts.append("## ❌ Invalid\n\n")
+            parts.extend(f"- {result['path']}: {result['error']}\n" for result in invalid)
+            parts.append("\n")
+        parts.append("## ✅ Valid\n\n")
+        parts.extend(f"- {result['path']}\n" for result in results if result["valid"])
+
+        return "".join(parts), all_valid
+
+    def get_combinations(
+        self,
+        category: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        output_format: str = "markdown"
+    ) -> str:
         """
         Get recommended skill combinations.
 
         Args:
             category: Filter by workflow category
+            offset: Index of the first combination to show
+            limit: Maximum number of combinations to show
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted markdown string of combinations
+            Formatted markdown string of combinations, or JSON with a 'workflows' list
         """
         combinations = self.combinations.copy()
 
@@ -344,48 +888,161 @@ class SkillManager:
 
         if not combinations:
             logger.warning("No combinations found")
-            return "# Skill Combinations\n\nNo combinations found matching your criteria."
-
-        result = "# Recommended Skill Combinations\n\n"
-
-        for combo_key, combo_data in combinations.items():
-            result += f"## {combo_data['name']}\n\n"
-            result += f"**Description**: {combo_data['description']}\n\n"
-            result += f"**Category**: {combo_data.get('category', 'N/A')}\n\n"
-            result += f"**Skills**: {', '.join(combo_data['skills'])}\n\n"
-
-            # Check which skills are installed
-            installed = [s for s in combo_data['skills'] if self.config.is_skill_installed(s)]
-            missing = [s for s in combo_data['skills'] if not self.config.is_skill_installed(s)]
+            if output_format != "json":
+                return "# Skill Combinations\n\nNo combinations found matching your criteria."
+
+        installed_skills = self.config.get_installed_skills()
+
+        def to_record(item: tuple[str, dict[str, Any]]) -> dict[str, Any]:
+            combo_key, combo_data = item
+            return {
+                "workflow": combo_key,
+                "name": combo_data['name'],
+                "description": combo_data['description'],
+                "category": combo_data.get('category'),
+                "skills": combo_data['skills'],
+                "installed": [s for s in combo_data['skills'] if s in installed_skills],
+                "missing": [s for s in combo_data['skills'] if s not in installed_skills],
+            }
 
-            if installed:
-                result += f"**Already installed**: {', '.join(installed)}\n\n"
-            if missing:
-                result += f"**Need to install**: {', '.join(missing)}\n\n"
+        def render_record(record: dict[str, Any]) -> str:
+            parts = [
+                f"## {record['name']}\n\n",
+                f"**Description**: {record['description']}\n\n",
+                f"**Category**: {record['category'] or 'N/A'}\n\n",
+                f"**Skills**: {', '.join(record['skills'])}\n\n",
+            ]
+            if record["installed"]:
+                parts.append(f"**Already installed**: {', '.join(record['installed'])}\n\n")
+            if record["missing"]:
+                parts.append(f"**Need to install**: {', '.join(record['missing'])}\n\n")
+
+            parts.append(f"**Install workflow**: `install_workflow --workflow-name {record['workflow']}`\n\n")
+            parts.append("---\n\n")
+            return "".join(parts)
+
+        return self._render_page(
+            "# Recommended Skill Combinations\n\n", list(combinations.items()), to_record, render_record,
+            offset, limit, output_format, key="workflows"
+        )
+
+    def recommend_workflows(
+        self,
+        goal: str | None = None,
+        installed_skills: list[str] | None = None,
+        limit: int = 5,
+        output_format: str = "markdown"
+    ) -> str:
+        """
+        Rank workflows and skills for a goal and/or a set of installed skills.
 
-            result += f"**Install workflow**: `install_workflow --workflow-name {combo_key}`\n\n"
-            result += "---\n\n"
+        Args:
+            goal: Free-text description of what the user wants to do
+            installed_skills: Skills to recommend from (default: currently installed skills)
+            limit: Maximum number of workflows and of skills to return
+            output_format: 'markdown' or 'json'
 
-        if len(result) > self.config.character_limit:
-            logger.warning(f"Combinations output truncated from {len(result)} to {self.config.character_limit}")
-            result = result[:self.config.character_limit] + "\n\n[Output truncated due to length limit]"
+        Returns:
+            Formatted markdown string, or JSON with ranked 'workflows' and 'skills' lists
+        """
+        metadata = self.config.load_skills_metadata()
+        installed = set(installed_skills) if installed_skills is not None else self.config.get_installed_skills()
+
+        ranked = self._get_recommender(metadata).recommend(installed, goal, limit)
+        logger.debug(
+            f"Recommended {len(ranked['workflows'])} workflows and {len(ranked['skills'])} skills "
+            f"for goal={goal!r} with {len(installed)} installed skills"
+        )
+
+        for record in ranked["skills"]:
+            skill_data = metadata[record["name"]]
+            record["category"] = skill_data.get('category')
+            record["description"] = skill_data.get('description')
+
+        parts = ["# Recommendations\n\n"]
+        if goal:
+            parts.append(f"**Goal**: {goal}\n\n")
+
+        parts.append("## Workflows\n\n")
+        for i, record in enumerate(ranked["workflows"], 1):
+            missing = ', '.join(record["missing"]) if record["missing"] else "nothing, all installed"
+            parts.append(
+                f"{i}. **{record['name']}** (`{record['workflow']}`, score {record['score']:.2f}) "
+                f"- need to install: {missing}\n"
+            )
+
+        parts.append("\n## Skills\n\n")
+        if not ranked["skills"]:
+            parts.append("No related skills found. Describe your goal to get suggestions.\n")
+        for i, record in enumerate(ranked["skills"], 1):
+            parts.append(
+                f"{i}. **{record['name']}** (score {record['score']:.2f}) "
+                f"- {record['description'] or 'N/A'}\n"
+            )
+
+        return self._respond(output_format, "".join(parts), ranked)
+
+    def refresh_catalog(self, output_format: str = "markdown") -> str:
+        """
+        Rebuild skills metadata from the SKILL.md frontmatter under the skills directory.
 
-        return result
+        Args:
+            output_format: 'markdown' or 'json'
 
-    def install_workflow(self, workflow_name: str, scope: str = "global") -> str:
+        Returns:
+            Formatted result string, or JSON result
+        """
+        try:
+            stats = self.config.refresh_catalog()
+        except Exception as e:
+            logger.error(f"Failed to refresh catalog: {e}")
+            message = f"Failed to refresh catalog: {str(e)}"
+            return self._respond(output_format, f"# Error\n\n❌ {message}", {"error": message})
+
+        return self._respond(
+            output_format,
+            "".join([
+                "# Catalog Refreshed\n\n",
+                f"**Skills found**: {stats['skills']}\n\n",
+                f"**Reparsed**: {stats['reparsed']}\n\n",
+                f"**Removed**: {stats['removed']}\n\n",
+                f"**Metadata file**: {self.config.skills_metadata_file} "
+                f"({'updated' if stats['written'] else 'unchanged'})\n",
+            ]),
+            {**stats, "written": bool(stats["written"]), "metadata_file": str(self.config.skills_metadata_file)}
+        )
+
+    def install_workflow(
+        self,
+        workflow_name: str,
+        scope: str = "global",
+        mode: str = "copy",
+        output_format: str = "markdown"
+    ) -> str:
         """
         Install all skills for a recommended workflow.
 
+        Skills are copied concurrently, and each one is staged and renamed
+        into place so it is either fully installed or not installed at all.
+
         Args:
             workflow_name: Name of the workflow
             scope: 'global' or 'project'
+            mode: 'copy', 'link' or 'symlink'
+            output_format: 'markdown' or 'json'
 
         Returns:
-            Formatted result string
+            Formatted result string, or JSON result
         """
+        if mode not in INSTALL_MODES:
+            logger.error(f"Invalid install mode '{mode}'")
+            message = f"Invalid install mode '{mode}'. Use one of: {', '.join(INSTALL_MODES)}."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
+
         if workflow_name not in self.combinations:
             logger.error(f"Workflow '{workflow_name}' not found")
-            return f"# Error\n\nWorkflow '{workflow_name}' not found. Use get_combinations to see available workflows."
+            message = f"Workflow '{workflow_name}' not found. Use get_combinations to see available workflows."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
 
         skills_to_install = self.combinations[workflow_name]['skills']
         install_dir = self.config.get_install_dir(scope)
@@ -393,39 +1050,249 @@ class SkillManager:
 
         logger.info(f"Installing workflow '{workflow_name}' with {len(skills_to_install)} skills")
 
-        result = f"# Installing '{workflow_name}' Workflow\n\n"
-        result += f"**Scope**: {scope}\n\n"
-        result += "**Skills to install**:\n\n"
-
-        installed_count = 0
-        failed_count = 0
+        with ThreadPoolExecutor(max_workers=self.config.install_workers) as executor:
+            outcomes = list(executor.map(
+                lambda skill_name: self._install_workflow_skill(skill_name, install_dir, mode),
+                skills_to_install
+            ))
+
+        installed_count = sum(1 for outcome in outcomes if outcome["status"] in ("installed", "already_installed"))
+        failed_count = len(outcomes) - installed_count
+
+        if output_format == "json":
+            return to_json({
+                "workflow": workflow_name,
+                "scope": scope,
+                "mode": mode,
+                "skills": outcomes,
+                "installed": installed_count,
+                "failed": failed_count,
+            })
+
+        parts = [
+            f"# Installing '{workflow_name}' Workflow\n\n",
+            f"**Scope**: {scope}\n\n",
+            f"**Mode**: {mode}\n\n",
+            "**Skills to install**:\n\n",
+        ]
+        for outcome in outcomes:
+            status = STATUS_TEXT[outcome["status"]]
+            if "error" in outcome:
+                status += f": {outcome['error']}"
+            parts.append(f"- {outcome['skill']}: {status} ({outcome['seconds'] * 1000:.0f} ms)\n")
+
+        parts.append(f"\n**Summary**: {installed_count} installed, {failed_count} failed\n\n")
+        parts.append("Note: Restart OpenCode to load new skills.")
+
+        return "".join(parts)
+
+    def _install_workflow_skill(self, skill_name: str, install_dir: Path, mode: str) -> dict[str, Any]:
+        """
+        Install a single skill as part of a workflow.
 
-        for skill_name in skills_to_install:
-            skill_path = self.config.skills_dir / skill_name
-            dest_path = install_dir / skill_name
+        Args:
+            skill_name: Name of the skill to install
+            install_dir: Installation directory
+            mode: 'copy', 'link' or 'symlink'
 
-            result += f"- {skill_name}: "
+        Returns:
+            Outcome record with 'skill', 'status', 'seconds' and, on failure, 'error'
+        """
+        start = time.perf_counter()
+        skill_path = self.config.skills_dir / skill_name
+        dest_path = install_dir / skill_name
+        outcome: dict[str, Any] = {"skill": skill_name}
 
+        with self._install_lock(dest_path):
             if dest_path.exists():
-                result += "⚠️ Already installed\n"
-                installed_count += 1
                 logger.debug(f"Skill '{skill_name}' already installed")
-            elif skill_path.exists():
+                outcome["status"] = "already_installed"
+            elif not skill_path.exists():
+                logger.warning(f"Skill directory '{skill_path}' not found")
+                outcome["status"] = "not_found"
+            else:
                 try:
-                    shutil.copytree(skill_path, dest_path)
-                    result += "✅ Installed\n"
-                    installed_count += 1
+                    self._install_tree(skill_path, dest_path, mode)
                     logger.info(f"Installed '{skill_name}' to {dest_path}")
+                    outcome["status"] = "installed"
                 except Exception as e:
-                    result += f"❌ Failed: {str(e)}\n"
-                    failed_count += 1
                     logger.error(f"Failed to install '{skill_name}': {e}")
+                    outcome["status"] = "failed"
+                    outcome["error"] = str(e)
+
+        outcome["seconds"] = round(time.perf_counter() - start, 4)
+        return outcome
+
+    def upgrade_skills(
+        self,
+        skill_names: list[str] | None = None,
+        scope: str = "global",
+        mode: str = "copy",
+        output_format: str = "markdown"
+    ) -> str:
+        """
+        Upgrade installed skills in place, copying only files whose content changed.
+
+        Each installation is diffed against its manifest of file hashes;
+        new and changed files are written, deleted files are removed and
+        everything else is left untouched. Skills that are not installed
+        yet are installed.
+
+        Args:
+            skill_names: Skills to upgrade (default: every installed skill in the catalog)
+            scope: 'global' or 'project'
+            mode: 'copy' or 'link', used for files that need writing
+                ('symlink' is rejected: symlinked installs are always current)
+            output_format: 'markdown' or 'json'
+
+        Returns:
+            Formatted result string, or JSON result
+        """
+        if mode not in UPGRADE_MODES:
+            logger.error(f"Invalid upgrade mode '{mode}'")
+            message = f"Invalid upgrade mode '{mode}'. Use one of: {', '.join(UPGRADE_MODES)}."
+            return self._respond(output_format, f"# Error\n\n{message}", {"error": message})
+
+        install_dir = self.config.get_install_dir(scope)
+        install_dir.mkdir(parents=True, exist_ok=True)
+
+        metadata = self.config.load_skills_metadata()
+        if skill_names is None:
+            skill_names = sorted(s for s in self.config.get_installed_skills(scope) if s in metadata)
+
+        logger.info(f"Upgrading {len(skill_names)} skills (scope: {scope})")
+
+        with ThreadPoolExecutor(max_workers=self.config.install_workers) as executor:
+            outcomes = list(executor.map(
+                lambda skill_name: self._upgrade_skill(skill_name, install_dir, mode, metadata),
+                skill_names
+            ))
+
+        counts = {status: 0 for status in ("upgraded", "installed", "up_to_date", "symlinked")}
+        failed_count = 0
+        for outcome in outcomes:
+            if outcome["status"] in counts:
+                counts[outcome["status"]] += 1
             else:
-                result += "❌ Not found in skills directory\n"
                 failed_count += 1
-                logger.warning(f"Skill directory '{skill_path}' not found")
 
-        result += f"\n**Summary**: {installed_count} installed, {failed_count} failed\n\n"
-        result += "Note: Restart OpenCode to load new skills."
+        if output_format == "json":
+            return to_json({
+                "scope": scope,
+                "skills": outcomes,
+                **counts,
+                "failed": failed_count,
+            })
+
+        if not skill_names:
+            return "# Upgrading Skills\n\nNo installed skills to upgrade."
+
+        parts = ["# Upgrading Skills\n\n", f"**Scope**: {scope}\n\n"]
+        for outcome in outcomes:
+            status = STATUS_TEXT[outcome["status"]]
+            if "error" in outcome:
+                status += f": {outcome['error']}"
+            elif outcome["status"] == "upgraded":
+                status += (
+                    f" ({outcome['added']} added, {outcome['updated']} updated, "
+                    f"{outcome['removed']} removed, {outcome['unchanged']} unchanged)"
+                )
+            parts.append(f"- {outcome['skill']}: {status}\n")
+
+        parts.append(
+            f"\n**Summary**: {counts['upgraded']} upgraded, {counts['installed']} installed, "
+            f"{counts['up_to_date']} already up to date, {counts['symlinked']} symlinked, {failed_count} failed\n\n"
+        )
+        parts.append("Note: Restart OpenCode to load updated skills.")
+
+        return "".join(parts)
+
+    def _upgrade_skill(
+        self,
+        skill_name: str,
+        install_dir: Path,
+        mode: str,
+        metadata: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Upgrade or install a single skill.
+
+        Args:
+            skill_name: Name of the skill to upgrade
+            install_dir: Installation directory
+            mode: 'copy' or 'link'
+            metadata: Skills metadata; names not in it are rejected
+
+        Returns:
+            Outcome record with 'skill', 'status' and either file change
+            counts or, on failure, 'error'
+        """
+        outcome: dict[str, Any] = {"skill": skill_name}
+
+        if os.sep in skill_name or "/" in skill_name or ".." in skill_name:
+            error = f"Skill name '{skill_name}' must not contain path separators or '..'"
+        elif skill_name not in metadata:
+            error = f"Skill '{skill_name}' not found. Use list_skills to see available skills."
+        else:
+            error = None
+        if error:
+            logger.error(f"Refusing to upgrade '{skill_name}': {error}")
+            outcome["status"] = "invalid"
+            outcome["error"] = error
+            return outcome
+
+        skill_path = self.config.skills_dir / skill_name
+        dest_path = install_dir / skill_name
+
+        if not skill_path.exists():
+            logger.warning(f"Skill directory '{skill_path}' not found")
+            outcome["status"] = "not_found"
+            return outcome
+
+        try:
+            with self._install_lock(dest_path):
+                if dest_path.is_symlink():
+                    outcome["status"] = "symlinked"
+                    return outcome
 
-        return result
+                if not dest_path.exists():
+                    self._install_tree(skill_path, dest_path, mode)
+                    logger.info(f"Installed '{skill_name}' to {dest_path}")
+                    outcome["status"] = "installed"
+                    return outcome
+
+                copy_function = link_or_copy_file if mode == "link" else shutil.copy2
+                changes = self.store.sync(skill_path, dest_path, copy_function)
+        except Exception as e:
+            logger.error(f"Failed to upgrade '{skill_name}': {e}")
+            outcome["status"] = "failed"
+            outcome["error"] = str(e)
+            return outcome
+
+        if changes["added"] or changes["updated"] or changes["removed"]:
+            logger.info(f"Upgraded '{skill_name}' at {dest_path}")
+            outcome["status"] = "upgraded"
+        else:
+            outcome["status"] = "up_to_date"
+        outcome.update({change: len(paths) for change, paths in changes.items()})
+        return outcome
+
+
+# Global skill manager instance, shared across tool calls
+_manager: Optional[SkillManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_skill_manager() -> SkillManager:
+    """
+    Get global skill manager instance.
+
+    Returns:
+        SkillManager instance
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = SkillManager()
+    return _manager
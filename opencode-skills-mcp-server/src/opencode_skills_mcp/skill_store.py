@@ -0,0 +1,189 @@
+"""Content hashing and per-install manifests for incremental skill upgrades."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Manifest written into every copied or linked skill installation
+MANIFEST_FILENAME = ".skill-manifest.json"
+MANIFEST_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class SkillStore:
+    """Hashes skill files by content and syncs installations against their manifests."""
+
+    def __init__(self):
+        """Initialize the store with an empty hash cache."""
+        # path -> (mtime_ns, size, sha256), so unchanged files are hashed once
+        self._hash_cache: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def hash_file(self, path: Path) -> str:
+        """
+        Get the SHA-256 digest of a file, reusing the cached digest if it has not changed.
+
+        Args:
+            path: File to hash
+
+        Returns:
+            Hex digest of the file contents
+        """
+        stat = path.stat()
+        key = str(path)
+
+        with self._lock:
+            cached = self._hash_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        hex_digest = digest.hexdigest()
+
+        with self._lock:
+            self._hash_cache[key] = (stat.st_mtime_ns, stat.st_size, hex_digest)
+        return hex_digest
+
+    def build_manifest(self, root: Path) -> dict[str, str]:
+        """
+        Hash every file under a skill directory.
+
+        Args:
+            root: Skill directory
+
+        Returns:
+            Dictionary mapping POSIX-style relative paths to SHA-256 digests
+        """
+        manifest = {}
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                file_path = Path(dirpath) / filename
+                rel_path = file_path.relative_to(root).as_posix()
+                if rel_path == MANIFEST_FILENAME:
+                    continue
+                manifest[rel_path] = self.hash_file(file_path)
+        return manifest
+
+    @staticmethod
+    def read_manifest(install_path: Path) -> Optional[dict[str, str]]:
+        """
+        Read the manifest of an installed skill.
+
+        Args:
+            install_path: Installed skill directory
+
+        Returns:
+            Manifest dictionary, or None if missing or unreadable
+        """
+        manifest_file = install_path / MANIFEST_FILENAME
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable manifest {manifest_file}: {e}")
+            return None
+
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return data.get("files")
+
+    @staticmethod
+    def write_manifest(install_path: Path, manifest: dict[str, str]) -> None:
+        """
+        Write the manifest of an installed skill.
+
+        Args:
+            install_path: Installed skill directory
+            manifest: Dictionary mapping relative paths to SHA-256 digests
+        """
+        manifest_file = install_path / MANIFEST_FILENAME
+        tmp_file = manifest_file.with_name(f"{MANIFEST_FILENAME}.tmp-{os.getpid()}-{threading.get_ident()}")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_VERSION, "files": manifest}, f, separators=(',', ':'))
+            os.replace(tmp_file, manifest_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def sync(
+        self,
+        skill_path: Path,
+        install_path: Path,
+        copy_function: Callable[[str, str], object]
+    ) -> dict[str, list[str]]:
+        """
+        Bring an installed skill up to date with its source, touching only changed files.
+
+        Installations without a manifest are hashed once and then tracked
+        like any other. Each changed file is written to a temporary name and
+        renamed over the old one.
+
+        Args:
+            skill_path: Source skill directory
+            install_path: Installed skill directory
+            copy_function: Function used to place each file, e.g. shutil.copy2
+
+        Returns:
+            Dictionary with 'added', 'updated', 'removed' and 'unchanged' relative paths
+        """
+        source = self.build_manifest(skill_path)
+        installed = self.read_manifest(install_path)
+        if installed is None:
+            logger.debug(f"No manifest at {install_path}, hashing installed files")
+            installed = self.build_manifest(install_path)
+
+        changes: dict[str, list[str]] = {"added": [], "updated": [], "removed": [], "unchanged": []}
+        for rel_path, digest in source.items():
+            if rel_path not in installed:
+                changes["added"].append(rel_path)
+            elif installed[rel_path] != digest:
+                changes["updated"].append(rel_path)
+            else:
+                changes["unchanged"].append(rel_path)
+        changes["removed"] = [rel_path for rel_path in installed if rel_path not in source]
+
+        for rel_path in changes["added"] + changes["updated"]:
+            dest_file = install_path / rel_path
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = dest_file.with_name(f".{dest_file.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+            tmp_file.unlink(missing_ok=True)
+            try:
+                copy_function(str(skill_path / rel_path), str(tmp_file))
+                os.replace(tmp_file, dest_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+        for rel_path in changes["removed"]:
+            dest_file = install_path / rel_path
+            dest_file.unlink(missing_ok=True)
+            # Prune directories left empty by the removal
+            parent = dest_file.parent
+            while parent != install_path:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+
+        self.write_manifest(install_path, source)
+        logger.debug(
+            f"Synced {install_path}: {len(changes['added'])} added, "
+            f"{len(changes['updated'])} updated, {len(changes['removed'])} removed"
+        )
+        return changes
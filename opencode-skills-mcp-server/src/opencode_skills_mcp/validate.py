@@ -0,0 +1,29 @@
+"""Bulk skill validation from the command line.
+
+Validates every SKILL.md under a directory tree and exits non-zero if any
+skill is invalid, for use in CI.
+
+Usage:
+    python -m opencode_skills_mcp.validate [root] [--format json]
+"""
+
+import argparse
+import sys
+
+from .skill_manager import get_skill_manager
+
+
+def main() -> None:
+    """Command-line entry point: validate all skills under a root directory."""
+    parser = argparse.ArgumentParser(description="Validate every skill under a directory tree")
+    parser.add_argument("root", nargs="?", default=".", help="Directory to search for skills (default: current)")
+    parser.add_argument("--format", choices=("markdown", "json"), default="markdown", help="Report format")
+    args = parser.parse_args()
+
+    report, all_valid = get_skill_manager().validate_all(args.root, output_format=args.format)
+    print(report)
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from opencode_skills_mcp.catalog import build_catalog
+
+
+SKILL_MD = """---
+name: {name}
+description: Does {name} things
+---
+
+# {name}
+
+Body text.
+"""
+
+
+class TestBuildCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.skills_dir = Path(tempfile.mkdtemp())
+        self.index_file = self.skills_dir / ".skills_catalog_index.json"
+        for name in ("alpha", "beta"):
+            (self.skills_dir / name).mkdir()
+            (self.skills_dir / name / "SKILL.md").write_text(SKILL_MD.format(name=name), encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.skills_dir)
+
+    def test_deleted_skill_is_removed(self):
+        """A skill whose directory was deleted disappears from the catalog, curated fields included"""
+        curated = {
+            "alpha": {"category": "Development", "depth": "Quick"},
+            "beta": {"category": "Writing", "depth": "Comprehensive"},
+        }
+        catalog, _ = build_catalog(self.skills_dir, self.index_file, curated)
+        self.assertEqual(set(catalog), {"alpha", "beta"})
+
+        shutil.rmtree(self.skills_dir / "beta")
+        catalog, stats = build_catalog(self.skills_dir, self.index_file, catalog)
+
+        self.assertEqual(set(catalog), {"alpha"})
+        self.assertEqual(stats["removed"], 1)
+        self.assertEqual(catalog["alpha"]["category"], "Development")
+
+    def test_curated_skill_without_skill_md_is_kept(self):
+        """Curated skills that never had a SKILL.md here are left alone"""
+        curated = {"docx": {"name": "docx", "category": "Document Processing"}}
+        catalog, stats = build_catalog(self.skills_dir, self.index_file, curated)
+
+        self.assertEqual(catalog["docx"], curated["docx"])
+        self.assertEqual(stats["removed"], 0)
+
+    def test_line_count_matches_wc(self):
+        """Line counts match `wc -l`"""
+        catalog, _ = build_catalog(self.skills_dir, self.index_file)
+        skill_md = self.skills_dir / "alpha" / "SKILL.md"
+        if shutil.which("wc"):
+            wc_lines = int(subprocess.run(["wc", "-l", str(skill_md)], capture_output=True, text=True).stdout.split()[0])
+        else:
+            wc_lines = skill_md.read_bytes().count(b"\n")
+        self.assertEqual(catalog["alpha"]["lines"], wc_lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
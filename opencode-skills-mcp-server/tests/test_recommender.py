@@ -0,0 +1,76 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from opencode_skills_mcp.recommender import SIMILARITY_TOP_K, SkillRecommender
+
+
+METADATA = {
+    "blog-writer": {"category": "Writing", "description": "Write blog posts and articles", "keywords": ["blog", "writing"]},
+    "image-editor": {"category": "Visual", "description": "Edit and enhance images for posts", "keywords": ["images"]},
+    "brand-kit": {"category": "Visual", "description": "Apply brand colors to images", "keywords": ["brand"]},
+    "test-runner": {"category": "Development", "description": "Run web application tests", "keywords": ["testing"]},
+    "changelog": {"category": "Development", "description": "Generate changelogs from commits", "keywords": ["git"]},
+}
+
+COMBINATIONS = {
+    "blogging": {
+        "name": "Blogging",
+        "description": "Write a blog post with images",
+        "skills": ["blog-writer", "image-editor"],
+    },
+    "branded-blogging": {
+        "name": "Branded Blogging",
+        "description": "Write a blog post with branded images",
+        "skills": ["blog-writer", "image-editor", "brand-kit"],
+    },
+    "dev-cycle": {
+        "name": "Development Cycle",
+        "description": "Test code and write changelogs",
+        "skills": ["test-runner", "changelog"],
+    },
+}
+
+
+class TestWorkflowRanking(unittest.TestCase):
+
+    def setUp(self):
+        self.recommender = SkillRecommender(METADATA, COMBINATIONS)
+
+    def test_installed_workflow_not_first(self):
+        """A workflow whose skills are all installed ranks below workflows that add skills"""
+        result = self.recommender.recommend({"blog-writer", "image-editor"}, goal="write a blog post with images")
+        workflows = result["workflows"]
+
+        self.assertEqual(workflows[0]["workflow"], "branded-blogging")
+        self.assertEqual(workflows[-1]["workflow"], "blogging")
+        self.assertEqual(workflows[-1]["missing"], [])
+
+
+
+class TestSimilarityMatrix(unittest.TestCase):
+
+    def test_matrix_stays_sparse(self):
+        """Common words don't link every skill, and each skill keeps at most SIMILARITY_TOP_K neighbours"""
+        rng = random.Random(0)
+        topics = [f"topic{i}" for i in range(200)]
+        metadata = {
+            f"skill-{i}": {
+                "category": "General",
+                "description": f"Tools for the {' and '.join(rng.sample(topics, 3))} of a project",
+                "keywords": rng.sample(topics, 2),
+            }
+            for i in range(2000)
+        }
+        recommender = SkillRecommender(metadata, {})
+
+        filled = sum(len(related) for related in recommender.similarity.values())
+        self.assertLessEqual(max(len(related) for related in recommender.similarity.values()), SIMILARITY_TOP_K)
+        self.assertLess(filled / len(metadata) ** 2, 0.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Batch GIF Generation - Render many GIFs from a JSONL manifest on all CPU cores.
+
+Each manifest line is one job:
+
+    {"template": "spin", "params": {"object_data": {"emoji": "🔄", "size": 100}},
+     "output": "out/spin.gif", "fps": 20, "width": 128, "height": 128, "is_emoji": true}
+
+'template' names a module in templates/ and optionally one of its create_*
+functions ("zoom.create_explosion_zoom"); the default is
+create_<template>_animation. 'params' are passed to that function (JSON
+lists become tuples). Optional keys: fps, width/height (frames are
+resized), is_emoji (validation target, default: at most 128x128),
+num_colors, remove_duplicates, optimize_for_emoji, and optimize (use
+save_optimized to find the best encoding that fits Slack's limit).
+Relative outputs are resolved against the manifest's directory.
+
+Jobs run on a pool of long-lived worker processes, so whatever a job
+caches (fonts, emoji sprites) is still there for the next job on that
+worker; jobs are handed out grouped by template so similar jobs share a
+worker. Each worker starts by loading the typography fonts and the emoji
+font and sprite for every (emoji, size) pair in the manifest. Every GIF
+is checked with validators.validate_gif and a results manifest is written
+with one line per job, in manifest order.
+
+Usage:
+    python -m core.batch jobs.jsonl [--results results.jsonl] [--workers N]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.gif_builder import GIFBuilder
+from core.validators import validate_gif
+
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+
+# Largest side of GIFs validated as emoji when a job doesn't say
+EMOJI_MAX_SIDE = 128
+
+
+def load_manifest(manifest_path: str | Path) -> list[dict]:
+    """
+    Read jobs from a JSONL manifest, skipping blank lines.
+
+    Args:
+        manifest_path: Path to the manifest
+
+    Returns:
+        List of job dictionaries
+
+    Raises:
+        ValueError: If a line is not valid JSON or lacks 'template' or 'output'
+    """
+    jobs = []
+    with open(manifest_path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{manifest_path}:{line_number}: invalid JSON ({e})") from e
+            if not isinstance(job, dict) or 'template' not in job or 'output' not in job:
+                raise ValueError(f"{manifest_path}:{line_number}: job needs 'template' and 'output'")
+            jobs.append(job)
+    return jobs
+
+
+def resolve_template(name: str) -> Callable[..., list]:
+    """
+    Look up a template function by manifest name.
+
+    Args:
+        name: 'module' (for create_<module>_animation) or 'module.create_function'
+
+    Returns:
+        The template function
+
+    Raises:
+        ValueError: If no such template exists
+    """
+    module_name, _, function_name = name.partition('.')
+    if not re.fullmatch(r'[a-z_]+', module_name) or not (TEMPLATES_DIR / f'{module_name}.py').exists():
+        raise ValueError(f"Unknown template module: {module_name}")
+
+    function_name = function_name or f'create_{module_name}_animation'
+    module = importlib.import_module(f'templates.{module_name}')
+    function = getattr(module, function_name, None)
+    if not function_name.startswith('create_') or not callable(function):
+        raise ValueError(f"Unknown template function: {name}")
+    return function
+
+
+def _to_tuples(value: Any) -> Any:
+    """Turn JSON lists into tuples, since templates take colors and positions as tuples."""
+    if isinstance(value, list):
+        return tuple(_to_tuples(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _to_tuples(item) for key, item in value.items()}
+    return value
+
+
+def run_job(job: dict, base_dir: str | Path = '.') -> dict:
+    """
+    Render, save and validate one GIF.
+
+    Output from the template, builder and validator is captured rather than
+    printed, so parallel jobs don't interleave.
+
+    Args:
+        job: Job dictionary from the manifest
+        base_dir: Directory relative output paths are resolved against
+
+    Returns:
+        Result dictionary: output path, ok, passes, size, dimensions,
+        frame count, time taken, validation details and any error
+    """
+    start = time.perf_counter()
+    output_path = Path(base_dir) / job['output']
+    result: dict[str, Any] = {'template': job['template'], 'output': str(output_path)}
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            template = resolve_template(job['template'])
+            frames = template(**_to_tuples(job.get('params', {})))
+            if not frames:
+                raise ValueError("Template returned no frames")
+
+            width = job.get('width', frames[0].size[0])
+            height = job.get('height', frames[0].size[1])
+            is_emoji = job.get('is_emoji', max(width, height) <= EMOJI_MAX_SIDE)
+
+            builder = GIFBuilder(width=width, height=height, **({'fps': job['fps']} if 'fps' in job else {}))
+            builder.add_frames(frames)
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if job.get('optimize'):
+                info = builder.save_optimized(output_path, is_emoji=is_emoji)
+                result['optimization'] = info['optimization']
+            else:
+                info = builder.save(
+                    output_path,
+                    num_colors=job.get('num_colors', 128),
+                    optimize_for_emoji=job.get('optimize_for_emoji', False),
+                    remove_duplicates=job.get('remove_duplicates', True)
+                )
+
+            passes, validation = validate_gif(output_path, is_emoji=is_emoji)
+
+        result.update({
+            'ok': True,
+            'passes': passes,
+            'size_bytes': output_path.stat().st_size,
+            'size_kb': info['size_kb'],
+            'dimensions': info['dimensions'],
+            'frame_count': info['frame_count'],
+            'validation': validation,
+        })
+    except Exception as e:
+        result.update({'ok': False, 'passes': False, 'error': f'{type(e).__name__}: {e}'})
+
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _run_indexed(args: tuple[int, dict, str]) -> tuple[int, dict]:
+    """Run one job in a worker process, keeping its manifest position."""
+    index, job, base_dir = args
+    return index, run_job(job, base_dir)
+
+
+def _manifest_emojis(value: Any) -> set[tuple[str, int]]:
+    """Find the (emoji, size) pairs of object data anywhere in job parameters."""
+    found = set()
+    if isinstance(value, dict):
+        if isinstance(value.get('emoji'), str) and isinstance(value.get('size'), int):
+            found.add((value['emoji'], value['size']))
+        for item in value.values():
+            found |= _manifest_emojis(item)
+    elif isinstance(value, list):
+        for item in value:
+            found |= _manifest_emojis(item)
+    return found
+
+
+def _warm_worker(jobs: Optional[list[dict]] = None):
+    """
+    Load what the jobs need once per worker process.
+
+    Args:
+        jobs: Manifest jobs; the emoji font and sprite are preloaded for
+            every (emoji, size) pair in their parameters
+    """
+    from core.frame_composer import EMOJI_SPRITE_CACHE_SIZE, get_emoji_sprite
+    from core.typography import get_font, TYPOGRAPHY_SCALE
+
+    for size in TYPOGRAPHY_SCALE.values():
+        get_font(size, bold=True)
+        get_font(size, bold=False)
+
+    emojis = sorted(_manifest_emojis([job.get('params', {}) for job in jobs or []]))
+    for emoji, size in emojis[:EMOJI_SPRITE_CACHE_SIZE]:
+        # Rasterizing the sprite also loads the emoji font for that size
+        get_emoji_sprite(emoji, size)
+
+
+def run_batch(manifest_path: str | Path, results_path: Optional[str | Path] = None,
+              workers: Optional[int] = None) -> list[dict]:
+    """
+    Run every job in a manifest and write a results manifest.
+
+    Args:
+        manifest_path: JSONL manifest of jobs
+        results_path: Where to write results (default: <manifest>.results.jsonl)
+        workers: Number of worker processes (None = one per CPU, 1 = run in this process)
+
+    Returns:
+        List of result dictionaries, in manifest order
+    """
+    manifest_path = Path(manifest_path)
+    if results_path is None:
+        results_path = manifest_path.with_suffix('.results.jsonl')
+    jobs = load_manifest(manifest_path)
+    base_dir = str(manifest_path.parent)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs) or 1))
+
+    print(f"Running {len(jobs)} jobs from {manifest_path} on {workers} worker(s)")
+    start = time.perf_counter()
+
+    # Group jobs by template so a worker gets runs of similar jobs and its caches stay warm
+    order = sorted(range(len(jobs)), key=lambda i: (jobs[i]['template'], json.dumps(jobs[i].get('params', {}), sort_keys=True)))
+    tasks = [(i, jobs[i], base_dir) for i in order]
+
+    results: list[Optional[dict]] = [None] * len(jobs)
+    if workers == 1:
+        _warm_worker(jobs)
+        completed = map(_run_indexed, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(jobs,))
+        completed = executor.map(_run_indexed, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+
+    try:
+        for done, (index, result) in enumerate(completed, 1):
+            results[index] = result
+            status = '✓' if result['passes'] else ('⚠' if result['ok'] else '✗')
+            detail = f"{result['size_kb']:.1f} KB" if result['ok'] else result['error']
+            print(f"  [{done}/{len(jobs)}] {status} {result['output']} - {detail}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    with open(results_path, 'w', encoding='utf-8') as f:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+    elapsed = time.perf_counter() - start
+    generated = sum(1 for r in results if r['ok'])
+    passing = sum(1 for r in results if r['passes'])
+    total_kb = sum(r['size_kb'] for r in results if r['ok'])
+    print(f"\n{generated}/{len(jobs)} GIFs generated, {passing} pass Slack validation, "
+          f"{total_kb / 1024:.1f} MB total in {elapsed:.1f}s")
+    print(f"Results: {results_path}")
+
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point; exits with status 1 if any job failed."""
+    parser = argparse.ArgumentParser(description="Generate GIFs from a JSONL manifest of template jobs.")
+    parser.add_argument('manifest', help="JSONL file with one job per line")
+    parser.add_argument('--results', help="Where to write the results manifest (default: <manifest>.results.jsonl)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    results = run_batch(args.manifest, args.results, args.workers)
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,8 @@ Provides functions for drawing shapes, text, emojis, and compositing elements
 together to create animation frames.
 """
 
+from functools import lru_cache
+import math
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from typing import Optional
@@ -232,6 +234,18 @@ def draw_stick_figure(frame: Image.Image, position: tuple[int, int], scale: floa
     return frame
 
 
+@lru_cache(maxsize=32)
+def _gradient_array(width: int, height: int,
+                    top_color: tuple[int, int, int],
+                    bottom_color: tuple[int, int, int]) -> np.ndarray:
+    """Build (and cache) the pixels of a vertical gradient as a read-only array."""
+    ratio = (np.arange(height) / height)[:, None]
+    rows = (np.array(top_color) * (1 - ratio) + np.array(bottom_color) * ratio).astype(np.uint8)
+    gradient = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    gradient.flags.writeable = False
+    return gradient
+
+
 def create_gradient_background(width: int, height: int,
                                top_color: tuple[int, int, int],
                                bottom_color: tuple[int, int, int]) -> Image.Image:
@@ -247,24 +261,25 @@ def create_gradient_background(width: int, height: int,
     Returns:
         PIL Image with gradient
     """
-    frame = Image.new('RGB', (width, height))
-    draw = ImageDraw.Draw(frame)
+    return Image.fromarray(_gradient_array(width, height, tuple(top_color), tuple(bottom_color)))
 
-    # Calculate color step for each row
-    r1, g1, b1 = top_color
-    r2, g2, b2 = bottom_color
 
-    for y in range(height):
-        # Interpolate color
-        ratio = y / height
-        r = int(r1 * (1 - ratio) + r2 * ratio)
-        g = int(g1 * (1 - ratio) + g2 * ratio)
-        b = int(b1 * (1 - ratio) + b2 * ratio)
+# Number of rasterized emoji sprites kept by get_emoji_sprite
+EMOJI_SPRITE_CACHE_SIZE = 128
 
-        # Draw horizontal line
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
 
-    return frame
+@lru_cache(maxsize=64)
+def _emoji_font(size: int) -> ImageFont.ImageFont:
+    """Load (once per size) the font used to draw emoji."""
+    # Use Apple Color Emoji font on macOS
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Apple Color Emoji.ttc", size)
+    except:
+        # Fallback to text-based emoji
+        try:
+            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+        except:
+            return ImageFont.load_default()
 
 
 def draw_emoji_enhanced(frame: Image.Image, emoji: str, position: tuple[int, int],
@@ -288,16 +303,7 @@ def draw_emoji_enhanced(frame: Image.Image, emoji: str, position: tuple[int, int
 
     # Ensure minimum size to avoid font rendering errors
     size = max(12, size)
-
-    # Use Apple Color Emoji font on macOS
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Apple Color Emoji.ttc", size)
-    except:
-        # Fallback to text-based emoji
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-        except:
-            font = ImageFont.load_default()
+    font = _emoji_font(size)
 
     # Draw shadow first if enabled
     if shadow and size >= 20:  # Only draw shadow for larger emojis
@@ -320,6 +326,69 @@ def draw_emoji_enhanced(frame: Image.Image, emoji: str, position: tuple[int, int
     return frame
 
 
+@lru_cache(maxsize=EMOJI_SPRITE_CACHE_SIZE)
+def get_emoji_sprite(emoji: str, size: int, shadow: bool = False,
+                     shadow_offset: tuple[int, int] = (2, 2)) -> Image.Image:
+    """
+    Rasterize an emoji once onto a transparent canvas for transforming and compositing.
+
+    Sprites are cached by (emoji, size, shadow, shadow_offset); the font
+    follows from the size. The sprite is the smallest square centered on
+    the emoji's size x size box that it can be rotated in without clipping,
+    so centering the sprite on a point centers the emoji there. The
+    returned image is shared between callers, so transform or paste it but
+    don't draw on it.
+
+    Args:
+        emoji: Emoji character(s)
+        size: Emoji size in pixels
+        shadow: Whether to add drop shadow
+        shadow_offset: Shadow offset
+
+    Returns:
+        Square RGBA image
+    """
+    # Draw on a canvas large enough for the glyph and its shadow
+    canvas_size = size * 2 + 2 * (max(abs(shadow_offset[0]), abs(shadow_offset[1])) + 2 if shadow else 0)
+    canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+    draw_emoji_enhanced(
+        canvas,
+        emoji=emoji,
+        position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
+        size=size,
+        shadow=shadow,
+        shadow_offset=shadow_offset
+    )
+
+    bbox = canvas.getbbox()
+    if bbox is None:
+        return canvas
+
+    # Farthest drawn corner from the center bounds the rotated content
+    center = canvas_size / 2
+    radius = math.ceil(max(math.hypot(x - center, y - center)
+                           for x in (bbox[0], bbox[2]) for y in (bbox[1], bbox[3])))
+    half = min(radius, canvas_size // 2)
+    return canvas.crop((canvas_size // 2 - half, canvas_size // 2 - half,
+                        canvas_size // 2 + half, canvas_size // 2 + half))
+
+
+def paste_centered(frame: Image.Image, sprite: Image.Image, center: tuple[int, int]) -> Image.Image:
+    """
+    Alpha-composite an RGBA sprite onto a frame, centered on a point.
+
+    Args:
+        frame: PIL Image to draw on (modified in place)
+        sprite: RGBA image to composite
+        center: (x, y) point to center the sprite on
+
+    Returns:
+        Modified frame
+    """
+    frame.paste(sprite, (center[0] - sprite.width // 2, center[1] - sprite.height // 2), sprite)
+    return frame
+
+
 def draw_circle_with_shadow(frame: Image.Image, center: tuple[int, int], radius: int,
                             fill_color: tuple[int, int, int],
                             shadow_offset: tuple[int, int] = (3, 3),
@@ -389,6 +458,23 @@ def draw_rounded_rectangle(frame: Image.Image, top_left: tuple[int, int],
     return frame
 
 
+@lru_cache(maxsize=32)
+def _vignette_mask(width: int, height: int, strength: float) -> np.ndarray:
+    """Build (and cache) the radial brightness mask of a vignette as a read-only array."""
+    # Create radial gradient mask
+    center_x, center_y = width // 2, height // 2
+    max_dist = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
+
+    dy, dx = np.ogrid[:height, :width]
+    dist = np.sqrt((dx - center_x) ** 2 + (dy - center_y) ** 2)
+    vignette = np.minimum(1, (dist / max_dist) * strength)
+    value = (255 * (1 - vignette)).astype(np.uint8)
+
+    mask = (value.astype(np.float32) / 255)[..., None]
+    mask.flags.writeable = False
+    return mask
+
+
 def add_vignette(frame: Image.Image, strength: float = 0.5) -> Image.Image:
     """
     Add a vignette effect (darkened edges) to frame.
@@ -401,37 +487,56 @@ def add_vignette(frame: Image.Image, strength: float = 0.5) -> Image.Image:
         Frame with vignette
     """
     width, height = frame.size
-
-    # Create radial gradient mask
-    center_x, center_y = width // 2, height // 2
-    max_dist = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
-
-    # Create overlay
-    overlay = Image.new('RGB', (width, height), (0, 0, 0))
-    pixels = overlay.load()
-
-    for y in range(height):
-        for x in range(width):
-            # Calculate distance from center
-            dx = x - center_x
-            dy = y - center_y
-            dist = (dx ** 2 + dy ** 2) ** 0.5
-
-            # Calculate vignette value
-            vignette = min(1, (dist / max_dist) * strength)
-            value = int(255 * (1 - vignette))
-            pixels[x, y] = (value, value, value)
+    mask = _vignette_mask(width, height, strength)
 
     # Blend with original using multiply
     frame_array = np.array(frame, dtype=np.float32) / 255
-    overlay_array = np.array(overlay, dtype=np.float32) / 255
 
-    result = frame_array * overlay_array
+    result = frame_array * mask
     result = (result * 255).astype(np.uint8)
 
     return Image.fromarray(result)
 
 
+def cache_stats(caches: dict) -> dict:
+    """
+    Summarize lru_cache hit/miss counts.
+
+    Args:
+        caches: Mapping of name to lru_cache-wrapped function
+
+    Returns:
+        Dictionary mapping each name to its cache info (hits, misses, size, hit_rate)
+    """
+    stats = {}
+    for name, function in caches.items():
+        info = function.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+def get_effect_cache_stats() -> dict:
+    """
+    Get hit/miss counts of the cached vignette masks, gradients, emoji fonts and emoji sprites.
+
+    Returns:
+        Dictionary with 'vignette', 'gradient', 'emoji_font' and 'emoji_sprite'
+        cache info (hits, misses, size, hit_rate)
+    """
+    return cache_stats({
+        'vignette': _vignette_mask,
+        'gradient': _gradient_array,
+        'emoji_font': _emoji_font,
+        'emoji_sprite': get_emoji_sprite,
+    })
+
+
 def draw_star(frame: Image.Image, center: tuple[int, int], size: int,
              fill_color: tuple[int, int, int],
              outline_color: Optional[tuple[int, int, int]] = None,
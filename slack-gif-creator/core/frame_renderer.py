@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Frame Renderer - Render animation frames in parallel across CPU cores.
+
+Most animations compute each frame from its index alone, so frames can be
+rendered by separate processes and put back in order. A frame function
+takes (index, num_frames) and returns the frame; use functools.partial to
+bind the animation's settings. It must be defined at module level so
+worker processes can import it.
+
+Random effects stay reproducible: before each frame, `random` and
+`numpy.random` are seeded from (seed, frame index), so the output is the
+same whichever process renders a frame and however many workers are used.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Optional
+import os
+import random
+from PIL import Image
+import numpy as np
+
+
+FrameFunction = Callable[[int, int], Image.Image]
+
+
+def _seed_frame(seed: int, index: int):
+    """Seed the random number generators for one frame."""
+    state = np.random.SeedSequence([seed, index]).generate_state(2)
+    random.seed((int(state[0]) << 32) | int(state[1]))
+    np.random.seed(state)
+
+
+def _render_frame(render_frame: FrameFunction, seed: int, num_frames: int, index: int) -> Image.Image:
+    """Render one seeded frame (runs in a worker process)."""
+    _seed_frame(seed, index)
+    return render_frame(index, num_frames)
+
+
+def iter_frames(render_frame: FrameFunction, num_frames: int, workers: Optional[int] = None,
+                seed: Optional[int] = None, chunksize: Optional[int] = None) -> Iterator[Image.Image]:
+    """
+    Render frames, in parallel if workers > 1, and yield them in order.
+
+    Args:
+        render_frame: Function of (index, num_frames) returning a frame
+        num_frames: Number of frames
+        workers: Number of worker processes (None = one per CPU, 1 = render in this process)
+        seed: Base seed for random effects (None = drawn from `random`, so
+            random.seed() still makes the result reproducible)
+        chunksize: Frames sent to a worker at a time (None = split evenly)
+
+    Yields:
+        Frames in index order
+    """
+    if seed is None:
+        seed = random.getrandbits(32)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, num_frames))
+
+    if workers == 1:
+        # Reseeding per frame must not disturb the caller's random state
+        random_state = random.getstate()
+        numpy_state = np.random.get_state()
+        try:
+            for index in range(num_frames):
+                yield _render_frame(render_frame, seed, num_frames, index)
+        finally:
+            random.setstate(random_state)
+            np.random.set_state(numpy_state)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, num_frames // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            _render_frame,
+            [render_frame] * num_frames,
+            [seed] * num_frames,
+            [num_frames] * num_frames,
+            range(num_frames),
+            chunksize=chunksize,
+        )
+
+
+def render_frames(render_frame: FrameFunction, num_frames: int, workers: Optional[int] = None,
+                  seed: Optional[int] = None, chunksize: Optional[int] = None) -> list[Image.Image]:
+    """
+    Render all frames of an animation, in parallel if workers > 1.
+
+    Args:
+        render_frame: Function of (index, num_frames) returning a frame
+        num_frames: Number of frames
+        workers: Number of worker processes (None = one per CPU, 1 = render in this process)
+        seed: Base seed for random effects (None = drawn from `random`)
+        chunksize: Frames sent to a worker at a time (None = split evenly)
+
+    Returns:
+        List of frames in order
+    """
+    return list(iter_frames(render_frame, num_frames, workers=workers, seed=seed, chunksize=chunksize))
+
+
+def render_to_builder(builder, render_frame: FrameFunction, num_frames: int, workers: Optional[int] = None,
+                      seed: Optional[int] = None, chunksize: Optional[int] = None):
+    """
+    Render frames in parallel and add them to a builder in order.
+
+    Frames are added as they arrive, so a StreamingGIFBuilder writes them
+    out without holding the whole animation.
+
+    Args:
+        builder: GIFBuilder or StreamingGIFBuilder to add frames to
+        render_frame: Function of (index, num_frames) returning a frame
+        num_frames: Number of frames
+        workers: Number of worker processes (None = one per CPU, 1 = render in this process)
+        seed: Base seed for random effects (None = drawn from `random`)
+        chunksize: Frames sent to a worker at a time (None = split evenly)
+
+    Returns:
+        The builder, for chaining
+    """
+    for frame in iter_frames(render_frame, num_frames, workers=workers, seed=seed, chunksize=chunksize):
+        builder.add_frame(frame)
+    return builder
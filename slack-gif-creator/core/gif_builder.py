@@ -6,12 +6,228 @@ This module provides the main interface for creating GIFs from programmatically
 generated frames, with automatic optimization for Slack's requirements.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import imageio.v3 as imageio
 from PIL import Image
 import numpy as np
 
+from core.gif_writer import GIFWriter
+
+
+# Number of distinct colors matched against the palette per batch (bounds memory use)
+PALETTE_MATCH_CHUNK = 4096
+
+# Number of palette mappers kept for reuse (each holds 32 MB of lookup tables)
+PALETTE_MAPPER_CACHE_SIZE = 2
+
+
+def build_palette(frames: list[np.ndarray], num_colors: int = 128, sample_size: int = 5) -> np.ndarray:
+    """
+    Build a global palette from a sample of frames.
+
+    Args:
+        frames: RGB frames as (H, W, 3) uint8 arrays
+        num_colors: Target number of colors (8-256)
+        sample_size: Number of evenly spaced frames to sample
+
+    Returns:
+        Palette as (N, 3) uint8 array, N <= num_colors
+    """
+    sample_size = min(sample_size, len(frames))
+    sample_indices = [int(i * len(frames) / sample_size) for i in range(sample_size)]
+
+    # Stack the sampled frames vertically into one image for palette generation
+    combined = np.concatenate([frames[i] for i in sample_indices]).astype(np.uint8)
+    quantized = Image.fromarray(combined).quantize(colors=num_colors, method=2)
+
+    # Keep only the palette entries the sample actually uses
+    used = np.unique(np.asarray(quantized))
+    return np.array(quantized.getpalette(), dtype=np.uint8).reshape(-1, 3)[used]
+
+
+def _pack_rgb(frame: np.ndarray) -> np.ndarray:
+    """Pack an RGB frame into one 24-bit integer per pixel."""
+    frame = frame.astype(np.uint32)
+    return frame[..., 0] << 16 | frame[..., 1] << 8 | frame[..., 2]
+
+
+class PaletteMapper:
+    """Maps RGB frames to nearest-color palette indices, remembering every color seen."""
+
+    def __init__(self, palette: np.ndarray):
+        """
+        Initialize the mapper.
+
+        Args:
+            palette: Palette as (N, 3) uint8 array
+        """
+        self.palette = palette
+        self._palette_float = palette.astype(np.float32)
+        self._palette_norms = (self._palette_float ** 2).sum(axis=1)
+        # 24-bit RGB -> palette index, filled in as colors are first seen
+        self._lookup = np.zeros(1 << 24, dtype=np.uint8)
+        self._known = np.zeros(1 << 24, dtype=bool)
+
+    def _resolve(self, colors: np.ndarray):
+        """Compute nearest palette entries for packed colors not seen before."""
+        rgb = np.stack([(colors >> 16) & 0xFF, (colors >> 8) & 0xFF, colors & 0xFF], axis=1).astype(np.float32)
+        for start in range(0, len(colors), PALETTE_MATCH_CHUNK):
+            chunk = rgb[start:start + PALETTE_MATCH_CHUNK]
+            # |c - p|^2 without the |c|^2 term, which is the same for every palette entry
+            distances = self._palette_norms[None, :] - 2 * chunk @ self._palette_float.T
+            self._lookup[colors[start:start + PALETTE_MATCH_CHUNK]] = distances.argmin(axis=1)
+        self._known[colors] = True
+
+    def map(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Map one RGB frame to palette indices.
+
+        Args:
+            frame: RGB frame as (H, W, 3) uint8 array
+
+        Returns:
+            (H, W) uint8 array of palette indices
+        """
+        packed = _pack_rgb(frame)
+        unknown = packed[~self._known[packed]]
+        if unknown.size:
+            self._resolve(np.unique(unknown))
+        return self._lookup[packed]
+
+
+@lru_cache(maxsize=PALETTE_MAPPER_CACHE_SIZE)
+def _cached_mapper(palette_bytes: bytes) -> PaletteMapper:
+    """Build a mapper for a palette given as packed RGB bytes."""
+    return PaletteMapper(np.frombuffer(palette_bytes, dtype=np.uint8).reshape(-1, 3))
+
+
+def get_palette_mapper(palette: np.ndarray) -> PaletteMapper:
+    """
+    Get a mapper for a palette, reusing the one built for an identical palette.
+
+    Args:
+        palette: Palette as (N, 3) uint8 array
+
+    Returns:
+        PaletteMapper for the palette
+    """
+    return _cached_mapper(np.ascontiguousarray(palette, dtype=np.uint8).tobytes())
+
+
+def _dither_to_palette(frame: np.ndarray, palette_image: Image.Image, num_colors: int) -> np.ndarray:
+    """Map one RGB frame to palette indices with Floyd-Steinberg dithering."""
+    quantized = Image.fromarray(frame).quantize(palette=palette_image, dither=Image.Dither.FLOYDSTEINBERG)
+    indices = np.asarray(quantized)
+    # Padding entries repeat palette color 0
+    return np.where(indices < num_colors, indices, 0).astype(np.uint8)
+
+
+def map_to_palette(frames: list[np.ndarray], palette: np.ndarray, dither: bool = False) -> list[np.ndarray]:
+    """
+    Map RGB frames to indices of their nearest palette colors.
+
+    Nearest colors are computed once per distinct color across all
+    frames and stored in a 24-bit lookup table, so each frame is then
+    converted with a single gather. Dithering diffuses each pixel's error
+    to its neighbours, so it goes through Pillow frame by frame instead.
+
+    Args:
+        frames: RGB frames as (H, W, 3) uint8 arrays
+        palette: Palette as (N, 3) uint8 array
+        dither: Use Floyd-Steinberg dithering (smoother gradients, slower, larger files)
+
+    Returns:
+        List of (H, W) uint8 arrays of palette indices
+    """
+    if dither:
+        padded = np.concatenate([palette, np.repeat(palette[:1], 256 - len(palette), axis=0)])
+        palette_image = Image.new('P', (1, 1))
+        palette_image.putpalette(padded.astype(np.uint8).tobytes())
+        return [_dither_to_palette(frame, palette_image, len(palette)) for frame in frames]
+
+    mapper = get_palette_mapper(palette)
+    return [mapper.map(frame) for frame in frames]
+
+
+def write_indexed_gif(output_path: str | Path, palette: np.ndarray, indexed_frames: list[np.ndarray],
+                      duration: float, loop: int = 0):
+    """
+    Write palette-indexed frames to a GIF without re-quantizing them.
+
+    Each frame after the first stores only the region that changed, with
+    unchanged pixels transparent when the palette has a free index.
+
+    Args:
+        output_path: Where to save the GIF
+        palette: Palette as (N, 3) uint8 array
+        indexed_frames: (H, W) uint8 arrays of palette indices
+        duration: Frame duration in milliseconds
+        loop: Number of loops (0 = infinite)
+    """
+    height, width = indexed_frames[0].shape
+    with GIFWriter(output_path, width, height, palette, loop=loop) as writer:
+        for indices in indexed_frames:
+            writer.add_frame(indices, duration)
+
+
+def fit_frame(frame: np.ndarray | Image.Image, width: int, height: int) -> np.ndarray:
+    """
+    Convert a frame to an RGB array of the given size.
+
+    Args:
+        frame: Frame as numpy array or PIL Image
+        width: Target width in pixels
+        height: Target height in pixels
+
+    Returns:
+        RGB frame as (height, width, 3) array
+    """
+    if isinstance(frame, Image.Image):
+        frame = np.array(frame.convert('RGB'))
+
+    # Ensure frame is correct size
+    if frame.shape[:2] != (height, width):
+        pil_frame = Image.fromarray(frame)
+        pil_frame = pil_frame.resize((width, height), Image.Resampling.LANCZOS)
+        frame = np.array(pil_frame)
+
+    return frame
+
+
+def frame_similarity(frame_a: np.ndarray, frame_b: np.ndarray) -> float:
+    """
+    Compare two frames.
+
+    Args:
+        frame_a: RGB frame
+        frame_b: RGB frame of the same size
+
+    Returns:
+        Similarity from 0.0 (opposite) to 1.0 (identical)
+    """
+    diff = np.abs(frame_a.astype(np.float32) - frame_b.astype(np.float32))
+    return 1.0 - (np.mean(diff) / 255.0)
+
+
+def _print_gif_info(info: dict, is_emoji: bool = False):
+    """Print a summary of a saved GIF and warn if it is too large for Slack."""
+    print(f"\n✓ GIF created successfully!")
+    print(f"  Path: {info['path']}")
+    print(f"  Size: {info['size_kb']:.1f} KB ({info['size_mb']:.2f} MB)")
+    print(f"  Dimensions: {info['dimensions']}")
+    print(f"  Frames: {info['frame_count']} @ {info['fps']} fps")
+    print(f"  Duration: {info['duration_seconds']:.1f}s")
+    print(f"  Colors: {info['colors']}")
+
+    # Warnings
+    if is_emoji and info['size_kb'] > 64:
+        print(f"\n⚠️  WARNING: Emoji file size ({info['size_kb']:.1f} KB) exceeds 64 KB limit")
+        print("   Try: fewer frames, fewer colors, or simpler design")
+    elif not is_emoji and info['size_kb'] > 2048:
+        print(f"\n⚠️  WARNING: File size ({info['size_kb']:.1f} KB) is large for Slack")
+        print("   Try: fewer frames, smaller dimensions, or fewer colors")
+
 
 class GIFBuilder:
     """Builder for creating optimized GIFs from frames."""
@@ -37,16 +253,7 @@ class GIFBuilder:
         Args:
             frame: Frame as numpy array or PIL Image (will be converted to RGB)
         """
-        if isinstance(frame, Image.Image):
-            frame = np.array(frame.convert('RGB'))
-
-        # Ensure frame is correct size
-        if frame.shape[:2] != (self.height, self.width):
-            pil_frame = Image.fromarray(frame)
-            pil_frame = pil_frame.resize((self.width, self.height), Image.Resampling.LANCZOS)
-            frame = np.array(pil_frame)
-
-        self.frames.append(frame)
+        self.frames.append(fit_frame(frame, self.width, self.height))
 
     def add_frames(self, frames: list[np.ndarray | Image.Image]):
         """Add multiple frames at once."""
@@ -64,52 +271,36 @@ class GIFBuilder:
         Returns:
             List of color-optimized frames
         """
-        optimized = []
-
         if use_global_palette and len(self.frames) > 1:
-            # Create a global palette from all frames
-            # Sample frames to build palette
-            sample_size = min(5, len(self.frames))
-            sample_indices = [int(i * len(self.frames) / sample_size) for i in range(sample_size)]
-            sample_frames = [self.frames[i] for i in sample_indices]
-
-            # Combine sample frames into a single image for palette generation
-            # Flatten each frame to get all pixels, then stack them
-            all_pixels = np.vstack([f.reshape(-1, 3) for f in sample_frames])  # (total_pixels, 3)
-
-            # Create a properly-shaped RGB image from the pixel data
-            # We'll make a roughly square image from all the pixels
-            total_pixels = len(all_pixels)
-            width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
-            height = (total_pixels + width - 1) // width  # Ceiling division
-
-            # Pad if necessary to fill the rectangle
-            pixels_needed = width * height
-            if pixels_needed > total_pixels:
-                padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
-                all_pixels = np.vstack([all_pixels, padding])
-
-            # Reshape to proper RGB image format (H, W, 3)
-            img_array = all_pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
-            combined_img = Image.fromarray(img_array, mode='RGB')
-
-            # Generate global palette
-            global_palette = combined_img.quantize(colors=num_colors, method=2)
-
-            # Apply global palette to all frames
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(palette=global_palette, dither=1)
-                optimized.append(np.array(quantized.convert('RGB')))
-        else:
-            # Use per-frame quantization
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(colors=num_colors, method=2, dither=1)
-                optimized.append(np.array(quantized.convert('RGB')))
+            palette, indexed_frames = self.quantize_frames(num_colors)
+            return [palette[indices] for indices in indexed_frames]
+
+        # Use per-frame quantization
+        optimized = []
+        for frame in self.frames:
+            pil_frame = Image.fromarray(frame)
+            quantized = pil_frame.quantize(colors=num_colors, method=2, dither=1)
+            optimized.append(np.array(quantized.convert('RGB')))
 
         return optimized
 
+    def quantize_frames(self, num_colors: int = 128, dither: bool = False) -> tuple[np.ndarray, list[np.ndarray]]:
+        """
+        Map all frames onto one global palette.
+
+        The palette is built once from a sample of frames, then every frame
+        is converted to palette indices in a single batched pass.
+
+        Args:
+            num_colors: Target number of colors (8-256)
+            dither: Use Floyd-Steinberg dithering instead of nearest colors
+
+        Returns:
+            Tuple of (palette as (N, 3) uint8 array, list of (H, W) uint8 index frames)
+        """
+        palette = build_palette(self.frames, num_colors)
+        return palette, map_to_palette(self.frames, palette, dither=dither)
+
     def deduplicate_frames(self, threshold: float = 0.995) -> int:
         """
         Remove duplicate or near-duplicate consecutive frames.
@@ -128,12 +319,7 @@ class GIFBuilder:
 
         for i in range(1, len(self.frames)):
             # Compare with previous frame
-            prev_frame = np.array(deduplicated[-1], dtype=np.float32)
-            curr_frame = np.array(self.frames[i], dtype=np.float32)
-
-            # Calculate similarity (normalized)
-            diff = np.abs(prev_frame - curr_frame)
-            similarity = 1.0 - (np.mean(diff) / 255.0)
+            similarity = frame_similarity(deduplicated[-1], self.frames[i])
 
             # Keep frame if sufficiently different
             # High threshold (0.995) means only remove truly identical frames
@@ -146,7 +332,8 @@ class GIFBuilder:
         return removed_count
 
     def save(self, output_path: str | Path, num_colors: int = 128,
-             optimize_for_emoji: bool = False, remove_duplicates: bool = True) -> dict:
+             optimize_for_emoji: bool = False, remove_duplicates: bool = True,
+             dither: bool = False) -> dict:
         """
         Save frames as optimized GIF for Slack.
 
@@ -155,6 +342,8 @@ class GIFBuilder:
             num_colors: Number of colors to use (fewer = smaller file)
             optimize_for_emoji: If True, optimize for <64KB emoji size
             remove_duplicates: Remove duplicate consecutive frames
+            dither: Floyd-Steinberg dither to the palette (smoother gradients,
+                but slower and usually larger); off by default
 
         Returns:
             Dictionary with file info (path, size, dimensions, frame_count)
@@ -193,19 +382,15 @@ class GIFBuilder:
                 keep_every = max(1, len(self.frames) // 12)
                 self.frames = [self.frames[i] for i in range(0, len(self.frames), keep_every)]
 
-        # Optimize colors with global palette
-        optimized_frames = self.optimize_colors(num_colors, use_global_palette=True)
+        # Map frames onto a global palette and hand the indices to the encoder as-is,
+        # leaving one palette slot free for the transparent index of delta frames
+        palette, optimized_frames = self.quantize_frames(num_colors - 1, dither=dither)
 
         # Calculate frame duration in milliseconds
         frame_duration = 1000 / self.fps
 
         # Save GIF
-        imageio.imwrite(
-            output_path,
-            optimized_frames,
-            duration=frame_duration,
-            loop=0  # Infinite loop
-        )
+        write_indexed_gif(output_path, palette, optimized_frames, duration=frame_duration)
 
         # Get file info
         file_size_kb = output_path.stat().st_size / 1024
@@ -222,25 +407,199 @@ class GIFBuilder:
             'colors': num_colors
         }
 
-        # Print info
-        print(f"\n✓ GIF created successfully!")
-        print(f"  Path: {output_path}")
-        print(f"  Size: {file_size_kb:.1f} KB ({file_size_mb:.2f} MB)")
-        print(f"  Dimensions: {self.width}x{self.height}")
-        print(f"  Frames: {len(optimized_frames)} @ {self.fps} fps")
-        print(f"  Duration: {info['duration_seconds']:.1f}s")
-        print(f"  Colors: {num_colors}")
-
-        # Warnings
-        if optimize_for_emoji and file_size_kb > 64:
-            print(f"\n⚠️  WARNING: Emoji file size ({file_size_kb:.1f} KB) exceeds 64 KB limit")
-            print("   Try: fewer frames, fewer colors, or simpler design")
-        elif not optimize_for_emoji and file_size_kb > 2048:
-            print(f"\n⚠️  WARNING: File size ({file_size_kb:.1f} KB) is large for Slack")
-            print("   Try: fewer frames, smaller dimensions, or fewer colors")
+        _print_gif_info(info, is_emoji=optimize_for_emoji)
+
+        return info
+
+    def save_optimized(self, output_path: str | Path, is_emoji: bool = True,
+                       max_bytes: Optional[int] = None, time_budget: float = 10.0) -> dict:
+        """
+        Save the best-looking GIF that fits Slack's size limit.
+
+        Searches dimensions, colors, frame stride and lossy stabilization
+        (see core.gif_optimizer) instead of applying fixed emoji settings.
+
+        Args:
+            output_path: Where to save the GIF
+            is_emoji: Target the 64 KB emoji limit instead of the 2 MB message limit
+            max_bytes: Custom size budget in bytes (overrides the Slack limit)
+            time_budget: Seconds to spend searching before taking the best result so far
+
+        Returns:
+            Dictionary with file info (path, size, dimensions, frame_count) and
+            'optimization' details of the chosen settings
+        """
+        from core.gif_optimizer import SLACK_EMOJI_MAX_BYTES, SLACK_MESSAGE_MAX_BYTES, optimize_gif
+
+        if not self.frames:
+            raise ValueError("No frames to save. Add frames with add_frame() first.")
+
+        if max_bytes is None:
+            max_bytes = SLACK_EMOJI_MAX_BYTES if is_emoji else SLACK_MESSAGE_MAX_BYTES
+
+        self.deduplicate_frames(threshold=0.98)
+        data, details = optimize_gif(self.frames, self.fps, max_bytes, is_emoji, time_budget)
+
+        output_path = Path(output_path)
+        output_path.write_bytes(data)
+
+        file_size_kb = len(data) / 1024
+        info = {
+            'path': str(output_path),
+            'size_kb': file_size_kb,
+            'size_mb': file_size_kb / 1024,
+            'dimensions': f"{details['width']}x{details['height']}",
+            'frame_count': details['frame_count'],
+            'fps': details['fps'],
+            'duration_seconds': details['frame_count'] / details['fps'],
+            'colors': details['colors'],
+            'optimization': details
+        }
+
+        print(f"  Tried {details['candidates_encoded']} encodings "
+              f"({details['candidates_skipped']} skipped by size estimate) in {details['search_seconds']:.1f}s")
+        if not details['fits']:
+            print(f"  No settings fit in {max_bytes / 1024:.0f} KB within {time_budget:.0f}s; saved the smallest found")
+        _print_gif_info(info, is_emoji=is_emoji)
 
         return info
 
     def clear(self):
         """Clear all frames (useful for creating multiple GIFs)."""
-        self.frames = []
\ No newline at end of file
+        self.frames = []
+
+
+class StreamingGIFBuilder:
+    """
+    Builder that encodes frames as they are added instead of holding them until save.
+
+    Only the first `palette_window` frames are buffered, to build the global
+    palette; after that each frame is written as soon as the next distinct
+    frame arrives, so memory use does not grow with the animation length.
+    Colors that first appear after the palette window are mapped to their
+    nearest palette entry.
+    """
+
+    def __init__(self, output_path: str | Path, width: int = 480, height: int = 480, fps: int = 15,
+                 num_colors: int = 128, remove_duplicates: bool = True, palette_window: int = 16):
+        """
+        Initialize streaming GIF builder.
+
+        Args:
+            output_path: Where to save the GIF
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second
+            num_colors: Number of colors to use (fewer = smaller file)
+            remove_duplicates: Merge near-duplicate consecutive frames into one longer frame
+            palette_window: Number of leading frames sampled for the global palette
+        """
+        self.output_path = Path(output_path)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.num_colors = num_colors
+        self.remove_duplicates = remove_duplicates
+        self.palette_window = palette_window
+
+        self.frames_added = 0
+        self.frames_removed = 0
+        self._saved = False
+        self._window: Optional[list[tuple[np.ndarray, float]]] = []
+        self._writer: Optional[GIFWriter] = None
+        self._mapper: Optional[PaletteMapper] = None
+        # Last distinct frame, held back so duplicates can extend its duration
+        self._pending: Optional[np.ndarray] = None
+        self._pending_duration = 0.0
+
+    def add_frame(self, frame: np.ndarray | Image.Image):
+        """
+        Add a frame to the GIF, writing earlier frames out as soon as possible.
+
+        Args:
+            frame: Frame as numpy array or PIL Image (will be converted to RGB)
+        """
+        if self._saved:
+            raise ValueError("GIF already saved. Create a new StreamingGIFBuilder for another GIF.")
+
+        frame = fit_frame(frame, self.width, self.height)
+        self.frames_added += 1
+        frame_duration = 1000 / self.fps
+
+        if self.remove_duplicates and self._pending is not None \
+                and frame_similarity(self._pending, frame) >= 0.98:
+            self._pending_duration += frame_duration
+            self.frames_removed += 1
+            return
+
+        if self._pending is not None:
+            self._emit(self._pending, self._pending_duration)
+        self._pending = frame
+        self._pending_duration = frame_duration
+
+    def add_frames(self, frames: list[np.ndarray | Image.Image]):
+        """Add multiple frames at once."""
+        for frame in frames:
+            self.add_frame(frame)
+
+    def _emit(self, frame: np.ndarray, duration: float):
+        """Buffer a frame until the palette is built, then write it."""
+        if self._writer is None:
+            self._window.append((frame, duration))
+            if len(self._window) < self.palette_window:
+                return
+            self._open()
+        else:
+            self._writer.add_frame(self._mapper.map(frame), duration)
+
+    def _open(self):
+        """Build the palette from the buffered frames, start the file and flush the buffer."""
+        # Leave one palette slot free for the transparent index of delta frames
+        palette = build_palette([frame for frame, _ in self._window], self.num_colors - 1)
+        self._mapper = PaletteMapper(palette)
+        self._writer = GIFWriter(self.output_path, self.width, self.height, palette)
+        for frame, duration in self._window:
+            self._writer.add_frame(self._mapper.map(frame), duration)
+        self._window = None
+
+    def save(self) -> dict:
+        """
+        Write any remaining frames and finish the GIF.
+
+        Returns:
+            Dictionary with file info (path, size, dimensions, frame_count)
+        """
+        if self._pending is None:
+            raise ValueError("No frames to save. Add frames with add_frame() first.")
+
+        self._emit(self._pending, self._pending_duration)
+        self._pending = None
+        if self._writer is None:
+            self._open()
+        self._writer.close()
+        self._saved = True
+
+        if self.frames_removed > 0:
+            print(f"  Removed {self.frames_removed} duplicate frames")
+
+        file_size_kb = self.output_path.stat().st_size / 1024
+        info = {
+            'path': str(self.output_path),
+            'size_kb': file_size_kb,
+            'size_mb': file_size_kb / 1024,
+            'dimensions': f'{self.width}x{self.height}',
+            'frame_count': self._writer.frame_count,
+            'fps': self.fps,
+            'duration_seconds': self.frames_added / self.fps,
+            'colors': self.num_colors
+        }
+        _print_gif_info(info)
+        return info
+
+    def __enter__(self) -> 'StreamingGIFBuilder':
+        return self
+
+    def __exit__(self, *exc_info):
+        # Close the file without finishing the GIF if save() was never reached
+        if self._writer is not None:
+            self._writer.close()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+GIF Optimizer - Find the best-looking encoding that fits a Slack size limit.
+
+Instead of fixed rules (resize to 128, cap colors at 48, keep every nth
+frame), the optimizer searches over dimensions, color count, frame stride
+and lossy frame stabilization. Candidates are tried from highest to lowest
+quality; a size model calibrated on each real encode skips candidates that
+cannot fit, so only a few full encodes are needed.
+"""
+
+from io import BytesIO
+import math
+import time
+from typing import Optional
+from PIL import Image
+import numpy as np
+
+from core.gif_builder import build_palette, map_to_palette
+from core.gif_writer import GIFWriter
+
+
+# Slack upload limits, matching validators.check_slack_size
+SLACK_EMOJI_MAX_BYTES = 64 * 1024
+SLACK_MESSAGE_MAX_BYTES = 2048 * 1024
+
+# Search space, best quality first
+EMOJI_SIZES = (128, 112, 96, 80, 64)
+MESSAGE_SCALES = (1.0, 0.875, 0.75, 0.625, 0.5)
+MESSAGE_MIN_SIDE = 320
+COLOR_COUNTS = (256, 192, 128, 96, 64, 48, 32, 24, 16)
+FRAME_STRIDES = (1, 2, 3, 4)
+LOSSY_THRESHOLDS = (0, 6, 12, 24)
+
+# Candidates whose estimated size exceeds the budget by more than this factor are skipped
+ESTIMATE_MARGIN = 1.2
+
+
+def _quality(size_ratio: float, colors: int, stride: int, lossy: int) -> float:
+    """
+    Heuristic quality score of an encoding, 1.0 being the unmodified animation.
+
+    Resolution counts most, then frame rate, then colors and lossy stabilization.
+    """
+    return (
+        size_ratio ** 2
+        * (1 / stride) ** 0.6
+        * (math.log2(colors) / 8) ** 0.5
+        * (1 - lossy / 64)
+    )
+
+
+def _estimate_bytes(reference: dict, pixels: int, frames: int, colors: int, lossy: int) -> float:
+    """Scale a measured encode to other settings: bytes grow with pixels, frames and bits per color."""
+    return (
+        reference['bytes']
+        * pixels / reference['pixels']
+        * frames / reference['frames']
+        * math.log2(colors) / math.log2(reference['colors'])
+        * (1 + reference['lossy'] / 16) / (1 + lossy / 16)
+    )
+
+
+def stabilize_frames(frames: list[np.ndarray], threshold: int) -> list[np.ndarray]:
+    """
+    Copy pixels that barely changed from the previous frame (lossy).
+
+    Pixels whose channels all differ from the previous output frame by at
+    most `threshold` keep the previous value, so delta encoding can treat
+    them as unchanged. This removes noise and gradient flicker.
+
+    Args:
+        frames: RGB frames as (H, W, 3) uint8 arrays
+        threshold: Maximum per-channel difference to ignore (0 = lossless)
+
+    Returns:
+        Stabilized frames
+    """
+    if threshold <= 0:
+        return frames
+
+    stabilized = [frames[0]]
+    previous = frames[0].astype(np.int16)
+    for frame in frames[1:]:
+        current = frame.astype(np.int16)
+        still = (np.abs(current - previous).max(axis=2) <= threshold)[..., None]
+        previous = np.where(still, previous, current)
+        stabilized.append(previous.astype(np.uint8))
+    return stabilized
+
+
+def encode_gif(frames: list[np.ndarray], num_colors: int, duration: float,
+               palette: Optional[np.ndarray] = None) -> bytes:
+    """
+    Encode RGB frames as a delta-encoded GIF in memory.
+
+    Args:
+        frames: RGB frames as (H, W, 3) uint8 arrays
+        num_colors: Number of colors, including the transparent index
+        duration: Frame duration in milliseconds
+        palette: Palette as (N, 3) uint8 array, N < num_colors (default: built from frames)
+
+    Returns:
+        GIF file contents
+    """
+    if palette is None:
+        palette = build_palette(frames, num_colors - 1)
+    height, width = frames[0].shape[:2]
+    buffer = BytesIO()
+    with GIFWriter(buffer, width, height, palette) as writer:
+        for indices in map_to_palette(frames, palette):
+            writer.add_frame(indices, duration)
+    return buffer.getvalue()
+
+
+def _target_sizes(width: int, height: int, is_emoji: bool) -> list[tuple[int, int]]:
+    """Candidate output dimensions, largest first."""
+    if is_emoji:
+        return [(side, side) for side in EMOJI_SIZES if side <= max(width, height)] or [(width, height)]
+
+    sizes = []
+    for scale in MESSAGE_SCALES:
+        size = (round(width * scale), round(height * scale))
+        if scale == 1.0 or min(size) >= MESSAGE_MIN_SIDE:
+            sizes.append(size)
+    return sizes
+
+
+def optimize_gif(frames: list[np.ndarray], fps: float, max_bytes: int, is_emoji: bool = True,
+                 time_budget: float = 10.0) -> tuple[bytes, dict]:
+    """
+    Find the highest-quality GIF encoding of frames that fits in max_bytes.
+
+    Args:
+        frames: RGB frames as (H, W, 3) uint8 arrays
+        fps: Frames per second of the source animation
+        max_bytes: Size budget in bytes
+        is_emoji: Search emoji dimensions (square, 64-128px) instead of message dimensions
+        time_budget: Seconds after which the search stops with the best result so far
+
+    Returns:
+        Tuple of (GIF bytes, details dict with the chosen settings, whether it
+        fits, and how many candidates were encoded or skipped)
+    """
+    start = time.perf_counter()
+    height, width = frames[0].shape[:2]
+
+    candidates = []
+    for size in _target_sizes(width, height, is_emoji):
+        size_ratio = min(1.0, size[0] / width)
+        for colors in COLOR_COUNTS:
+            for stride in FRAME_STRIDES:
+                if stride > 1 and len(frames) // stride < 2:
+                    continue
+                for lossy in LOSSY_THRESHOLDS:
+                    candidates.append((_quality(size_ratio, colors, stride, lossy), size, colors, stride, lossy))
+    candidates.sort(key=lambda c: -c[0])
+
+    resized_cache: dict[tuple[int, int], list[np.ndarray]] = {}
+    # One palette per size and color count, shared by every stride and lossy
+    # setting so their candidates reuse the same palette mapper
+    palette_cache: dict[tuple[tuple[int, int], int], np.ndarray] = {}
+
+    def encode(candidate: tuple) -> tuple[bytes, dict]:
+        quality, size, colors, stride, lossy = candidate
+        if size not in resized_cache:
+            resized_cache[size] = frames if size == (width, height) else [
+                np.array(Image.fromarray(f).resize(size, Image.Resampling.LANCZOS)) for f in frames
+            ]
+        if (size, colors) not in palette_cache:
+            palette_cache[(size, colors)] = build_palette(resized_cache[size], colors - 1)
+        selected = stabilize_frames(resized_cache[size][::stride], lossy)
+        data = encode_gif(selected, colors, duration=1000 * stride / fps, palette=palette_cache[(size, colors)])
+        return data, {
+            'width': size[0],
+            'height': size[1],
+            'colors': colors,
+            'frame_stride': stride,
+            'lossy': lossy,
+            'frame_count': len(selected),
+            'fps': fps / stride,
+            'quality': round(quality, 3),
+        }
+
+    reference = None
+    best = None      # Best encoding that fits
+    smallest = None  # Fallback if nothing fits
+    last_tried = None
+    encoded = skipped = 0
+
+    for candidate in candidates:
+        _quality_score, size, colors, stride, lossy = candidate
+        kept = len(frames[::stride])
+        pixels = size[0] * size[1]
+
+        if reference is not None and \
+                _estimate_bytes(reference, pixels, kept, colors, lossy) > max_bytes * ESTIMATE_MARGIN:
+            skipped += 1
+            continue
+        if encoded and time.perf_counter() - start > time_budget:
+            break
+
+        data, settings = encode(candidate)
+        encoded += 1
+        last_tried = candidate
+        reference = {'bytes': len(data), 'pixels': pixels, 'frames': kept, 'colors': colors, 'lossy': lossy}
+
+        if smallest is None or len(data) < len(smallest[0]):
+            smallest = (data, settings)
+        if len(data) <= max_bytes:
+            # Candidates are sorted by quality, so the first fit is the best one
+            best = (data, settings)
+            break
+
+    if best is None and last_tried is not candidates[-1]:
+        # Nothing fit (or the size model was off): fall back to the smallest settings
+        data, settings = encode(candidates[-1])
+        encoded += 1
+        if len(data) < len(smallest[0]):
+            smallest = (data, settings)
+        if len(data) <= max_bytes:
+            best = (data, settings)
+
+    data, settings = best or smallest
+    return data, {
+        **settings,
+        'size_bytes': len(data),
+        'max_bytes': max_bytes,
+        'fits': best is not None,
+        'candidates_encoded': encoded,
+        'candidates_skipped': skipped,
+        'search_seconds': time.perf_counter() - start,
+    }
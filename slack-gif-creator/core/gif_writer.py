@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+GIF Writer - Write palette-indexed frames to a GIF file one at a time.
+
+The header and global palette are written up front and each frame is
+appended as soon as it is given, so nothing but the current frame has to
+be held in memory. LZW compression of the pixel data is done by Pillow.
+
+Frames added with add_frame() are delta-encoded: only the rectangle that
+changed since the previous frame is stored, with unchanged pixels inside
+it marked transparent so they compress to long runs of one index.
+"""
+
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Optional
+import struct
+from PIL import Image
+import numpy as np
+
+
+# Disposal methods from the GIF89a graphic control extension
+DISPOSAL_NONE = 1        # Leave the frame in place; the next frame draws over it
+DISPOSAL_BACKGROUND = 2  # Clear the frame's rectangle before the next frame
+
+
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    """Return the position just past a chain of GIF data sub-blocks."""
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+def encode_image_data(indices: np.ndarray, palette_bits: int) -> bytes:
+    """
+    LZW-encode palette indices as GIF image data.
+
+    Args:
+        indices: (H, W) uint8 array of palette indices
+        palette_bits: Bits per index of the palette the indices refer to (1-8)
+
+    Returns:
+        LZW minimum code size byte followed by the data sub-blocks and terminator
+    """
+    image = Image.fromarray(np.ascontiguousarray(indices, dtype=np.uint8))
+    # Only the palette size matters here; the palette itself is written by GIFWriter
+    image.putpalette([0, 0, 0] * (1 << palette_bits))
+
+    buffer = BytesIO()
+    image.save(buffer, format='GIF', optimize=False, interlace=False)
+    data = buffer.getvalue()
+
+    # Walk the single-frame GIF Pillow wrote to find its image data
+    pos = 13
+    if data[10] & 0x80:
+        pos += 3 << ((data[10] & 0x07) + 1)
+    while data[pos] == 0x21:
+        pos = _skip_sub_blocks(data, pos + 2)
+
+    flags = data[pos + 9]
+    pos += 10
+    if flags & 0x80:
+        pos += 3 << ((flags & 0x07) + 1)
+    return data[pos:_skip_sub_blocks(data, pos + 1)]
+
+
+def changed_region(previous: np.ndarray, current: np.ndarray) -> Optional[tuple[int, int, int, int]]:
+    """
+    Find the bounding box of the pixels that differ between two frames.
+
+    Args:
+        previous: (H, W) uint8 array of palette indices
+        current: (H, W) uint8 array of palette indices
+
+    Returns:
+        (left, top, right, bottom) with exclusive right/bottom, or None if the frames are identical
+    """
+    changed = previous != current
+    rows = np.flatnonzero(changed.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+class GIFWriter:
+    """Streams palette-indexed frames into a GIF file."""
+
+    def __init__(self, output_path: str | Path | BinaryIO, width: int, height: int,
+                 palette: np.ndarray, loop: int = 0):
+        """
+        Open the output file and write the GIF header and global palette.
+
+        Args:
+            output_path: Where to save the GIF, or a binary file object to write to
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            palette: Global palette as (N, 3) uint8 array, N <= 256. With fewer
+                than 256 colors, index N is used as the transparent index for
+                delta frames
+            loop: Number of loops (0 = infinite)
+        """
+        self.width = width
+        self.height = height
+        self.frame_count = 0
+        self._elapsed_ms = 0.0
+        self.transparent_index = len(palette) if len(palette) < 256 else None
+        self.palette_bits = max(1, int(np.ceil(np.log2(min(len(palette) + 1, 256)))))
+        # Full-canvas indices of the last frame given to add_frame, and the
+        # encoded frame held back in case the next one is identical
+        self._canvas: Optional[np.ndarray] = None
+        self._pending: Optional[dict] = None
+
+        table = np.zeros((1 << self.palette_bits, 3), dtype=np.uint8)
+        table[:len(palette)] = palette
+
+        self._owns_file = not hasattr(output_path, 'write')
+        self._file = open(output_path, 'wb') if self._owns_file else output_path
+        self._closed = False
+        self._file.write(b'GIF89a')
+        self._file.write(struct.pack('<HHBBB', width, height, 0xF0 | (self.palette_bits - 1), 0, 0))
+        self._file.write(table.tobytes())
+        # NETSCAPE2.0 application extension for looping
+        self._file.write(b'\x21\xFF\x0BNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+
+    def write_frame(self, indices: np.ndarray, duration: float, left: int = 0, top: int = 0,
+                    disposal: int = DISPOSAL_NONE, transparency: int | None = None):
+        """
+        Append one frame.
+
+        Args:
+            indices: (H, W) uint8 array of palette indices; may cover only part of the canvas
+            duration: Frame duration in milliseconds
+            left: X offset of the frame on the canvas
+            top: Y offset of the frame on the canvas
+            disposal: What happens to the frame before the next one (DISPOSAL_*)
+            transparency: Palette index treated as transparent, if any
+        """
+        height, width = indices.shape
+        # GIF delays are in hundredths of a second; round the running total so errors don't add up
+        delay = max(1, round((self._elapsed_ms + duration) / 10) - round(self._elapsed_ms / 10))
+        self._elapsed_ms += duration
+        flags = (disposal << 2) | (1 if transparency is not None else 0)
+        self._file.write(struct.pack('<BBBBHBB', 0x21, 0xF9, 4, flags, delay, transparency or 0, 0))
+        self._file.write(struct.pack('<BHHHHB', 0x2C, left, top, width, height, 0))
+        self._file.write(encode_image_data(indices, self.palette_bits))
+        self.frame_count += 1
+
+    def add_frame(self, indices: np.ndarray, duration: float):
+        """
+        Append a full-canvas frame, storing only what changed since the previous one.
+
+        A frame identical to the previous one extends that frame's duration
+        instead of being stored.
+
+        Args:
+            indices: (height, width) uint8 array of palette indices
+            duration: Frame duration in milliseconds
+        """
+        if self._canvas is None:
+            region = (0, 0, self.width, self.height)
+        else:
+            region = changed_region(self._canvas, indices)
+            if region is None:
+                self._pending['duration'] += duration
+                return
+
+        left, top, right, bottom = region
+        sub = indices[top:bottom, left:right]
+        transparency = None
+        if self._canvas is not None and self.transparent_index is not None:
+            unchanged = self._canvas[top:bottom, left:right] == sub
+            if unchanged.any():
+                sub = np.where(unchanged, np.uint8(self.transparent_index), sub)
+                transparency = self.transparent_index
+
+        self._flush()
+        self._pending = {'indices': sub, 'duration': duration, 'left': left, 'top': top,
+                         'transparency': transparency}
+        self._canvas = indices
+
+    def _flush(self):
+        """Write the frame held back by add_frame, if any."""
+        if self._pending is not None:
+            # Delta frames draw over the previous one, so it must stay in place
+            self.write_frame(disposal=DISPOSAL_NONE, **self._pending)
+            self._pending = None
+
+    def close(self):
+        """Write any held-back frame and the GIF trailer, then close the file if opened here."""
+        if not self._closed:
+            self._flush()
+            self._file.write(b'\x3B')
+            self._closed = True
+            if self._owns_file:
+                self._file.close()
+
+    def __enter__(self) -> 'GIFWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -6,9 +6,12 @@ This module provides high-quality text rendering that looks crisp and profession
 in GIFs, with outlines for readability and effects for visual impact.
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from typing import Optional
 
+from core.frame_composer import cache_stats
+
 
 # Typography scale - proportional sizing system
 TYPOGRAPHY_SCALE = {
@@ -22,16 +25,20 @@ TYPOGRAPHY_SCALE = {
 }
 
 
-def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+# Number of loaded (size, bold) fonts kept in memory
+FONT_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _resolve_font_path(bold: bool) -> Optional[str]:
     """
-    Get a font with fallback support.
+    Find the first usable font file, probing the filesystem once per variant.
 
     Args:
-        size: Font size in pixels
-        bold: Use bold variant if available
+        bold: Look for the bold variant
 
     Returns:
-        ImageFont object
+        Path of the font file, or None if none can be loaded
     """
     # Try multiple font paths for cross-platform support
     font_paths = [
@@ -47,9 +54,32 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
 
     for font_path in font_paths:
         try:
-            return ImageFont.truetype(font_path, size)
+            ImageFont.truetype(font_path, TYPOGRAPHY_SCALE['body'])
+            return font_path
         except:
             continue
+    return None
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """
+    Get a font with fallback support.
+
+    The font file is looked up once per variant and each (size, bold) font
+    is loaded once; the least recently used fonts are dropped beyond
+    FONT_CACHE_SIZE. Fonts are shared between callers, so don't modify them.
+
+    Args:
+        size: Font size in pixels
+        bold: Use bold variant if available
+
+    Returns:
+        ImageFont object
+    """
+    font_path = _resolve_font_path(bold)
+    if font_path is not None:
+        return ImageFont.truetype(font_path, size)
 
     # Ultimate fallback
     return ImageFont.load_default()
@@ -291,6 +321,7 @@ def draw_text_in_box(
     return frame
 
 
+@lru_cache(maxsize=1024)
 def get_text_size(text: str, font_size: int, bold: bool = True) -> tuple[int, int]:
     """
     Get the dimensions of text without drawing it.
@@ -318,6 +349,9 @@ def get_optimal_font_size(text: str, max_width: int, max_height: int,
     """
     Find the largest font size that fits within given dimensions.
 
+    Tries sizes from start_size down in steps of 2. Text grows with the
+    font size, so a binary search needs only a few measurements.
+
     Args:
         text: Text to size
         max_width: Maximum width in pixels
@@ -327,15 +361,33 @@ def get_optimal_font_size(text: str, max_width: int, max_height: int,
     Returns:
         Optimal font size
     """
-    font_size = start_size
-    while font_size > 10:
-        width, height = get_text_size(text, font_size)
+    sizes = range(start_size, 10, -2)
+
+    # Find the first (largest) size that fits
+    low, high = 0, len(sizes)
+    while low < high:
+        middle = (low + high) // 2
+        width, height = get_text_size(text, sizes[middle])
         if width <= max_width and height <= max_height:
-            return font_size
-        font_size -= 2
+            high = middle
+        else:
+            low = middle + 1
+
+    if low < len(sizes):
+        return sizes[low]
     return 10  # Minimum font size
 
 
+def get_font_cache_stats() -> dict:
+    """
+    Get hit/miss counts of the cached fonts and text measurements.
+
+    Returns:
+        Dictionary with 'fonts' and 'text_sizes' cache info (hits, misses, size, hit_rate)
+    """
+    return cache_stats({'fonts': get_font, 'text_sizes': get_text_size})
+
+
 def scale_font_for_frame(base_size: int, frame_width: int, frame_height: int) -> int:
     """
     Scale font size proportionally to frame dimensions.
@@ -222,11 +222,13 @@ def get_optimization_suggestions(results: dict) -> list[str]:
                 suggestions.append("  - Use 32-40 colors maximum")
                 suggestions.append("  - Remove gradients (solid colors compress better)")
                 suggestions.append("  - Simplify design")
+                suggestions.append("  - Or use GIFBuilder.save_optimized() to search for settings that fit")
             else:
                 suggestions.append(f"Reduce file size by {overage:.1f} KB:")
                 suggestions.append("  - Reduce frame count or FPS")
                 suggestions.append("  - Use fewer colors (128 → 64)")
                 suggestions.append("  - Reduce dimensions")
+                suggestions.append("  - Or use GIFBuilder.save_optimized(is_emoji=False) to search for settings that fit")
 
         # Dimension suggestions
         if not dim_info.get('optimal', True) and dim_info.get('type') == 'emoji':
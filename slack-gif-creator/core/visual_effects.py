@@ -6,6 +6,8 @@ This module provides high-impact visual effects that make animations feel
 professional and dynamic while keeping file sizes reasonable.
 """
 
+from collections.abc import MutableSequence
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFilter
 import numpy as np
 import math
@@ -103,12 +105,222 @@ class Particle:
             draw.line(points, fill=color, width=2)
 
 
+# Shape codes used by ParticleSystem's arrays
+PARTICLE_SHAPES = ('circle', 'square', 'star')
+
+# Per-particle fields ParticleSystem keeps one array of each
+_PARTICLE_FIELDS = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'gravity', 'drag', 'size', 'color', 'shape')
+
+
+@lru_cache(maxsize=256)
+def _particle_stamp(shape: str, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize one particle shape once and return the pixel offsets it covers.
+
+    Uses the same drawing calls as Particle.render, so batched particles
+    look exactly like individually drawn ones.
+
+    Returns:
+        (dy, dx) integer arrays of pixel offsets from the particle position
+    """
+    pad = 2 * size + 2
+    mask = Image.new('L', (2 * pad + 1, 2 * pad + 1), 0)
+    draw = ImageDraw.Draw(mask)
+    x = y = pad
+
+    if shape == 'circle':
+        draw.ellipse([x - size, y - size, x + size, y + size], fill=255)
+    elif shape == 'square':
+        draw.rectangle([x - size, y - size, x + size, y + size], fill=255)
+    elif shape == 'star':
+        points = [
+            (x, y - size),
+            (x - size // 2, y),
+            (x, y),
+            (x, y + size),
+            (x, y),
+            (x + size // 2, y),
+        ]
+        draw.line(points, fill=255, width=2)
+
+    dy, dx = np.nonzero(np.array(mask))
+    return dy - pad, dx - pad
+
+
+def draw_particles(frame: Image.Image, x: np.ndarray, y: np.ndarray, colors: np.ndarray,
+                   sizes: np.ndarray, shapes: np.ndarray | int = 0):
+    """
+    Draw many particles onto an RGB or RGBA frame at once.
+
+    Each distinct (shape, size) is rasterized once and stamped at every
+    particle position in a single NumPy scatter. Where particles overlap,
+    larger ones are drawn over smaller ones.
+
+    Args:
+        frame: PIL Image to draw on (modified in place)
+        x, y: Particle positions (truncated to whole pixels)
+        colors: (N, 3) RGB colors
+        sizes: Particle sizes (radius in pixels)
+        shapes: Index into PARTICLE_SHAPES per particle, or one index for all
+    """
+    px = np.asarray(x).astype(np.int64)
+    py = np.asarray(y).astype(np.int64)
+    colors = np.asarray(colors).astype(np.uint8)
+    sizes = np.maximum(0, np.asarray(sizes).astype(np.int64))
+    shapes = np.broadcast_to(np.asarray(shapes, dtype=np.int64), px.shape)
+    if px.size == 0:
+        return
+
+    pixels = np.array(frame)
+    height, width, channels = pixels.shape
+    flat = pixels.reshape(-1, channels)
+    if channels == 4:
+        # Particles are opaque
+        colors = np.column_stack([colors, np.full(len(colors), 255, dtype=np.uint8)])
+
+    keys = sizes * len(PARTICLE_SHAPES) + shapes
+    order = np.argsort(keys, kind='stable')
+    group_keys, starts = np.unique(keys[order], return_index=True)
+    for key, members in zip(group_keys, np.split(order, starts[1:])):
+        stamp_size, shape_code = divmod(int(key), len(PARTICLE_SHAPES))
+        dy, dx = _particle_stamp(PARTICLE_SHAPES[shape_code], stamp_size)
+        gx, gy = px[members], py[members]
+
+        # Particles whose whole stamp is on the frame are written with flat offsets
+        inside = ((gx + dx.min() >= 0) & (gx + dx.max() < width)
+                  & (gy + dy.min() >= 0) & (gy + dy.max() < height))
+        whole = members[inside]
+        flat[(py[whole] * width + px[whole])[:, None] + (dy * width + dx)] = colors[whole][:, None]
+
+        # Particles on the edge are clipped pixel by pixel
+        edge = members[~inside]
+        if edge.size:
+            ys = py[edge, None] + dy
+            xs = px[edge, None] + dx
+            visible = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+            rows = np.broadcast_to(np.arange(edge.size)[:, None], ys.shape)
+            pixels[ys[visible], xs[visible]] = colors[edge][rows[visible]]
+
+    frame.paste(Image.fromarray(pixels))
+
+
+class _ParticleView(Particle):
+    """A Particle whose fields read and write one entry of a ParticleSystem's arrays."""
+
+    def __init__(self, system: 'ParticleSystem', index: int):
+        object.__setattr__(self, '_system', system)
+        object.__setattr__(self, '_index', index)
+
+    def __getattr__(self, name):
+        if name not in _PARTICLE_FIELDS:
+            raise AttributeError(name)
+        value = getattr(self._system, name)[self._index]
+        if name == 'color':
+            return tuple(int(c) for c in value)
+        if name == 'shape':
+            return PARTICLE_SHAPES[value]
+        if name == 'size':
+            return int(value)
+        return float(value)
+
+    def __setattr__(self, name, value):
+        if name not in _PARTICLE_FIELDS:
+            raise AttributeError(f"Particle has no field '{name}'")
+        if name == 'shape':
+            value = PARTICLE_SHAPES.index(value)
+        getattr(self._system, name)[self._index] = value
+
+
+class _ParticleList(MutableSequence):
+    """List of a ParticleSystem's particles that writes changes back to its arrays."""
+
+    def __init__(self, system: 'ParticleSystem'):
+        self._system = system
+
+    def __len__(self) -> int:
+        return self._system.get_particle_count()
+
+    def _position(self, index: int) -> int:
+        if not -len(self) <= index < len(self):
+            raise IndexError("particle index out of range")
+        return index % len(self)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_ParticleView(self._system, i) for i in range(*index.indices(len(self)))]
+        return _ParticleView(self._system, self._position(index))
+
+    def __setitem__(self, index: int, particle: Particle):
+        position = self._position(index)
+        for name, value in self._system._fields_of(particle).items():
+            getattr(self._system, name)[position] = value
+
+    def __delitem__(self, index):
+        keep = np.ones(len(self), dtype=bool)
+        keep[index if isinstance(index, slice) else self._position(index)] = False
+        self._system._keep(keep)
+
+    def pop(self, index: int = -1) -> Particle:
+        view = self[index]
+        particle = Particle(view.x, view.y, view.vx, view.vy, view.lifetime, view.color, view.size, view.shape)
+        particle.max_lifetime = view.max_lifetime
+        particle.gravity = view.gravity
+        particle.drag = view.drag
+        del self[index]
+        return particle
+
+    def insert(self, index: int, particle: Particle):
+        position = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        for name, value in self._system._fields_of(particle).items():
+            setattr(self._system, name, np.insert(getattr(self._system, name), position, value, axis=0))
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} particles>"
+
+
 class ParticleSystem:
-    """Manages a collection of particles."""
+    """
+    Manages a collection of particles.
+
+    Particle state is kept in NumPy arrays (one entry per particle), so
+    update() steps every particle in one vectorized pass and render()
+    stamps all particles of the same shape and size at once.
+    """
 
     def __init__(self):
         """Initialize particle system."""
-        self.particles: list[Particle] = []
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.vx = np.empty(0)
+        self.vy = np.empty(0)
+        self.lifetime = np.empty(0)
+        self.max_lifetime = np.empty(0)
+        self.gravity = np.empty(0)
+        self.drag = np.empty(0)
+        self.size = np.empty(0, dtype=np.int64)
+        self.color = np.empty((0, 3), dtype=np.int64)
+        self.shape = np.empty(0, dtype=np.int8)
+
+    def _rng(self) -> np.random.Generator:
+        """NumPy generator seeded from the `random` module, so random.seed() makes emission reproducible."""
+        return np.random.default_rng(random.getrandbits(64))
+
+    def _add(self, x, y, vx, vy, lifetime, color, size, shape, gravity=0.5, drag=0.98):
+        """Append particles; scalar arguments are broadcast to the number of particles."""
+        count = len(vx)
+        fields = {
+            'x': x, 'y': y, 'vx': vx, 'vy': vy,
+            'lifetime': lifetime, 'max_lifetime': lifetime,
+            'gravity': gravity, 'drag': drag,
+        }
+        for name, values in fields.items():
+            current = getattr(self, name)
+            setattr(self, name, np.concatenate([current, np.broadcast_to(np.asarray(values, dtype=np.float64), count)]))
+
+        self.size = np.concatenate([self.size, np.broadcast_to(np.asarray(size, dtype=np.int64), count)])
+        self.color = np.concatenate([self.color, np.broadcast_to(np.asarray(color, dtype=np.int64), (count, 3))])
+        shape_codes = np.asarray([PARTICLE_SHAPES.index(s) for s in np.atleast_1d(shape)], dtype=np.int8)
+        self.shape = np.concatenate([self.shape, np.broadcast_to(shape_codes, count)])
 
     def emit(self, x: int, y: int, count: int = 10,
              spread: float = 2.0, speed: float = 5.0,
@@ -127,18 +339,15 @@ class ParticleSystem:
             size: Particle size
             shape: Particle shape
         """
-        for _ in range(count):
-            # Random angle and speed
-            angle = random.uniform(0, 2 * math.pi)
-            vel_mag = random.uniform(speed * 0.5, speed * 1.5)
-            vx = math.cos(angle) * vel_mag
-            vy = math.sin(angle) * vel_mag
+        rng = self._rng()
+        # Random angle and speed
+        angle = rng.uniform(0, 2 * math.pi, count)
+        vel_mag = rng.uniform(speed * 0.5, speed * 1.5, count)
 
-            # Random lifetime variation
-            life = random.uniform(lifetime * 0.7, lifetime * 1.3)
+        # Random lifetime variation
+        life = rng.uniform(lifetime * 0.7, lifetime * 1.3, count)
 
-            particle = Particle(x, y, vx, vy, life, color, size, shape)
-            self.particles.append(particle)
+        self._add(x, y, np.cos(angle) * vel_mag, np.sin(angle) * vel_mag, life, color, size, shape)
 
     def emit_confetti(self, x: int, y: int, count: int = 20,
                       colors: Optional[list[tuple[int, int, int]]] = None):
@@ -156,17 +365,16 @@ class ParticleSystem:
                 (107, 185, 240), (162, 155, 254), (255, 182, 193)
             ]
 
-        for _ in range(count):
-            color = random.choice(colors)
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(-8, -2)
-            shape = random.choice(['square', 'circle'])
-            size = random.randint(2, 4)
-            lifetime = random.uniform(40, 60)
+        rng = self._rng()
+        color = np.asarray(colors)[rng.integers(0, len(colors), count)]
+        vx = rng.uniform(-3, 3, count)
+        vy = rng.uniform(-8, -2, count)
+        shape = np.array(['square', 'circle'])[rng.integers(0, 2, count)]
+        size = rng.integers(2, 5, count)
+        lifetime = rng.uniform(40, 60, count)
 
-            particle = Particle(x, y, vx, vy, lifetime, color, size, shape)
-            particle.gravity = 0.3  # Lighter gravity for confetti
-            self.particles.append(particle)
+        # Lighter gravity for confetti
+        self._add(x, y, vx, vy, lifetime, color, size, shape, gravity=0.3)
 
     def emit_sparkles(self, x: int, y: int, count: int = 15):
         """
@@ -176,38 +384,82 @@ class ParticleSystem:
             x, y: Emission position
             count: Number of sparkles
         """
-        colors = [(255, 255, 200), (255, 255, 255), (255, 255, 150)]
+        colors = np.array([(255, 255, 200), (255, 255, 255), (255, 255, 150)])
 
-        for _ in range(count):
-            color = random.choice(colors)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lifetime = random.uniform(15, 30)
+        rng = self._rng()
+        color = colors[rng.integers(0, len(colors), count)]
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(1, 3, count)
+        lifetime = rng.uniform(15, 30, count)
 
-            particle = Particle(x, y, vx, vy, lifetime, color, 2, 'star')
-            particle.gravity = 0
-            particle.drag = 0.95
-            self.particles.append(particle)
+        self._add(x, y, np.cos(angle) * speed, np.sin(angle) * speed, lifetime, color, 2, 'star',
+                  gravity=0, drag=0.95)
 
     def update(self):
         """Update all particles."""
-        # Update alive particles
-        for particle in self.particles:
-            particle.update()
+        # Apply physics
+        self.vy += self.gravity
+        self.vx *= self.drag
+        self.vy *= self.drag
+
+        # Update position
+        self.x += self.vx
+        self.y += self.vy
+
+        # Decrease lifetime
+        self.lifetime -= 1
 
         # Remove dead particles
-        self.particles = [p for p in self.particles if p.is_alive()]
+        alive = self.lifetime > 0
+        if not alive.all():
+            self._keep(alive)
+
+    def _keep(self, mask: np.ndarray):
+        """Drop every particle whose entry in mask is False."""
+        for name in _PARTICLE_FIELDS:
+            setattr(self, name, getattr(self, name)[mask])
+
+    @staticmethod
+    def _fields_of(particle: Particle) -> dict:
+        """Array values of every field of a Particle."""
+        fields = {name: getattr(particle, name) for name in _PARTICLE_FIELDS}
+        fields['shape'] = PARTICLE_SHAPES.index(fields['shape'])
+        return fields
 
     def render(self, frame: Image.Image):
         """Render all particles to frame."""
-        for particle in self.particles:
-            particle.render(frame)
+        alive = self.lifetime > 0
+        if not alive.any():
+            return
+        if frame.mode not in ('RGB', 'RGBA'):
+            for particle in self.particles:
+                particle.render(frame)
+            return
+
+        alpha = np.clip(self.lifetime[alive] / self.max_lifetime[alive], 0, 1)
+
+        # Faded color and size, truncated like Particle.render
+        color = (self.color[alive] * alpha[:, None]).astype(np.uint8)
+        size = np.maximum(1, (self.size[alive] * alpha).astype(np.int64))
+        shape = self.shape[alive]
+
+        draw_particles(frame, self.x[alive], self.y[alive], color, size, shape)
+
+    @property
+    def particles(self) -> MutableSequence[Particle]:
+        """
+        The live particles as a mutable list of Particle objects.
+
+        Appending, inserting, replacing or deleting particles and setting
+        their fields all update the system's arrays. Entries refer to a
+        position in the arrays, so fetch them again after update() or after
+        removing particles.
+        """
+        return _ParticleList(self)
 
     def get_particle_count(self) -> int:
         """Get number of active particles."""
-        return len(self.particles)
+        return len(self.x)
 
 
 def add_motion_blur(frame: Image.Image, prev_frame: Optional[Image.Image],
@@ -6,14 +6,67 @@ Use this to make objects bounce up and down or horizontally with realistic physi
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_circle, draw_emoji
 from core.easing import ease_out_bounce, interpolate
+from core.frame_renderer import render_frames
+
+
+def _render_bounce_frame(
+    index: int,
+    num_frames: int,
+    object_type: str = 'circle',
+    object_data: dict = None,
+    bounce_height: int = 150,
+    ground_y: int = 350,
+    start_x: int = 240,
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw the object at the height ease_out_bounce gives frame index, dropping onto ground_y.
+    """
+    # Default object data
+    if object_data is None:
+        if object_type == 'circle':
+            object_data = {'radius': 30, 'color': (255, 100, 100)}
+        elif object_type == 'emoji':
+            object_data = {'emoji': '⚽', 'size': 60}
+
+    # Create blank frame
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    # Calculate progress (0.0 to 1.0)
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+
+    # Calculate Y position using bounce easing
+    y = ground_y - int(ease_out_bounce(t) * bounce_height)
+
+    # Draw object
+    if object_type == 'circle':
+        draw_circle(
+            frame,
+            center=(start_x, y),
+            radius=object_data['radius'],
+            fill_color=object_data['color']
+        )
+    elif object_type == 'emoji':
+        draw_emoji(
+            frame,
+            emoji=object_data['emoji'],
+            position=(start_x - object_data['size'] // 2, y - object_data['size'] // 2),
+            size=object_data['size']
+        )
+
+    return frame
 
 
 def create_bounce_animation(
@@ -25,7 +78,8 @@ def create_bounce_animation(
     start_x: int = 240,
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list:
     """
     Create frames for a bouncing animation.
@@ -40,48 +94,23 @@ def create_bounce_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    # Default object data
-    if object_data is None:
-        if object_type == 'circle':
-            object_data = {'radius': 30, 'color': (255, 100, 100)}
-        elif object_type == 'emoji':
-            object_data = {'emoji': '⚽', 'size': 60}
-
-    for i in range(num_frames):
-        # Create blank frame
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Calculate progress (0.0 to 1.0)
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate Y position using bounce easing
-        y = ground_y - int(ease_out_bounce(t) * bounce_height)
-
-        # Draw object
-        if object_type == 'circle':
-            draw_circle(
-                frame,
-                center=(start_x, y),
-                radius=object_data['radius'],
-                fill_color=object_data['color']
-            )
-        elif object_type == 'emoji':
-            draw_emoji(
-                frame,
-                emoji=object_data['emoji'],
-                position=(start_x - object_data['size'] // 2, y - object_data['size'] // 2),
-                size=object_data['size']
-            )
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_bounce_frame,
+        object_type=object_type,
+        object_data=object_data,
+        bounce_height=bounce_height,
+        ground_y=ground_y,
+        start_x=start_x,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 # Example usage
@@ -16,7 +16,7 @@ from PIL import Image, ImageDraw
 import numpy as np
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
-from core.visual_effects import ParticleSystem
+from core.visual_effects import ParticleSystem, draw_particles
 from core.easing import interpolate
 
 
@@ -81,6 +81,12 @@ def create_explode_animation(
             'rotation_speed': rotation_speed
         })
 
+    # Same pieces as arrays, for drawing them all at once
+    piece_vx = np.array([piece['vx'] for piece in pieces])
+    piece_vy = np.array([piece['vy'] for piece in pieces])
+    piece_size = np.array([piece['size'] for piece in pieces])
+    piece_color = np.array([piece['color'] for piece in pieces]).reshape(-1, 3)
+
     for i in range(num_frames):
         t = i / (num_frames - 1) if num_frames > 1 else 0
         frame = create_blank_frame(frame_width, frame_height, bg_color)
@@ -103,21 +109,15 @@ def create_explode_animation(
             else:
                 # Exploded - draw pieces
                 explosion_t = (t - 0.2) / 0.8
-                for piece in pieces:
-                    # Update position
-                    x = center_pos[0] + piece['vx'] * explosion_t * 50
-                    y = center_pos[1] + piece['vy'] * explosion_t * 50 + 0.5 * 300 * explosion_t ** 2  # Gravity
+                # Update positions
+                x = center_pos[0] + piece_vx * explosion_t * 50
+                y = center_pos[1] + piece_vy * explosion_t * 50 + 0.5 * 300 * explosion_t ** 2  # Gravity
 
-                    # Fade out
-                    alpha = 1.0 - explosion_t
-                    if alpha > 0:
-                        color = tuple(int(c * alpha) for c in piece['color'])
-                        size = int(piece['size'] * (1 - explosion_t * 0.5))
-
-                        draw.ellipse(
-                            [x - size, y - size, x + size, y + size],
-                            fill=color
-                        )
+                # Fade out
+                alpha = 1.0 - explosion_t
+                if alpha > 0:
+                    sizes = (piece_size * (1 - explosion_t * 0.5)).astype(int)
+                    draw_particles(frame, x, y, piece_color * alpha, sizes)
 
         elif explode_type == 'shatter':
             # Break into geometric pieces
@@ -187,36 +187,25 @@ def create_explode_animation(
                     draw = ImageDraw.Draw(frame)
 
             # Draw outward-moving particles
-            for piece in pieces:
-                x = center_pos[0] + piece['vx'] * t * 40
-                y = center_pos[1] + piece['vy'] * t * 40
+            x = center_pos[0] + piece_vx * t * 40
+            y = center_pos[1] + piece_vy * t * 40
 
-                alpha = 1.0 - t
-                if alpha > 0:
-                    color = tuple(int(c * alpha) for c in piece['color'])
-                    size = int(piece['size'] * (1 - t * 0.5))
-                    draw.ellipse(
-                        [x - size, y - size, x + size, y + size],
-                        fill=color
-                    )
+            alpha = 1.0 - t
+            if alpha > 0:
+                sizes = (piece_size * (1 - t * 0.5)).astype(int)
+                draw_particles(frame, x, y, piece_color * alpha, sizes)
 
         elif explode_type == 'implode':
             # Reverse explosion - pieces fly inward
             if t < 0.7:
                 # Pieces converging
                 implode_t = 1.0 - (t / 0.7)
-                for piece in pieces:
-                    x = center_pos[0] + piece['vx'] * implode_t * 50
-                    y = center_pos[1] + piece['vy'] * implode_t * 50
+                x = center_pos[0] + piece_vx * implode_t * 50
+                y = center_pos[1] + piece_vy * implode_t * 50
 
-                    alpha = 1.0 - (1.0 - implode_t) * 0.5
-                    color = tuple(int(c * alpha) for c in piece['color'])
-                    size = int(piece['size'] * alpha)
-
-                    draw.ellipse(
-                        [x - size, y - size, x + size, y + size],
-                        fill=color
-                    )
+                alpha = 1.0 - (1.0 - implode_t) * 0.5
+                sizes = (piece_size * alpha).astype(int)
+                draw_particles(frame, x, y, piece_color * alpha, sizes)
             else:
                 # Object reforms
                 reform_t = (t - 0.7) / 0.3
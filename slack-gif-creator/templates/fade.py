@@ -6,6 +6,7 @@ Creates smooth opacity transitions for appearing, disappearing, and transitionin
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -15,6 +16,118 @@ import numpy as np
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
 from core.easing import interpolate
+from core.frame_renderer import render_frames
+
+
+def _render_fade_frame(
+    index: int,
+    num_frames: int,
+    object_type: str = 'emoji',
+    object_data: dict | None = None,
+    fade_type: str = 'in',
+    easing: str = 'ease_in_out',
+    center_pos: tuple[int, int] = (240, 240),
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw the object at the opacity fade_type gives frame index.
+    """
+    # Default object data
+    if object_data is None:
+        if object_type == 'emoji':
+            object_data = {'emoji': '✨', 'size': 100}
+
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+
+    # Calculate opacity based on fade type
+    if fade_type == 'in':
+        opacity = interpolate(0, 1, t, easing)
+    elif fade_type == 'out':
+        opacity = interpolate(1, 0, t, easing)
+    elif fade_type == 'in_out':
+        if t < 0.5:
+            opacity = interpolate(0, 1, t * 2, easing)
+        else:
+            opacity = interpolate(1, 0, (t - 0.5) * 2, easing)
+    elif fade_type == 'blink':
+        # Quick fade out and back in
+        if t < 0.2:
+            opacity = interpolate(1, 0, t / 0.2, 'ease_in')
+        elif t < 0.4:
+            opacity = interpolate(0, 1, (t - 0.2) / 0.2, 'ease_out')
+        else:
+            opacity = 1.0
+    else:
+        opacity = interpolate(0, 1, t, easing)
+
+    # Create background
+    frame_bg = create_blank_frame(frame_width, frame_height, bg_color)
+
+    # Create object layer with transparency
+    if object_type == 'emoji':
+        # Create RGBA canvas for emoji
+        emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
+        emoji_size = object_data['size']
+        draw_emoji_enhanced(
+            emoji_canvas,
+            emoji=object_data['emoji'],
+            position=(center_pos[0] - emoji_size // 2, center_pos[1] - emoji_size // 2),
+            size=emoji_size,
+            shadow=object_data.get('shadow', False)
+        )
+
+        # Apply opacity
+        emoji_canvas = apply_opacity(emoji_canvas, opacity)
+
+        # Composite onto background
+        frame_bg_rgba = frame_bg.convert('RGBA')
+        frame = Image.alpha_composite(frame_bg_rgba, emoji_canvas)
+        frame = frame.convert('RGB')
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+
+        # Create text on separate layer
+        text_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
+        text_canvas_rgb = text_canvas.convert('RGB')
+        text_canvas_rgb.paste(bg_color, (0, 0, frame_width, frame_height))
+
+        draw_text_with_outline(
+            text_canvas_rgb,
+            text=object_data.get('text', 'FADE'),
+            position=center_pos,
+            font_size=object_data.get('font_size', 60),
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=3,
+            centered=True
+        )
+
+        # Convert to RGBA and make background transparent
+        text_canvas = text_canvas_rgb.convert('RGBA')
+        data = text_canvas.getdata()
+        new_data = []
+        for item in data:
+            if item[:3] == bg_color:
+                new_data.append((255, 255, 255, 0))
+            else:
+                new_data.append(item)
+        text_canvas.putdata(new_data)
+
+        # Apply opacity
+        text_canvas = apply_opacity(text_canvas, opacity)
+
+        # Composite
+        frame_bg_rgba = frame_bg.convert('RGBA')
+        frame = Image.alpha_composite(frame_bg_rgba, text_canvas)
+        frame = frame.convert('RGB')
+
+    else:
+        frame = frame_bg
+
+    return frame
 
 
 def create_fade_animation(
@@ -26,7 +139,8 @@ def create_fade_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list[Image.Image]:
     """
     Create fade animation.
@@ -41,109 +155,23 @@ def create_fade_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    # Default object data
-    if object_data is None:
-        if object_type == 'emoji':
-            object_data = {'emoji': '✨', 'size': 100}
-
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate opacity based on fade type
-        if fade_type == 'in':
-            opacity = interpolate(0, 1, t, easing)
-        elif fade_type == 'out':
-            opacity = interpolate(1, 0, t, easing)
-        elif fade_type == 'in_out':
-            if t < 0.5:
-                opacity = interpolate(0, 1, t * 2, easing)
-            else:
-                opacity = interpolate(1, 0, (t - 0.5) * 2, easing)
-        elif fade_type == 'blink':
-            # Quick fade out and back in
-            if t < 0.2:
-                opacity = interpolate(1, 0, t / 0.2, 'ease_in')
-            elif t < 0.4:
-                opacity = interpolate(0, 1, (t - 0.2) / 0.2, 'ease_out')
-            else:
-                opacity = 1.0
-        else:
-            opacity = interpolate(0, 1, t, easing)
-
-        # Create background
-        frame_bg = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Create object layer with transparency
-        if object_type == 'emoji':
-            # Create RGBA canvas for emoji
-            emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            emoji_size = object_data['size']
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=object_data['emoji'],
-                position=(center_pos[0] - emoji_size // 2, center_pos[1] - emoji_size // 2),
-                size=emoji_size,
-                shadow=object_data.get('shadow', False)
-            )
-
-            # Apply opacity
-            emoji_canvas = apply_opacity(emoji_canvas, opacity)
-
-            # Composite onto background
-            frame_bg_rgba = frame_bg.convert('RGBA')
-            frame = Image.alpha_composite(frame_bg_rgba, emoji_canvas)
-            frame = frame.convert('RGB')
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-
-            # Create text on separate layer
-            text_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            text_canvas_rgb = text_canvas.convert('RGB')
-            text_canvas_rgb.paste(bg_color, (0, 0, frame_width, frame_height))
-
-            draw_text_with_outline(
-                text_canvas_rgb,
-                text=object_data.get('text', 'FADE'),
-                position=center_pos,
-                font_size=object_data.get('font_size', 60),
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
-
-            # Convert to RGBA and make background transparent
-            text_canvas = text_canvas_rgb.convert('RGBA')
-            data = text_canvas.getdata()
-            new_data = []
-            for item in data:
-                if item[:3] == bg_color:
-                    new_data.append((255, 255, 255, 0))
-                else:
-                    new_data.append(item)
-            text_canvas.putdata(new_data)
-
-            # Apply opacity
-            text_canvas = apply_opacity(text_canvas, opacity)
-
-            # Composite
-            frame_bg_rgba = frame_bg.convert('RGBA')
-            frame = Image.alpha_composite(frame_bg_rgba, text_canvas)
-            frame = frame.convert('RGB')
-
-        else:
-            frame = frame_bg
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_fade_frame,
+        object_type=object_type,
+        object_data=object_data,
+        fade_type=fade_type,
+        easing=easing,
+        center_pos=center_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def apply_opacity(image: Image.Image, opacity: float) -> Image.Image:
@@ -6,6 +6,7 @@ Creates horizontal and vertical flips with perspective.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 import math
 
@@ -13,8 +14,156 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image
 from core.gif_builder import GIFBuilder
-from core.frame_composer import create_blank_frame, draw_emoji_enhanced
+from core.frame_composer import create_blank_frame, get_emoji_sprite
 from core.easing import interpolate
+from core.frame_renderer import render_frames
+
+
+def _render_flip_frame(
+    index: int,
+    num_frames: int,
+    object1_data: dict,
+    object2_data: dict | None = None,
+    flip_axis: str = 'horizontal',
+    easing: str = 'ease_in_out',
+    object_type: str = 'emoji',
+    center_pos: tuple[int, int] = (240, 240),
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw frame index of the flip: object1 narrowing to edge-on, then object2 opening back out.
+    """
+    if object2_data is None:
+        object2_data = object1_data
+
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    # Calculate rotation angle (0 to 180 degrees)
+    angle = interpolate(0, 180, t, easing)
+
+    # Determine which side is visible and calculate scale
+    if angle < 90:
+        # Front side visible
+        current_object = object1_data
+        scale_factor = math.cos(math.radians(angle))
+    else:
+        # Back side visible
+        current_object = object2_data
+        scale_factor = abs(math.cos(math.radians(angle)))
+
+    # Don't draw when edge-on (very thin)
+    if scale_factor < 0.05:
+        return frame
+
+    if object_type == 'emoji':
+        size = current_object['size']
+
+        # Cached emoji sprite, centered on the emoji with room to transform it
+        emoji_canvas = get_emoji_sprite(current_object['emoji'], size)
+        canvas_size = emoji_canvas.width
+
+        # Apply flip scaling
+        if flip_axis == 'horizontal':
+            # Scale horizontally for horizontal flip
+            new_width = max(1, int(canvas_size * scale_factor))
+            new_height = canvas_size
+        else:
+            # Scale vertically for vertical flip
+            new_width = canvas_size
+            new_height = max(1, int(canvas_size * scale_factor))
+
+        # Resize to simulate 3D rotation
+        emoji_scaled = emoji_canvas.resize((new_width, new_height), Image.LANCZOS)
+
+        # Position centered
+        paste_x = center_pos[0] - new_width // 2
+        paste_y = center_pos[1] - new_height // 2
+
+        # Composite onto frame
+        frame_rgba = frame.convert('RGBA')
+        frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
+        frame = frame_rgba.convert('RGB')
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+
+        # Create text on canvas
+        text = current_object.get('text', 'FLIP')
+        font_size = current_object.get('font_size', 50)
+
+        canvas_size = max(frame_width, frame_height)
+        text_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+
+        # Draw on RGB for text rendering
+        text_canvas_rgb = text_canvas.convert('RGB')
+        text_canvas_rgb.paste(bg_color, (0, 0, canvas_size, canvas_size))
+
+        draw_text_with_outline(
+            text_canvas_rgb,
+            text=text,
+            position=(canvas_size // 2, canvas_size // 2),
+            font_size=font_size,
+            text_color=current_object.get('text_color', (0, 0, 0)),
+            outline_color=current_object.get('outline_color', (255, 255, 255)),
+            outline_width=3,
+            centered=True
+        )
+
+        # Make background transparent
+        text_canvas = text_canvas_rgb.convert('RGBA')
+        data = text_canvas.getdata()
+        new_data = []
+        for item in data:
+            if item[:3] == bg_color:
+                new_data.append((255, 255, 255, 0))
+            else:
+                new_data.append(item)
+        text_canvas.putdata(new_data)
+
+        # Apply flip scaling
+        if flip_axis == 'horizontal':
+            new_width = max(1, int(canvas_size * scale_factor))
+            new_height = canvas_size
+        else:
+            new_width = canvas_size
+            new_height = max(1, int(canvas_size * scale_factor))
+
+        text_scaled = text_canvas.resize((new_width, new_height), Image.LANCZOS)
+
+        # Center and crop
+        if flip_axis == 'horizontal':
+            left = (new_width - frame_width) // 2 if new_width > frame_width else 0
+            top = (canvas_size - frame_height) // 2
+            paste_x = center_pos[0] - min(new_width, frame_width) // 2
+            paste_y = 0
+
+            text_cropped = text_scaled.crop((
+                left,
+                top,
+                left + min(new_width, frame_width),
+                top + frame_height
+            ))
+        else:
+            left = (canvas_size - frame_width) // 2
+            top = (new_height - frame_height) // 2 if new_height > frame_height else 0
+            paste_x = 0
+            paste_y = center_pos[1] - min(new_height, frame_height) // 2
+
+            text_cropped = text_scaled.crop((
+                left,
+                top,
+                left + frame_width,
+                top + min(new_height, frame_height)
+            ))
+
+        frame_rgba = frame.convert('RGBA')
+        frame_rgba.paste(text_cropped, (paste_x, paste_y), text_cropped)
+        frame = frame_rgba.convert('RGB')
+
+    return frame
 
 
 def create_flip_animation(
@@ -27,7 +176,8 @@ def create_flip_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list[Image.Image]:
     """
     Create 3D-style flip animation.
@@ -43,153 +193,24 @@ def create_flip_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    if object2_data is None:
-        object2_data = object1_data
-
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Calculate rotation angle (0 to 180 degrees)
-        angle = interpolate(0, 180, t, easing)
-
-        # Determine which side is visible and calculate scale
-        if angle < 90:
-            # Front side visible
-            current_object = object1_data
-            scale_factor = math.cos(math.radians(angle))
-        else:
-            # Back side visible
-            current_object = object2_data
-            scale_factor = abs(math.cos(math.radians(angle)))
-
-        # Don't draw when edge-on (very thin)
-        if scale_factor < 0.05:
-            frames.append(frame)
-            continue
-
-        if object_type == 'emoji':
-            size = current_object['size']
-
-            # Create emoji on canvas
-            canvas_size = size * 2
-            emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=current_object['emoji'],
-                position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
-                size=size,
-                shadow=False
-            )
-
-            # Apply flip scaling
-            if flip_axis == 'horizontal':
-                # Scale horizontally for horizontal flip
-                new_width = max(1, int(canvas_size * scale_factor))
-                new_height = canvas_size
-            else:
-                # Scale vertically for vertical flip
-                new_width = canvas_size
-                new_height = max(1, int(canvas_size * scale_factor))
-
-            # Resize to simulate 3D rotation
-            emoji_scaled = emoji_canvas.resize((new_width, new_height), Image.LANCZOS)
-
-            # Position centered
-            paste_x = center_pos[0] - new_width // 2
-            paste_y = center_pos[1] - new_height // 2
-
-            # Composite onto frame
-            frame_rgba = frame.convert('RGBA')
-            frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
-            frame = frame_rgba.convert('RGB')
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-
-            # Create text on canvas
-            text = current_object.get('text', 'FLIP')
-            font_size = current_object.get('font_size', 50)
-
-            canvas_size = max(frame_width, frame_height)
-            text_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            # Draw on RGB for text rendering
-            text_canvas_rgb = text_canvas.convert('RGB')
-            text_canvas_rgb.paste(bg_color, (0, 0, canvas_size, canvas_size))
-
-            draw_text_with_outline(
-                text_canvas_rgb,
-                text=text,
-                position=(canvas_size // 2, canvas_size // 2),
-                font_size=font_size,
-                text_color=current_object.get('text_color', (0, 0, 0)),
-                outline_color=current_object.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
-
-            # Make background transparent
-            text_canvas = text_canvas_rgb.convert('RGBA')
-            data = text_canvas.getdata()
-            new_data = []
-            for item in data:
-                if item[:3] == bg_color:
-                    new_data.append((255, 255, 255, 0))
-                else:
-                    new_data.append(item)
-            text_canvas.putdata(new_data)
-
-            # Apply flip scaling
-            if flip_axis == 'horizontal':
-                new_width = max(1, int(canvas_size * scale_factor))
-                new_height = canvas_size
-            else:
-                new_width = canvas_size
-                new_height = max(1, int(canvas_size * scale_factor))
-
-            text_scaled = text_canvas.resize((new_width, new_height), Image.LANCZOS)
-
-            # Center and crop
-            if flip_axis == 'horizontal':
-                left = (new_width - frame_width) // 2 if new_width > frame_width else 0
-                top = (canvas_size - frame_height) // 2
-                paste_x = center_pos[0] - min(new_width, frame_width) // 2
-                paste_y = 0
-
-                text_cropped = text_scaled.crop((
-                    left,
-                    top,
-                    left + min(new_width, frame_width),
-                    top + frame_height
-                ))
-            else:
-                left = (canvas_size - frame_width) // 2
-                top = (new_height - frame_height) // 2 if new_height > frame_height else 0
-                paste_x = 0
-                paste_y = center_pos[1] - min(new_height, frame_height) // 2
-
-                text_cropped = text_scaled.crop((
-                    left,
-                    top,
-                    left + frame_width,
-                    top + min(new_height, frame_height)
-                ))
-
-            frame_rgba = frame.convert('RGBA')
-            frame_rgba.paste(text_cropped, (paste_x, paste_y), text_cropped)
-            frame = frame_rgba.convert('RGB')
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_flip_frame,
+        object1_data=object1_data,
+        object2_data=object2_data,
+        flip_axis=flip_axis,
+        easing=easing,
+        object_type=object_type,
+        center_pos=center_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def create_quick_flip(
@@ -6,6 +6,7 @@ Apply kaleidoscope effects to frames or objects for psychedelic visuals.
 """
 
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 import math
 
@@ -13,6 +14,48 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image, ImageOps, ImageDraw
 import numpy as np
+from core.frame_renderer import render_frames
+
+
+@lru_cache(maxsize=16)
+def _kaleidoscope_source_indices(width: int, height: int, segments: int,
+                                 center: tuple[int, int]) -> np.ndarray:
+    """
+    Compute (and cache) where each output pixel of a kaleidoscope is copied from.
+
+    Returns:
+        (height, width) array of flat source pixel indices into the input frame
+    """
+    # Calculate angle per segment
+    angle_per_segment = 360 / segments
+
+    center_x, center_y = center
+    dy, dx = np.ogrid[-center_y:height - center_y, -center_x:width - center_x]
+
+    # Calculate angle and distance from center
+    angle = (np.degrees(np.arctan2(dy, dx)) + 180) % 360
+    distance = np.sqrt(dx * dx + dy * dy)
+
+    # Which segment does this pixel belong to?
+    segment = (angle / angle_per_segment).astype(np.int64)
+
+    # Mirror angle within segment, mirroring every other segment
+    segment_angle = angle % angle_per_segment
+    segment_angle = np.where(segment % 2 == 1, angle_per_segment - segment_angle, segment_angle)
+
+    # Calculate source position
+    source_angle = segment_angle + (segment // 2) * angle_per_segment * 2
+    source_angle_rad = np.radians(source_angle - 180)
+
+    source_x = (center_x + distance * np.cos(source_angle_rad)).astype(np.int64)
+    source_y = (center_y + distance * np.sin(source_angle_rad)).astype(np.int64)
+
+    # Out-of-bounds sources keep the pixel's own value
+    own_y, own_x = np.indices((height, width))
+    in_bounds = (source_x >= 0) & (source_x < width) & (source_y >= 0) & (source_y < height)
+    indices = np.where(in_bounds, source_y * width + source_x, own_y * width + own_x)
+    indices.flags.writeable = False
+    return indices
 
 
 def apply_kaleidoscope(frame: Image.Image, segments: int = 8,
@@ -20,6 +63,9 @@ def apply_kaleidoscope(frame: Image.Image, segments: int = 8,
     """
     Apply kaleidoscope effect by mirroring/rotating frame sections.
 
+    The pixel remap for each (size, segments, center) is computed once and
+    cached, so applying the effect to a frame is a single gather.
+
     Args:
         frame: Input frame
         segments: Number of mirror segments (4, 6, 8, 12 work well)
@@ -33,54 +79,11 @@ def apply_kaleidoscope(frame: Image.Image, segments: int = 8,
     if center is None:
         center = (width // 2, height // 2)
 
-    # Create output frame
-    output = Image.new('RGB', (width, height))
+    indices = _kaleidoscope_source_indices(width, height, segments, tuple(center))
 
-    # Calculate angle per segment
-    angle_per_segment = 360 / segments
-
-    # For simplicity, we'll create a radial mirror effect
-    # A full implementation would rotate and mirror properly
-    # This is a simplified version that creates interesting patterns
-
-    # Convert to numpy for easier manipulation
     frame_array = np.array(frame)
-    output_array = np.zeros_like(frame_array)
-
-    center_x, center_y = center
-
-    # Create wedge mask and mirror it
-    for y in range(height):
-        for x in range(width):
-            # Calculate angle from center
-            dx = x - center_x
-            dy = y - center_y
-
-            angle = (math.degrees(math.atan2(dy, dx)) + 180) % 360
-            distance = math.sqrt(dx * dx + dy * dy)
-
-            # Which segment does this pixel belong to?
-            segment = int(angle / angle_per_segment)
-
-            # Mirror angle within segment
-            segment_angle = angle % angle_per_segment
-            if segment % 2 == 1:  # Mirror every other segment
-                segment_angle = angle_per_segment - segment_angle
-
-            # Calculate source position
-            source_angle = segment_angle + (segment // 2) * angle_per_segment * 2
-            source_angle_rad = math.radians(source_angle - 180)
-
-            source_x = int(center_x + distance * math.cos(source_angle_rad))
-            source_y = int(center_y + distance * math.sin(source_angle_rad))
-
-            # Bounds check
-            if 0 <= source_x < width and 0 <= source_y < height:
-                output_array[y, x] = frame_array[source_y, source_x]
-            else:
-                output_array[y, x] = frame_array[y, x]
-
-    return Image.fromarray(output_array)
+    flat = frame_array.reshape(height * width, *frame_array.shape[2:])
+    return Image.fromarray(flat[indices])
 
 
 def apply_simple_mirror(frame: Image.Image, mode: str = 'quad') -> Image.Image:
@@ -137,13 +140,33 @@ def apply_simple_mirror(frame: Image.Image, mode: str = 'quad') -> Image.Image:
         return frame
 
 
+def _render_kaleidoscope_frame(
+    index: int,
+    num_frames: int,
+    base_frame: Image.Image,
+    segments: int = 8,
+    rotation_speed: float = 1.0
+) -> Image.Image:
+    """
+    Rotate base_frame by rotation_speed turns over the animation and mirror it into segments.
+    """
+    angle = (index / num_frames) * 360 * rotation_speed
+
+    # Rotate base frame
+    rotated = base_frame.rotate(angle, resample=Image.BICUBIC)
+
+    # Apply kaleidoscope
+    return apply_kaleidoscope(rotated, segments=segments)
+
+
 def create_kaleidoscope_animation(
     base_frame: Image.Image | None = None,
     num_frames: int = 30,
     segments: int = 8,
     rotation_speed: float = 1.0,
     width: int = 480,
-    height: int = 480
+    height: int = 480,
+    workers: int | None = 1
 ) -> list[Image.Image]:
     """
     Create animated kaleidoscope effect.
@@ -155,12 +178,11 @@ def create_kaleidoscope_animation(
         rotation_speed: How fast pattern rotates (0.5-2.0)
         width: Frame width if generating demo
         height: Frame height if generating demo
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames with kaleidoscope effect
     """
-    frames = []
-
     # Create demo pattern if no base frame
     if base_frame is None:
         base_frame = Image.new('RGB', (width, height), (255, 255, 255))
@@ -178,18 +200,13 @@ def create_kaleidoscope_animation(
             draw.ellipse([x - 40, y - 40, x + 40, y + 40], fill=color)
 
     # Rotate base frame and apply kaleidoscope
-    for i in range(num_frames):
-        angle = (i / num_frames) * 360 * rotation_speed
-
-        # Rotate base frame
-        rotated = base_frame.rotate(angle, resample=Image.BICUBIC)
-
-        # Apply kaleidoscope
-        kaleido_frame = apply_kaleidoscope(rotated, segments=segments)
-
-        frames.append(kaleido_frame)
-
-    return frames
+    render_frame = partial(
+        _render_kaleidoscope_frame,
+        base_frame=base_frame,
+        segments=segments,
+        rotation_speed=rotation_speed
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 # Example usage
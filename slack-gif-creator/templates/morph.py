@@ -6,6 +6,7 @@ Creates smooth transitions and transformations.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -15,53 +16,95 @@ import numpy as np
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced, draw_circle
 from core.easing import interpolate
+from core.frame_renderer import render_frames
 
 
-def create_morph_animation(
+def _render_morph_frame(
+    index: int,
+    num_frames: int,
     object1_data: dict,
     object2_data: dict,
-    num_frames: int = 30,
-    morph_type: str = 'crossfade',  # 'crossfade', 'scale', 'spin_morph'
+    morph_type: str = 'crossfade',
     easing: str = 'ease_in_out',
     object_type: str = 'emoji',
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
     bg_color: tuple[int, int, int] = (255, 255, 255)
-) -> list[Image.Image]:
+) -> Image.Image:
     """
-    Create morphing animation between two objects.
-
-    Args:
-        object1_data: First object configuration
-        object2_data: Second object configuration
-        num_frames: Number of frames
-        morph_type: Type of morph effect
-        easing: Easing function
-        object_type: Type of objects
-        center_pos: Center position
-        frame_width: Frame width
-        frame_height: Frame height
-        bg_color: Background color
-
-    Returns:
-        List of frames
+    Draw object1 turning into object2 as far as morph_type has progressed by frame index.
     """
-    frames = []
-
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        if morph_type == 'crossfade':
-            # Simple crossfade between two objects
-            opacity1 = interpolate(1, 0, t, easing)
-            opacity2 = interpolate(0, 1, t, easing)
-
-            if object_type == 'emoji':
-                # Create first emoji
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    if morph_type == 'crossfade':
+        # Simple crossfade between two objects
+        opacity1 = interpolate(1, 0, t, easing)
+        opacity2 = interpolate(0, 1, t, easing)
+
+        if object_type == 'emoji':
+            # Create first emoji
+            emoji1_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
+            size1 = object1_data['size']
+            draw_emoji_enhanced(
+                emoji1_canvas,
+                emoji=object1_data['emoji'],
+                position=(center_pos[0] - size1 // 2, center_pos[1] - size1 // 2),
+                size=size1,
+                shadow=False
+            )
+
+            # Apply opacity
+            from templates.fade import apply_opacity
+            emoji1_canvas = apply_opacity(emoji1_canvas, opacity1)
+
+            # Create second emoji
+            emoji2_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
+            size2 = object2_data['size']
+            draw_emoji_enhanced(
+                emoji2_canvas,
+                emoji=object2_data['emoji'],
+                position=(center_pos[0] - size2 // 2, center_pos[1] - size2 // 2),
+                size=size2,
+                shadow=False
+            )
+
+            emoji2_canvas = apply_opacity(emoji2_canvas, opacity2)
+
+            # Composite both
+            frame_rgba = frame.convert('RGBA')
+            frame_rgba = Image.alpha_composite(frame_rgba, emoji1_canvas)
+            frame_rgba = Image.alpha_composite(frame_rgba, emoji2_canvas)
+            frame = frame_rgba.convert('RGB')
+
+        elif object_type == 'circle':
+            # Morph between two circles
+            radius1 = object1_data['radius']
+            radius2 = object2_data['radius']
+            color1 = object1_data['color']
+            color2 = object2_data['color']
+
+            # Interpolate properties
+            current_radius = int(interpolate(radius1, radius2, t, easing))
+            current_color = tuple(
+                int(interpolate(color1[i], color2[i], t, easing))
+                for i in range(3)
+            )
+
+            draw_circle(frame, center_pos, current_radius, fill_color=current_color)
+
+    elif morph_type == 'scale':
+        # First object scales down as second scales up
+        if object_type == 'emoji':
+            scale1 = interpolate(1.0, 0.0, t, easing)
+            scale2 = interpolate(0.0, 1.0, t, easing)
+
+            # Draw first emoji (shrinking)
+            if scale1 > 0.05:
+                size1 = int(object1_data['size'] * scale1)
+                size1 = max(12, size1)
                 emoji1_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                size1 = object1_data['size']
                 draw_emoji_enhanced(
                     emoji1_canvas,
                     emoji=object1_data['emoji'],
@@ -70,13 +113,15 @@ def create_morph_animation(
                     shadow=False
                 )
 
-                # Apply opacity
-                from templates.fade import apply_opacity
-                emoji1_canvas = apply_opacity(emoji1_canvas, opacity1)
+                frame_rgba = frame.convert('RGBA')
+                frame = Image.alpha_composite(frame_rgba, emoji1_canvas)
+                frame = frame.convert('RGB')
 
-                # Create second emoji
+            # Draw second emoji (growing)
+            if scale2 > 0.05:
+                size2 = int(object2_data['size'] * scale2)
+                size2 = max(12, size2)
                 emoji2_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                size2 = object2_data['size']
                 draw_emoji_enhanced(
                     emoji2_canvas,
                     emoji=object2_data['emoji'],
@@ -85,116 +130,100 @@ def create_morph_animation(
                     shadow=False
                 )
 
-                emoji2_canvas = apply_opacity(emoji2_canvas, opacity2)
-
-                # Composite both
                 frame_rgba = frame.convert('RGBA')
-                frame_rgba = Image.alpha_composite(frame_rgba, emoji1_canvas)
-                frame_rgba = Image.alpha_composite(frame_rgba, emoji2_canvas)
-                frame = frame_rgba.convert('RGB')
-
-            elif object_type == 'circle':
-                # Morph between two circles
-                radius1 = object1_data['radius']
-                radius2 = object2_data['radius']
-                color1 = object1_data['color']
-                color2 = object2_data['color']
-
-                # Interpolate properties
-                current_radius = int(interpolate(radius1, radius2, t, easing))
-                current_color = tuple(
-                    int(interpolate(color1[i], color2[i], t, easing))
-                    for i in range(3)
-                )
+                frame = Image.alpha_composite(frame_rgba, emoji2_canvas)
+                frame = frame.convert('RGB')
 
-                draw_circle(frame, center_pos, current_radius, fill_color=current_color)
-
-        elif morph_type == 'scale':
-            # First object scales down as second scales up
-            if object_type == 'emoji':
-                scale1 = interpolate(1.0, 0.0, t, easing)
-                scale2 = interpolate(0.0, 1.0, t, easing)
-
-                # Draw first emoji (shrinking)
-                if scale1 > 0.05:
-                    size1 = int(object1_data['size'] * scale1)
-                    size1 = max(12, size1)
-                    emoji1_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                    draw_emoji_enhanced(
-                        emoji1_canvas,
-                        emoji=object1_data['emoji'],
-                        position=(center_pos[0] - size1 // 2, center_pos[1] - size1 // 2),
-                        size=size1,
-                        shadow=False
-                    )
-
-                    frame_rgba = frame.convert('RGBA')
-                    frame = Image.alpha_composite(frame_rgba, emoji1_canvas)
-                    frame = frame.convert('RGB')
-
-                # Draw second emoji (growing)
-                if scale2 > 0.05:
-                    size2 = int(object2_data['size'] * scale2)
-                    size2 = max(12, size2)
-                    emoji2_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                    draw_emoji_enhanced(
-                        emoji2_canvas,
-                        emoji=object2_data['emoji'],
-                        position=(center_pos[0] - size2 // 2, center_pos[1] - size2 // 2),
-                        size=size2,
-                        shadow=False
-                    )
-
-                    frame_rgba = frame.convert('RGBA')
-                    frame = Image.alpha_composite(frame_rgba, emoji2_canvas)
-                    frame = frame.convert('RGB')
-
-        elif morph_type == 'spin_morph':
-            # Spin while morphing (flip-like)
-            import math
-
-            # Calculate rotation (0 to 180 degrees)
-            angle = interpolate(0, 180, t, easing)
-            scale_factor = abs(math.cos(math.radians(angle)))
-
-            # Determine which object to show
-            if angle < 90:
-                current_object = object1_data
-            else:
-                current_object = object2_data
-
-            # Skip when edge-on
-            if scale_factor < 0.05:
-                frames.append(frame)
-                continue
-
-            if object_type == 'emoji':
-                size = current_object['size']
-                canvas_size = size * 2
-                emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+    elif morph_type == 'spin_morph':
+        # Spin while morphing (flip-like)
+        import math
 
-                draw_emoji_enhanced(
-                    emoji_canvas,
-                    emoji=current_object['emoji'],
-                    position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
-                    size=size,
-                    shadow=False
-                )
+        # Calculate rotation (0 to 180 degrees)
+        angle = interpolate(0, 180, t, easing)
+        scale_factor = abs(math.cos(math.radians(angle)))
 
-                # Scale horizontally for spin effect
-                new_width = max(1, int(canvas_size * scale_factor))
-                emoji_scaled = emoji_canvas.resize((new_width, canvas_size), Image.LANCZOS)
+        # Determine which object to show
+        if angle < 90:
+            current_object = object1_data
+        else:
+            current_object = object2_data
 
-                paste_x = center_pos[0] - new_width // 2
-                paste_y = center_pos[1] - canvas_size // 2
+        # Skip when edge-on
+        if scale_factor < 0.05:
+            return frame
 
-                frame_rgba = frame.convert('RGBA')
-                frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
-                frame = frame_rgba.convert('RGB')
+        if object_type == 'emoji':
+            size = current_object['size']
+            canvas_size = size * 2
+            emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
 
-        frames.append(frame)
+            draw_emoji_enhanced(
+                emoji_canvas,
+                emoji=current_object['emoji'],
+                position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
+                size=size,
+                shadow=False
+            )
 
-    return frames
+            # Scale horizontally for spin effect
+            new_width = max(1, int(canvas_size * scale_factor))
+            emoji_scaled = emoji_canvas.resize((new_width, canvas_size), Image.LANCZOS)
+
+            paste_x = center_pos[0] - new_width // 2
+            paste_y = center_pos[1] - canvas_size // 2
+
+            frame_rgba = frame.convert('RGBA')
+            frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
+            frame = frame_rgba.convert('RGB')
+
+    return frame
+
+
+def create_morph_animation(
+    object1_data: dict,
+    object2_data: dict,
+    num_frames: int = 30,
+    morph_type: str = 'crossfade',  # 'crossfade', 'scale', 'spin_morph'
+    easing: str = 'ease_in_out',
+    object_type: str = 'emoji',
+    center_pos: tuple[int, int] = (240, 240),
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
+) -> list[Image.Image]:
+    """
+    Create morphing animation between two objects.
+
+    Args:
+        object1_data: First object configuration
+        object2_data: Second object configuration
+        num_frames: Number of frames
+        morph_type: Type of morph effect
+        easing: Easing function
+        object_type: Type of objects
+        center_pos: Center position
+        frame_width: Frame width
+        frame_height: Frame height
+        bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
+
+    Returns:
+        List of frames
+    """
+    render_frame = partial(
+        _render_morph_frame,
+        object1_data=object1_data,
+        object2_data=object2_data,
+        morph_type=morph_type,
+        easing=easing,
+        object_type=object_type,
+        center_pos=center_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def create_reaction_morph(
@@ -6,6 +6,7 @@ Creates pulsing, heartbeat, and throbbing effects.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 import math
 
@@ -15,6 +16,124 @@ from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced, draw_circle
 from core.easing import interpolate
+from core.frame_renderer import render_frames
+
+
+def _render_pulse_frame(
+    index: int,
+    num_frames: int,
+    object_type: str = 'emoji',
+    object_data: dict | None = None,
+    pulse_type: str = 'smooth',
+    scale_range: tuple[float, float] = (0.8, 1.2),
+    pulses: float = 2.0,
+    center_pos: tuple[int, int] = (240, 240),
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw the object at the scale within scale_range that pulse_type gives frame index.
+    """
+    # Default object data
+    if object_data is None:
+        if object_type == 'emoji':
+            object_data = {'emoji': '❤️', 'size': 100}
+        elif object_type == 'circle':
+            object_data = {'radius': 50, 'color': (255, 100, 100)}
+
+    min_scale, max_scale = scale_range
+
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+
+    # Calculate scale based on pulse type
+    if pulse_type == 'smooth':
+        # Simple sinusoidal pulse
+        scale = min_scale + (max_scale - min_scale) * (
+            0.5 + 0.5 * math.sin(t * pulses * 2 * math.pi - math.pi / 2)
+        )
+
+    elif pulse_type == 'heartbeat':
+        # Double pump like a heartbeat
+        phase = (t * pulses) % 1.0
+        if phase < 0.15:
+            # First pump
+            scale = interpolate(min_scale, max_scale, phase / 0.15, 'ease_out')
+        elif phase < 0.25:
+            # First release
+            scale = interpolate(max_scale, min_scale, (phase - 0.15) / 0.10, 'ease_in')
+        elif phase < 0.35:
+            # Second pump (smaller)
+            scale = interpolate(min_scale, (min_scale + max_scale) / 2, (phase - 0.25) / 0.10, 'ease_out')
+        elif phase < 0.45:
+            # Second release
+            scale = interpolate((min_scale + max_scale) / 2, min_scale, (phase - 0.35) / 0.10, 'ease_in')
+        else:
+            # Rest period
+            scale = min_scale
+
+    elif pulse_type == 'throb':
+        # Sharp pulse with quick return
+        phase = (t * pulses) % 1.0
+        if phase < 0.2:
+            scale = interpolate(min_scale, max_scale, phase / 0.2, 'ease_out')
+        else:
+            scale = interpolate(max_scale, min_scale, (phase - 0.2) / 0.8, 'ease_in')
+
+    elif pulse_type == 'pop':
+        # Pop out and back with overshoot
+        phase = (t * pulses) % 1.0
+        if phase < 0.3:
+            # Pop out with overshoot
+            scale = interpolate(min_scale, max_scale * 1.1, phase / 0.3, 'elastic_out')
+        else:
+            # Settle back
+            scale = interpolate(max_scale * 1.1, min_scale, (phase - 0.3) / 0.7, 'ease_out')
+
+    else:
+        scale = min_scale + (max_scale - min_scale) * (
+            0.5 + 0.5 * math.sin(t * pulses * 2 * math.pi)
+        )
+
+    # Draw object at calculated scale
+    if object_type == 'emoji':
+        base_size = object_data['size']
+        current_size = int(base_size * scale)
+        draw_emoji_enhanced(
+            frame,
+            emoji=object_data['emoji'],
+            position=(center_pos[0] - current_size // 2, center_pos[1] - current_size // 2),
+            size=current_size,
+            shadow=object_data.get('shadow', True)
+        )
+
+    elif object_type == 'circle':
+        base_radius = object_data['radius']
+        current_radius = int(base_radius * scale)
+        draw_circle(
+            frame,
+            center=center_pos,
+            radius=current_radius,
+            fill_color=object_data['color']
+        )
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+        base_size = object_data.get('font_size', 50)
+        current_size = int(base_size * scale)
+        draw_text_with_outline(
+            frame,
+            text=object_data.get('text', 'PULSE'),
+            position=center_pos,
+            font_size=current_size,
+            text_color=object_data.get('text_color', (255, 100, 100)),
+            outline_color=object_data.get('outline_color', (0, 0, 0)),
+            outline_width=3,
+            centered=True
+        )
+
+    return frame
 
 
 def create_pulse_animation(
@@ -27,7 +146,8 @@ def create_pulse_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list[Image.Image]:
     """
     Create pulsing/scaling animation.
@@ -43,114 +163,24 @@ def create_pulse_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    # Default object data
-    if object_data is None:
-        if object_type == 'emoji':
-            object_data = {'emoji': '❤️', 'size': 100}
-        elif object_type == 'circle':
-            object_data = {'radius': 50, 'color': (255, 100, 100)}
-
-    min_scale, max_scale = scale_range
-
-    for i in range(num_frames):
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate scale based on pulse type
-        if pulse_type == 'smooth':
-            # Simple sinusoidal pulse
-            scale = min_scale + (max_scale - min_scale) * (
-                0.5 + 0.5 * math.sin(t * pulses * 2 * math.pi - math.pi / 2)
-            )
-
-        elif pulse_type == 'heartbeat':
-            # Double pump like a heartbeat
-            phase = (t * pulses) % 1.0
-            if phase < 0.15:
-                # First pump
-                scale = interpolate(min_scale, max_scale, phase / 0.15, 'ease_out')
-            elif phase < 0.25:
-                # First release
-                scale = interpolate(max_scale, min_scale, (phase - 0.15) / 0.10, 'ease_in')
-            elif phase < 0.35:
-                # Second pump (smaller)
-                scale = interpolate(min_scale, (min_scale + max_scale) / 2, (phase - 0.25) / 0.10, 'ease_out')
-            elif phase < 0.45:
-                # Second release
-                scale = interpolate((min_scale + max_scale) / 2, min_scale, (phase - 0.35) / 0.10, 'ease_in')
-            else:
-                # Rest period
-                scale = min_scale
-
-        elif pulse_type == 'throb':
-            # Sharp pulse with quick return
-            phase = (t * pulses) % 1.0
-            if phase < 0.2:
-                scale = interpolate(min_scale, max_scale, phase / 0.2, 'ease_out')
-            else:
-                scale = interpolate(max_scale, min_scale, (phase - 0.2) / 0.8, 'ease_in')
-
-        elif pulse_type == 'pop':
-            # Pop out and back with overshoot
-            phase = (t * pulses) % 1.0
-            if phase < 0.3:
-                # Pop out with overshoot
-                scale = interpolate(min_scale, max_scale * 1.1, phase / 0.3, 'elastic_out')
-            else:
-                # Settle back
-                scale = interpolate(max_scale * 1.1, min_scale, (phase - 0.3) / 0.7, 'ease_out')
-
-        else:
-            scale = min_scale + (max_scale - min_scale) * (
-                0.5 + 0.5 * math.sin(t * pulses * 2 * math.pi)
-            )
-
-        # Draw object at calculated scale
-        if object_type == 'emoji':
-            base_size = object_data['size']
-            current_size = int(base_size * scale)
-            draw_emoji_enhanced(
-                frame,
-                emoji=object_data['emoji'],
-                position=(center_pos[0] - current_size // 2, center_pos[1] - current_size // 2),
-                size=current_size,
-                shadow=object_data.get('shadow', True)
-            )
-
-        elif object_type == 'circle':
-            base_radius = object_data['radius']
-            current_radius = int(base_radius * scale)
-            draw_circle(
-                frame,
-                center=center_pos,
-                radius=current_radius,
-                fill_color=object_data['color']
-            )
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-            base_size = object_data.get('font_size', 50)
-            current_size = int(base_size * scale)
-            draw_text_with_outline(
-                frame,
-                text=object_data.get('text', 'PULSE'),
-                position=center_pos,
-                font_size=current_size,
-                text_color=object_data.get('text_color', (255, 100, 100)),
-                outline_color=object_data.get('outline_color', (0, 0, 0)),
-                outline_width=3,
-                centered=True
-            )
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_pulse_frame,
+        object_type=object_type,
+        object_data=object_data,
+        pulse_type=pulse_type,
+        scale_range=scale_range,
+        pulses=pulses,
+        center_pos=center_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def create_attention_pulse(
@@ -7,13 +7,90 @@ Use this for impact effects, emphasis, or nervous/excited reactions.
 
 import sys
 import math
+from functools import partial
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_circle, draw_emoji, draw_text
 from core.easing import ease_out_quad
+from core.frame_renderer import render_frames
+
+
+def _render_shake_frame(
+    index: int,
+    num_frames: int,
+    object_type: str = 'emoji',
+    object_data: dict = None,
+    shake_intensity: int = 15,
+    center_x: int = 240,
+    center_y: int = 240,
+    direction: str = 'horizontal',
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw the object offset by a shake that decays from shake_intensity over the animation.
+    """
+    # Default object data
+    if object_data is None:
+        if object_type == 'emoji':
+            object_data = {'emoji': '😱', 'size': 80}
+        elif object_type == 'text':
+            object_data = {'text': 'SHAKE!', 'font_size': 50, 'color': (255, 0, 0)}
+
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    # Calculate progress
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+
+    # Decay shake intensity over time
+    intensity = shake_intensity * (1 - ease_out_quad(t))
+
+    # Calculate shake offset using sine wave for smooth oscillation
+    freq = 3  # Oscillation frequency
+    offset_x = 0
+    offset_y = 0
+
+    if direction in ['horizontal', 'both']:
+        offset_x = int(math.sin(t * freq * 2 * math.pi) * intensity)
+
+    if direction in ['vertical', 'both']:
+        offset_y = int(math.cos(t * freq * 2 * math.pi) * intensity)
+
+    # Apply offset
+    x = center_x + offset_x
+    y = center_y + offset_y
+
+    # Draw object
+    if object_type == 'emoji':
+        draw_emoji(
+            frame,
+            emoji=object_data['emoji'],
+            position=(x - object_data['size'] // 2, y - object_data['size'] // 2),
+            size=object_data['size']
+        )
+    elif object_type == 'text':
+        draw_text(
+            frame,
+            text=object_data['text'],
+            position=(x, y),
+            font_size=object_data['font_size'],
+            color=object_data['color'],
+            centered=True
+        )
+    elif object_type == 'circle':
+        draw_circle(
+            frame,
+            center=(x, y),
+            radius=object_data.get('radius', 30),
+            fill_color=object_data.get('color', (100, 100, 255))
+        )
+
+    return frame
 
 
 def create_shake_animation(
@@ -26,7 +103,8 @@ def create_shake_animation(
     direction: str = 'horizontal',  # 'horizontal', 'vertical', or 'both'
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list:
     """
     Create frames for a shaking animation.
@@ -42,71 +120,24 @@ def create_shake_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    # Default object data
-    if object_data is None:
-        if object_type == 'emoji':
-            object_data = {'emoji': '😱', 'size': 80}
-        elif object_type == 'text':
-            object_data = {'text': 'SHAKE!', 'font_size': 50, 'color': (255, 0, 0)}
-
-    for i in range(num_frames):
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Calculate progress
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Decay shake intensity over time
-        intensity = shake_intensity * (1 - ease_out_quad(t))
-
-        # Calculate shake offset using sine wave for smooth oscillation
-        freq = 3  # Oscillation frequency
-        offset_x = 0
-        offset_y = 0
-
-        if direction in ['horizontal', 'both']:
-            offset_x = int(math.sin(t * freq * 2 * math.pi) * intensity)
-
-        if direction in ['vertical', 'both']:
-            offset_y = int(math.cos(t * freq * 2 * math.pi) * intensity)
-
-        # Apply offset
-        x = center_x + offset_x
-        y = center_y + offset_y
-
-        # Draw object
-        if object_type == 'emoji':
-            draw_emoji(
-                frame,
-                emoji=object_data['emoji'],
-                position=(x - object_data['size'] // 2, y - object_data['size'] // 2),
-                size=object_data['size']
-            )
-        elif object_type == 'text':
-            draw_text(
-                frame,
-                text=object_data['text'],
-                position=(x, y),
-                font_size=object_data['font_size'],
-                color=object_data['color'],
-                centered=True
-            )
-        elif object_type == 'circle':
-            draw_circle(
-                frame,
-                center=(x, y),
-                radius=object_data.get('radius', 30),
-                fill_color=object_data.get('color', (100, 100, 255))
-            )
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_shake_frame,
+        object_type=object_type,
+        object_data=object_data,
+        shake_intensity=shake_intensity,
+        center_x=center_x,
+        center_y=center_y,
+        direction=direction,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 # Example usage
@@ -6,6 +6,7 @@ Creates smooth entrance and exit animations.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -14,42 +15,26 @@ from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
 from core.easing import interpolate
+from core.frame_renderer import render_frames
 
 
-def create_slide_animation(
+def _render_slide_frame(
+    index: int,
+    num_frames: int,
     object_type: str = 'emoji',
     object_data: dict | None = None,
-    num_frames: int = 30,
-    direction: str = 'left',  # 'left', 'right', 'top', 'bottom'
-    slide_type: str = 'in',  # 'in', 'out', 'across'
+    direction: str = 'left',
+    slide_type: str = 'in',
     easing: str = 'ease_out',
     overshoot: bool = False,
     final_pos: tuple[int, int] | None = None,
     frame_width: int = 480,
     frame_height: int = 480,
     bg_color: tuple[int, int, int] = (255, 255, 255)
-) -> list[Image.Image]:
+) -> Image.Image:
     """
-    Create slide animation.
-
-    Args:
-        object_type: 'emoji', 'text'
-        object_data: Object configuration
-        num_frames: Number of frames
-        direction: Direction of slide
-        slide_type: Type of slide (in/out/across)
-        easing: Easing function
-        overshoot: Add overshoot/bounce at end
-        final_pos: Final position (None = center)
-        frame_width: Frame width
-        frame_height: Frame height
-        bg_color: Background color
-
-    Returns:
-        List of frames
+    Draw the object along its slide_type path from the direction edge, eased for frame index.
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'emoji':
@@ -100,41 +85,88 @@ def create_slide_animation(
     if overshoot and slide_type == 'in':
         easing = 'back_out'
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    # Calculate current position
+    x = int(interpolate(start_pos[0], end_pos[0], t, easing))
+    y = int(interpolate(start_pos[1], end_pos[1], t, easing))
+
+    # Draw object
+    if object_type == 'emoji':
+        size = object_data['size']
+        draw_emoji_enhanced(
+            frame,
+            emoji=object_data['emoji'],
+            position=(x - size // 2, y - size // 2),
+            size=size,
+            shadow=object_data.get('shadow', True)
+        )
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+        draw_text_with_outline(
+            frame,
+            text=object_data.get('text', 'SLIDE'),
+            position=(x, y),
+            font_size=object_data.get('font_size', 50),
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=3,
+            centered=True
+        )
+
+    return frame
 
-        # Calculate current position
-        x = int(interpolate(start_pos[0], end_pos[0], t, easing))
-        y = int(interpolate(start_pos[1], end_pos[1], t, easing))
 
-        # Draw object
-        if object_type == 'emoji':
-            size = object_data['size']
-            draw_emoji_enhanced(
-                frame,
-                emoji=object_data['emoji'],
-                position=(x - size // 2, y - size // 2),
-                size=size,
-                shadow=object_data.get('shadow', True)
-            )
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-            draw_text_with_outline(
-                frame,
-                text=object_data.get('text', 'SLIDE'),
-                position=(x, y),
-                font_size=object_data.get('font_size', 50),
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
+def create_slide_animation(
+    object_type: str = 'emoji',
+    object_data: dict | None = None,
+    num_frames: int = 30,
+    direction: str = 'left',  # 'left', 'right', 'top', 'bottom'
+    slide_type: str = 'in',  # 'in', 'out', 'across'
+    easing: str = 'ease_out',
+    overshoot: bool = False,
+    final_pos: tuple[int, int] | None = None,
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
+) -> list[Image.Image]:
+    """
+    Create slide animation.
 
-        frames.append(frame)
+    Args:
+        object_type: 'emoji', 'text'
+        object_data: Object configuration
+        num_frames: Number of frames
+        direction: Direction of slide
+        slide_type: Type of slide (in/out/across)
+        easing: Easing function
+        overshoot: Add overshoot/bounce at end
+        final_pos: Final position (None = center)
+        frame_width: Frame width
+        frame_height: Frame height
+        bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
-    return frames
+    Returns:
+        List of frames
+    """
+    render_frame = partial(
+        _render_slide_frame,
+        object_type=object_type,
+        object_data=object_data,
+        direction=direction,
+        slide_type=slide_type,
+        easing=easing,
+        overshoot=overshoot,
+        final_pos=final_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def create_multi_slide(
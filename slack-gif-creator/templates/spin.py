@@ -6,15 +6,109 @@ Creates spinning, rotating, and wobbling effects.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 import math
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image
+import numpy as np
 from core.gif_builder import GIFBuilder
-from core.frame_composer import create_blank_frame, draw_emoji_enhanced, draw_circle
+from core.frame_composer import create_blank_frame, draw_circle, get_emoji_sprite, paste_centered
 from core.easing import interpolate
+from core.frame_renderer import render_frames
+
+
+def _render_spin_frame(
+    index: int,
+    num_frames: int,
+    object_type: str = 'emoji',
+    object_data: dict | None = None,
+    rotation_type: str = 'clockwise',
+    full_rotations: float = 1.0,
+    easing: str = 'linear',
+    center_pos: tuple[int, int] = (240, 240),
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw the object rotated by the angle rotation_type gives frame index.
+    """
+    # Default object data
+    if object_data is None:
+        if object_type == 'emoji':
+            object_data = {'emoji': '🔄', 'size': 100}
+
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+
+    # Calculate rotation angle
+    if rotation_type == 'clockwise':
+        angle = interpolate(0, 360 * full_rotations, t, easing)
+    elif rotation_type == 'counterclockwise':
+        angle = interpolate(0, -360 * full_rotations, t, easing)
+    elif rotation_type == 'wobble':
+        # Back and forth rotation
+        angle = math.sin(t * full_rotations * 2 * math.pi) * 45
+    elif rotation_type == 'pendulum':
+        # Smooth pendulum swing
+        angle = math.sin(t * full_rotations * 2 * math.pi) * 90
+    else:
+        angle = interpolate(0, 360 * full_rotations, t, easing)
+
+    # Create object on transparent background to rotate
+    if object_type == 'emoji':
+        # The cached sprite has room around the emoji to rotate without clipping
+        sprite = get_emoji_sprite(object_data['emoji'], object_data['size'])
+
+        # Rotate the sprite
+        rotated = sprite.rotate(angle, resample=Image.BICUBIC, expand=False)
+
+        # Paste onto frame
+        paste_centered(frame, rotated, center_pos)
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+        # Similar approach - create canvas, draw text, rotate
+        text = object_data.get('text', 'SPIN!')
+        font_size = object_data.get('font_size', 50)
+
+        canvas_size = max(frame_width, frame_height)
+        text_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+
+        # Draw text
+        text_canvas_rgb = text_canvas.convert('RGB')
+        text_canvas_rgb.paste(bg_color, (0, 0, canvas_size, canvas_size))
+        draw_text_with_outline(
+            text_canvas_rgb,
+            text,
+            position=(canvas_size // 2, canvas_size // 2),
+            font_size=font_size,
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=3,
+            centered=True
+        )
+
+        # Convert back to RGBA for rotation
+        text_canvas = text_canvas_rgb.convert('RGBA')
+
+        # Make background transparent
+        pixels = np.array(text_canvas)
+        pixels[(pixels[..., :3] == bg_color).all(axis=-1)] = (255, 255, 255, 0)
+        text_canvas = Image.fromarray(pixels)
+
+        # Rotate
+        rotated = text_canvas.rotate(angle, resample=Image.BICUBIC, expand=False)
+
+        # Composite onto frame
+        frame_rgba = frame.convert('RGBA')
+        frame_rgba = Image.alpha_composite(frame_rgba, rotated)
+        frame = frame_rgba.convert('RGB')
+
+    return frame
 
 
 def create_spin_animation(
@@ -27,7 +121,8 @@ def create_spin_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list[Image.Image]:
     """
     Create spinning/rotating animation.
@@ -43,107 +138,24 @@ def create_spin_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    # Default object data
-    if object_data is None:
-        if object_type == 'emoji':
-            object_data = {'emoji': '🔄', 'size': 100}
-
-    for i in range(num_frames):
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate rotation angle
-        if rotation_type == 'clockwise':
-            angle = interpolate(0, 360 * full_rotations, t, easing)
-        elif rotation_type == 'counterclockwise':
-            angle = interpolate(0, -360 * full_rotations, t, easing)
-        elif rotation_type == 'wobble':
-            # Back and forth rotation
-            angle = math.sin(t * full_rotations * 2 * math.pi) * 45
-        elif rotation_type == 'pendulum':
-            # Smooth pendulum swing
-            angle = math.sin(t * full_rotations * 2 * math.pi) * 90
-        else:
-            angle = interpolate(0, 360 * full_rotations, t, easing)
-
-        # Create object on transparent background to rotate
-        if object_type == 'emoji':
-            # For emoji, we need to create a larger canvas to avoid clipping during rotation
-            emoji_size = object_data['size']
-            canvas_size = int(emoji_size * 1.5)
-            emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            # Draw emoji in center of canvas
-            from core.frame_composer import draw_emoji_enhanced
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=object_data['emoji'],
-                position=(canvas_size // 2 - emoji_size // 2, canvas_size // 2 - emoji_size // 2),
-                size=emoji_size,
-                shadow=False
-            )
-
-            # Rotate the canvas
-            rotated = emoji_canvas.rotate(angle, resample=Image.BICUBIC, expand=False)
-
-            # Paste onto frame
-            paste_x = center_pos[0] - canvas_size // 2
-            paste_y = center_pos[1] - canvas_size // 2
-            frame.paste(rotated, (paste_x, paste_y), rotated)
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-            # Similar approach - create canvas, draw text, rotate
-            text = object_data.get('text', 'SPIN!')
-            font_size = object_data.get('font_size', 50)
-
-            canvas_size = max(frame_width, frame_height)
-            text_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            # Draw text
-            text_canvas_rgb = text_canvas.convert('RGB')
-            text_canvas_rgb.paste(bg_color, (0, 0, canvas_size, canvas_size))
-            draw_text_with_outline(
-                text_canvas_rgb,
-                text,
-                position=(canvas_size // 2, canvas_size // 2),
-                font_size=font_size,
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
-
-            # Convert back to RGBA for rotation
-            text_canvas = text_canvas_rgb.convert('RGBA')
-
-            # Make background transparent
-            data = text_canvas.getdata()
-            new_data = []
-            for item in data:
-                if item[:3] == bg_color:
-                    new_data.append((255, 255, 255, 0))
-                else:
-                    new_data.append(item)
-            text_canvas.putdata(new_data)
-
-            # Rotate
-            rotated = text_canvas.rotate(angle, resample=Image.BICUBIC, expand=False)
-
-            # Composite onto frame
-            frame_rgba = frame.convert('RGBA')
-            frame_rgba = Image.alpha_composite(frame_rgba, rotated)
-            frame = frame_rgba.convert('RGB')
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_spin_frame,
+        object_type=object_type,
+        object_data=object_data,
+        rotation_type=rotation_type,
+        full_rotations=full_rotations,
+        easing=easing,
+        center_pos=center_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def create_loading_spinner(
@@ -215,16 +227,8 @@ def create_loading_spinner(
         elif spinner_type == 'emoji':
             # Rotating emoji spinner
             angle = angle_offset
-            emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji='⏳',
-                position=(center[0] - size // 2, center[1] - size // 2),
-                size=size,
-                shadow=False
-            )
-            rotated = emoji_canvas.rotate(angle, center=center, resample=Image.BICUBIC)
-            frame.paste(rotated, (0, 0), rotated)
+            rotated = get_emoji_sprite('⏳', size).rotate(angle, resample=Image.BICUBIC)
+            paste_centered(frame, rotated, center)
 
         frames.append(frame)
 
@@ -6,6 +6,7 @@ Creates zoom in, zoom out, and dramatic scaling effects.
 """
 
 import sys
+from functools import partial
 from pathlib import Path
 import math
 
@@ -13,8 +14,126 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image, ImageFilter
 from core.gif_builder import GIFBuilder
-from core.frame_composer import create_blank_frame, draw_emoji_enhanced
+from core.frame_composer import create_blank_frame, get_emoji_sprite, paste_centered
 from core.easing import interpolate
+from core.frame_renderer import render_frames
+
+
+def _scaled_sprite(sprite: Image.Image, scale: float, max_side: int) -> Image.Image:
+    """
+    Scale a square emoji sprite, keeping only its centered max_side square.
+
+    Only the kept part is resampled, so huge zoom levels cost no more than
+    frame-sized ones.
+    """
+    size = max(1, round(sprite.width * scale))
+    side = min(size, max_side)
+    half = sprite.width * side / size / 2
+    center = sprite.width / 2
+    return sprite.resize((side, side), Image.LANCZOS, reducing_gap=2.0,
+                         box=(center - half, center - half, center + half, center + half))
+
+
+def _render_zoom_frame(
+    index: int,
+    num_frames: int,
+    object_type: str = 'emoji',
+    object_data: dict | None = None,
+    zoom_type: str = 'in',
+    scale_range: tuple[float, float] = (0.1, 2.0),
+    easing: str = 'ease_out',
+    add_motion_blur: bool = False,
+    center_pos: tuple[int, int] = (240, 240),
+    frame_width: int = 480,
+    frame_height: int = 480,
+    bg_color: tuple[int, int, int] = (255, 255, 255)
+) -> Image.Image:
+    """
+    Draw the object at the zoom_type scale of frame index, motion-blurred if add_motion_blur.
+    """
+    # Default object data
+    if object_data is None:
+        if object_type == 'emoji':
+            object_data = {'emoji': '🔍', 'size': 100}
+
+    base_size = object_data.get('size', 100) if object_type == 'emoji' else object_data.get('font_size', 60)
+    start_scale, end_scale = scale_range
+
+    if object_type == 'emoji':
+        # Sprite at the largest size shown ('punch' overshoots by 1.2x), but no
+        # larger than the frame; it is cached, so only the first frame rasterizes it
+        largest = int(base_size * max(start_scale, end_scale) * 1.2)
+        sprite_size = max(12, min(largest, max(frame_width, frame_height)))
+        emoji_sprite_source = get_emoji_sprite(object_data['emoji'], sprite_size)
+
+    t = index / (num_frames - 1) if num_frames > 1 else 0
+
+    # Calculate scale based on zoom type
+    if zoom_type == 'in':
+        scale = interpolate(start_scale, end_scale, t, easing)
+    elif zoom_type == 'out':
+        scale = interpolate(end_scale, start_scale, t, easing)
+    elif zoom_type == 'in_out':
+        if t < 0.5:
+            scale = interpolate(start_scale, end_scale, t * 2, easing)
+        else:
+            scale = interpolate(end_scale, start_scale, (t - 0.5) * 2, easing)
+    elif zoom_type == 'punch':
+        # Quick zoom in with overshoot then settle
+        if t < 0.3:
+            scale = interpolate(start_scale, end_scale * 1.2, t / 0.3, 'ease_out')
+        else:
+            scale = interpolate(end_scale * 1.2, end_scale, (t - 0.3) / 0.7, 'elastic_out')
+    else:
+        scale = interpolate(start_scale, end_scale, t, easing)
+
+    # Create frame
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    if object_type == 'emoji':
+        current_size = int(base_size * scale)
+
+        # Clamp size to reasonable bounds
+        current_size = max(12, min(current_size, frame_width * 2))
+
+        # Scale the cached sprite to the current size (with a margin so blur doesn't fade the frame edge)
+        emoji_sprite = _scaled_sprite(emoji_sprite_source, current_size / sprite_size, max(frame_width, frame_height) + 10)
+
+        # Optional motion blur for fast zooms
+        if add_motion_blur and abs(scale - 1.0) > 0.5:
+            blur_amount = min(5, int(abs(scale - 1.0) * 3))
+            emoji_sprite = emoji_sprite.filter(ImageFilter.GaussianBlur(blur_amount))
+
+        # Composite centered on the frame
+        paste_centered(frame, emoji_sprite, (frame_width // 2, frame_height // 2))
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+
+        current_size = int(base_size * scale)
+        current_size = max(10, min(current_size, 500))
+
+        # Create oversized canvas for large text
+        canvas_size = max(frame_width, frame_height, current_size * 10)
+        text_canvas = Image.new('RGB', (canvas_size, canvas_size), bg_color)
+
+        draw_text_with_outline(
+            text_canvas,
+            text=object_data.get('text', 'ZOOM'),
+            position=(canvas_size // 2, canvas_size // 2),
+            font_size=current_size,
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=max(2, int(current_size * 0.05)),
+            centered=True
+        )
+
+        # Crop to frame
+        left = (canvas_size - frame_width) // 2
+        top = (canvas_size - frame_height) // 2
+        frame = text_canvas.crop((left, top, left + frame_width, top + frame_height))
+
+    return frame
 
 
 def create_zoom_animation(
@@ -28,7 +147,8 @@ def create_zoom_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = 1
 ) -> list[Image.Image]:
     """
     Create zoom animation.
@@ -45,107 +165,25 @@ def create_zoom_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Processes to render frames with (None = one per CPU)
 
     Returns:
         List of frames
     """
-    frames = []
-
-    # Default object data
-    if object_data is None:
-        if object_type == 'emoji':
-            object_data = {'emoji': '🔍', 'size': 100}
-
-    base_size = object_data.get('size', 100) if object_type == 'emoji' else object_data.get('font_size', 60)
-    start_scale, end_scale = scale_range
-
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate scale based on zoom type
-        if zoom_type == 'in':
-            scale = interpolate(start_scale, end_scale, t, easing)
-        elif zoom_type == 'out':
-            scale = interpolate(end_scale, start_scale, t, easing)
-        elif zoom_type == 'in_out':
-            if t < 0.5:
-                scale = interpolate(start_scale, end_scale, t * 2, easing)
-            else:
-                scale = interpolate(end_scale, start_scale, (t - 0.5) * 2, easing)
-        elif zoom_type == 'punch':
-            # Quick zoom in with overshoot then settle
-            if t < 0.3:
-                scale = interpolate(start_scale, end_scale * 1.2, t / 0.3, 'ease_out')
-            else:
-                scale = interpolate(end_scale * 1.2, end_scale, (t - 0.3) / 0.7, 'elastic_out')
-        else:
-            scale = interpolate(start_scale, end_scale, t, easing)
-
-        # Create frame
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        if object_type == 'emoji':
-            current_size = int(base_size * scale)
-
-            # Clamp size to reasonable bounds
-            current_size = max(12, min(current_size, frame_width * 2))
-
-            # Create emoji on transparent background
-            canvas_size = max(frame_width, frame_height, current_size) * 2
-            emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=object_data['emoji'],
-                position=(canvas_size // 2 - current_size // 2, canvas_size // 2 - current_size // 2),
-                size=current_size,
-                shadow=False
-            )
-
-            # Optional motion blur for fast zooms
-            if add_motion_blur and abs(scale - 1.0) > 0.5:
-                blur_amount = min(5, int(abs(scale - 1.0) * 3))
-                emoji_canvas = emoji_canvas.filter(ImageFilter.GaussianBlur(blur_amount))
-
-            # Crop to frame size centered
-            left = (canvas_size - frame_width) // 2
-            top = (canvas_size - frame_height) // 2
-            emoji_cropped = emoji_canvas.crop((left, top, left + frame_width, top + frame_height))
-
-            # Composite
-            frame_rgba = frame.convert('RGBA')
-            frame = Image.alpha_composite(frame_rgba, emoji_cropped)
-            frame = frame.convert('RGB')
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-
-            current_size = int(base_size * scale)
-            current_size = max(10, min(current_size, 500))
-
-            # Create oversized canvas for large text
-            canvas_size = max(frame_width, frame_height, current_size * 10)
-            text_canvas = Image.new('RGB', (canvas_size, canvas_size), bg_color)
-
-            draw_text_with_outline(
-                text_canvas,
-                text=object_data.get('text', 'ZOOM'),
-                position=(canvas_size // 2, canvas_size // 2),
-                font_size=current_size,
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=max(2, int(current_size * 0.05)),
-                centered=True
-            )
-
-            # Crop to frame
-            left = (canvas_size - frame_width) // 2
-            top = (canvas_size - frame_height) // 2
-            frame = text_canvas.crop((left, top, left + frame_width, top + frame_height))
-
-        frames.append(frame)
-
-    return frames
+    render_frame = partial(
+        _render_zoom_frame,
+        object_type=object_type,
+        object_data=object_data,
+        zoom_type=zoom_type,
+        scale_range=scale_range,
+        easing=easing,
+        add_motion_blur=add_motion_blur,
+        center_pos=center_pos,
+        frame_width=frame_width,
+        frame_height=frame_height,
+        bg_color=bg_color
+    )
+    return render_frames(render_frame, num_frames, workers=workers)
 
 
 def create_explosion_zoom(
@@ -170,6 +208,10 @@ def create_explosion_zoom(
     """
     frames = []
 
+    # Rasterize once, no larger than the frame, and scale it for each frame
+    sprite_size = max(frame_width, frame_height)
+    sprite = get_emoji_sprite(emoji, sprite_size)
+
     for i in range(num_frames):
         t = i / (num_frames - 1) if num_frames > 1 else 0
 
@@ -184,34 +226,20 @@ def create_explosion_zoom(
         current_size = int(100 * scale)
         current_size = max(12, min(current_size, frame_width * 3))
 
-        # Create emoji
-        canvas_size = max(frame_width, frame_height, current_size) * 2
-        emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-        draw_emoji_enhanced(
-            emoji_canvas,
-            emoji=emoji,
-            position=(canvas_size // 2 - current_size // 2, canvas_size // 2 - current_size // 2),
-            size=current_size,
-            shadow=False
-        )
+        # Scale the cached sprite, keeping only what can be visible once rotated
+        visible = math.ceil(math.hypot(frame_width, frame_height))
+        emoji_sprite = _scaled_sprite(sprite, current_size / sprite_size, visible)
 
         # Rotate
-        emoji_canvas = emoji_canvas.rotate(angle, center=(canvas_size // 2, canvas_size // 2), resample=Image.BICUBIC)
+        emoji_sprite = emoji_sprite.rotate(angle, resample=Image.BICUBIC)
 
         # Add motion blur for later frames
         if t > 0.5:
             blur_amount = int((t - 0.5) * 10)
-            emoji_canvas = emoji_canvas.filter(ImageFilter.GaussianBlur(blur_amount))
+            emoji_sprite = emoji_sprite.filter(ImageFilter.GaussianBlur(blur_amount))
 
-        # Crop and composite
-        left = (canvas_size - frame_width) // 2
-        top = (canvas_size - frame_height) // 2
-        emoji_cropped = emoji_canvas.crop((left, top, left + frame_width, top + frame_height))
-
-        frame_rgba = frame.convert('RGBA')
-        frame = Image.alpha_composite(frame_rgba, emoji_cropped)
-        frame = frame.convert('RGB')
+        # Composite
+        paste_centered(frame, emoji_sprite, (frame_width // 2, frame_height // 2))
 
         frames.append(frame)
 
@@ -240,6 +268,9 @@ def create_mind_blown_zoom(
     """
     frames = []
 
+    # Rasterize once at the largest size (scale 1.2) and scale it for each frame
+    sprite = get_emoji_sprite(emoji, 120)
+
     for i in range(num_frames):
         t = i / (num_frames - 1) if num_frames > 1 else 0
 
@@ -261,18 +292,8 @@ def create_mind_blown_zoom(
         center_x = frame_width // 2 + shake_x
         center_y = frame_height // 2 + shake_y
 
-        emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-        draw_emoji_enhanced(
-            emoji_canvas,
-            emoji=emoji,
-            position=(center_x - current_size // 2, center_y - current_size // 2),
-            size=current_size,
-            shadow=False
-        )
-
-        frame_rgba = frame.convert('RGBA')
-        frame = Image.alpha_composite(frame_rgba, emoji_canvas)
-        frame = frame.convert('RGB')
+        emoji_sprite = _scaled_sprite(sprite, current_size / 120, sprite.width)
+        paste_centered(frame, emoji_sprite, (center_x, center_y))
 
         frames.append(frame)
 